@@ -0,0 +1,89 @@
+"""
+Contention benchmark of concurrent transfers between accounts: a dictionary of Money balances guarded by one
+global lock, compared with AccountBook with one stripe and with many stripes, with 1 to N threads.
+Run from the repository root: python -m benchmarks.bench_account_book [--max-threads 8] [--accounts 1000]
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+from simple_money_lib import AccountBook, Money
+from simple_money_lib.exceptions import InsufficientFundsError
+
+
+class GlobalLockBook:
+    """Baseline: Money balances guarded by a single lock"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._balances = {}
+
+    def open(self, account, currency, balance):
+        self._balances[account] = balance
+
+    def transfer(self, source, target, money):
+        with self._lock:
+            if self._balances[source] < money:
+                raise InsufficientFundsError(source, self._balances[source], money)
+            self._balances[source] -= money
+            self._balances[target] += money
+
+
+def throughput(book, accounts: list, threads: int, ops: int) -> float:
+    """Return transfers per second of all threads together, each running `ops` random transfers"""
+    barrier = threading.Barrier(threads + 1)
+    amount = Money("1.25 USD")
+
+    def worker(seed):
+        pairs = [random.Random(seed).sample(accounts, 2) for _ in range(ops)]
+        barrier.wait()
+        for source, target in pairs:
+            try:
+                book.transfer(source, target, amount)
+            except InsufficientFundsError:
+                pass
+
+    workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * ops / (time.perf_counter() - start)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--max-threads", type=int, default=os.cpu_count())
+    arg_parser.add_argument("--accounts", type=int, default=1000)
+    arg_parser.add_argument("--ops", type=int, default=20_000, help="transfers per thread")
+    args = arg_parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {os.cpu_count()} CPUs, "
+          f"{args.accounts} accounts")
+    books = {
+        "global lock, Money balances": GlobalLockBook,
+        "AccountBook(stripes=1)": lambda: AccountBook(stripes=1),
+        "AccountBook(stripes=64)": lambda: AccountBook(stripes=64),
+    }
+    accounts = list(range(args.accounts))
+    thread_counts = sorted({1, *(2 ** i for i in range(1, args.max_threads.bit_length())), args.max_threads})
+
+    print(f"\n{'threads':>8}" + "".join(f"{name:>30}" for name in books))
+    for threads in thread_counts:
+        results = []
+        for create in books.values():
+            book = create()
+            for account in accounts:
+                book.open(account, "USD", Money("1000 USD"))
+            results.append(throughput(book, accounts, threads, args.ops))
+        print(f"{threads:>8}" + "".join(f"{result:>24,.0f} ops/s" for result in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Cost per cell of reading money columns of a CSV file: csv.reader with Money(cell) per cell, compared with
+read_csv_money() generating Money objects and returning integer arrays (columnar=True).
+Run from the repository root: python -m benchmarks.bench_csv
+"""
+import csv
+import os
+import tempfile
+import timeit
+
+from simple_money_lib import Money
+from simple_money_lib.io import read_csv_money
+
+ROWS = 20_000
+
+
+def bench(label: str, statement, cells: int) -> None:
+    """Print the time per cell of a statement reading a number of cells"""
+    seconds = min(timeit.repeat(statement, number=1, repeat=5))
+    print(f"{label:<50} {seconds / cells * 1e9:>10.0f} ns")
+
+
+def run() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "payments.csv")
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["id", "amount", "fee"])
+            for i in range(ROWS):
+                writer.writerow([i, f"{i % 1000}.{i % 100:02d} {('USD', 'EUR', 'GBP')[i % 3]}", f"0.{i % 10}0 USD"])
+
+        def per_cell():
+            with open(path, encoding="utf-8", newline="") as file:
+                reader = csv.reader(file)
+                next(reader)
+                return [(Money(row[1]), Money(row[2])) for row in reader]
+
+        cells = ROWS * 2
+        bench("csv.reader and Money(cell)", per_cell, cells)
+        bench("read_csv_money()", lambda: list(read_csv_money(path, ["amount", "fee"])), cells)
+        bench("read_csv_money(columnar=True)", lambda: read_csv_money(path, ["amount", "fee"], columnar=True), cells)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,37 @@
+"""
+Cost of looking up Money settings (rounding, parser, default currency) and of Money construction,
+with global defaults only and with overrides of the current context.
+Run from the repository root: python -m benchmarks.bench_money_context
+"""
+import decimal
+import timeit
+
+from simple_money_lib import Money
+from simple_money_lib.utils.context import get_context, money_context
+
+NUMBER = 100_000
+
+
+def bench(label: str, statement) -> None:
+    seconds = min(timeit.repeat(statement, number=NUMBER, repeat=5))
+    print(f"{label:<50} {seconds / NUMBER * 1e9:>10.0f} ns")
+
+
+def separate_lookups():
+    return Money.rounding.get(), Money.parser.get(), Money.default_currency.get()
+
+
+def run() -> None:
+    bench("three separate lookups", separate_lookups)
+    bench("single context lookup", get_context)
+    bench("Money(12)", lambda: Money(12))
+    bench("Money('1.005', 'USD')", lambda: Money("1.005", "USD"))
+    bench("Money('12.34 USD')", lambda: Money("12.34 USD"))
+
+
+if __name__ == "__main__":
+    print("Global defaults:")
+    run()
+    print("\nWithin money_context(rounding=ROUND_HALF_UP, default_currency='EUR'):")
+    with money_context(rounding=decimal.ROUND_HALF_UP, default_currency="EUR"):
+        run()
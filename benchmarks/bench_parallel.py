@@ -0,0 +1,40 @@
+"""
+Throughput of parse_file_parallel() on a file of money strings with 1 to N worker processes, and the scaling
+efficiency: throughput with N workers relative to N times the throughput of parsing in the calling process.
+Efficiency stays close to 100% up to the number of CPUs.
+Run from the repository root: python -m benchmarks.bench_parallel [--lines 1000000] [--max-workers 8]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from simple_money_lib.io import parse_file_parallel
+
+
+def run(lines: int, max_workers: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "settlements.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            for i in range(lines):
+                file.write(f"{i % 100_000}.{i % 100:02d} {('USD', 'EUR', 'GBP')[i % 3]}\n")
+
+        print(f"{lines:,} lines, {os.path.getsize(path) / 1e6:.1f} MB, {os.cpu_count()} CPUs")
+        baseline = None
+        workers = 1
+        while workers <= max_workers:
+            start = time.perf_counter()
+            for _ in parse_file_parallel(path, workers=workers, chunk_size=1 << 20, ordered=False):
+                pass
+            throughput = lines / (time.perf_counter() - start)
+            baseline = baseline or throughput
+            print(f"{workers:>3} workers {throughput:>12,.0f} lines/s {throughput / (baseline * workers):>8.0%}")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser()
+    arguments.add_argument("--lines", type=int, default=1_000_000)
+    arguments.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    options = arguments.parse_args()
+    run(options.lines, options.max_workers)
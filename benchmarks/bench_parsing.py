@@ -0,0 +1,97 @@
+"""
+Cost of parsing money strings with BaseParser in registries with more and more custom currencies, with
+CachedParser for repeated strings, with ComplexMoneyParser for simple and formatted strings, and with
+LearningParser for a feed of one format; with ParserPipeline falling back from BaseParser to ComplexMoneyParser
+for a mixed feed; parsing to integer minor units; and bulk parsing of a feed with invalid rows.
+With the compiled currency matcher, the cost should not grow with the size of the registry.
+Run from the repository root: python -m benchmarks.bench_parsing
+"""
+from unittest.mock import patch
+import itertools
+import string
+import timeit
+
+from simple_money_lib import Currency, Money
+from simple_money_lib.parsers import BaseParser, CachedParser, ComplexMoneyParser, LearningParser, ParserPipeline
+
+NUMBER = 20_000
+INPUTS = ["12.34 USD", "EUR 567.89", "CNY1.23", "123.45"]
+FORMATTED_INPUTS = ["1.234,56 €", "CHF 1'234.50", "(1,234.56) USD", "１２３ JPY"]
+FEED_INPUTS = ["1.234,56 €", "12,00 €", "-7,50 €", "999.999,99 €"]
+
+
+def bench(label: str, statement, strings: int = len(INPUTS)) -> None:
+    """Print the time per string of a statement parsing a number of strings"""
+    seconds = min(timeit.repeat(statement, number=NUMBER, repeat=5))
+    print(f"{label:<50} {seconds / NUMBER / strings * 1e9:>10.0f} ns")
+
+
+def run() -> None:
+    for extra in (0, 1_000, 10_000):
+        registry = Currency.new_registry()
+        codes = ("".join(chars) for chars in itertools.product(string.ascii_uppercase, repeat=5))
+        with patch("simple_money_lib.currency.save_user_currencies"):
+            for code in itertools.islice(codes, extra):
+                registry.register(code=f"X{code}", numeric=None, sub_unit=2, name=f"Test {code}")
+        parser = BaseParser(registry=registry)
+        parser.prepare()
+
+        def parse_all():
+            for text in INPUTS:
+                parser.parse(text)
+
+        bench(f"BaseParser.parse, {len(registry.all_currencies())} currencies", parse_all)
+
+    for parser in (BaseParser(), CachedParser(BaseParser())):
+        def parse_all():
+            for text in INPUTS:
+                parser.parse(text)
+
+        bench(f"{type(parser).__name__}.parse, repeated strings", parse_all)
+
+    for parser, inputs, label in ((BaseParser(), INPUTS, "simple"), (ComplexMoneyParser(), INPUTS, "simple"),
+                                  (ComplexMoneyParser(), FORMATTED_INPUTS, "formatted")):
+        def parse_all():
+            for text in inputs:
+                parser.parse(text)
+
+        bench(f"{type(parser).__name__}.parse, {label} strings", parse_all)
+
+    for parser in (ComplexMoneyParser(), LearningParser(sample_size=len(FEED_INPUTS))):
+        def parse_all():
+            for text in FEED_INPUTS:
+                parser.parse(text)
+
+        bench(f"{type(parser).__name__}.parse, feed of one format", parse_all)
+
+    mixed = INPUTS * 4 + FORMATTED_INPUTS  # 80% canonical strings
+    for parser, label in ((ComplexMoneyParser(), "ComplexMoneyParser"),
+                          (ParserPipeline(BaseParser(), ComplexMoneyParser()), "ParserPipeline"),
+                          (ParserPipeline(BaseParser(), ComplexMoneyParser(), timed=True), "ParserPipeline, timed")):
+        def parse_all():
+            for text in mixed:
+                parser.parse(text)
+
+        bench(f"{label}.parse, mixed feed", parse_all, len(mixed))
+    for stats in parser.stats():
+        print(f"  {stats}")
+
+    parser = BaseParser()
+    bench("Money(text).minor_units", lambda: [Money(text).minor_units for text in INPUTS])
+    bench("BaseParser.parse_minor_units", lambda: [parser.parse_minor_units(text) for text in INPUTS])
+
+    feed = ["12.34 USD", "n/a", "EUR 567.89", "CNY1.23", "5 XYZ", "123.45", "", "1.99 GBP", "12,50 EUR", "0 JPY"]
+
+    def parse_or_none(text):
+        try:
+            return parser.parse(text)
+        except ValueError:
+            return None
+
+    bench("parse() and except, 30% invalid", lambda: [parse_or_none(text) for text in feed], len(feed))
+    bench("parse_many(), 30% invalid", lambda: list(parser.parse_many(feed)), len(feed))
+    bench("is_valid(), 30% invalid", lambda: [parser.is_valid(text) for text in feed], len(feed))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,30 @@
+"""
+Throughput of finding monetary mentions in free text with find_money() and, in chunks, with iter_money().
+The time per character should not grow with the size of the text.
+Run from the repository root: python -m benchmarks.bench_scanner
+"""
+import io
+import timeit
+
+from simple_money_lib.parsers import find_money, iter_money
+
+LINE = "Invoice 2024-117 of 12.03.2024: total USD 1,250.00, of which €500 paid, 12,50 kr fee, ref 4711.\n"
+
+
+def bench(label: str, statement, characters: int) -> None:
+    """Print the time per character and the throughput of a statement scanning a number of characters"""
+    seconds = min(timeit.repeat(statement, number=1, repeat=5))
+    print(f"{label:<50} {seconds / characters * 1e9:>8.1f} ns/char {characters / seconds / 1e6:>8.1f} MB/s")
+
+
+def run() -> None:
+    find_money(LINE)  # Compile the scanner
+    for lines in (1_000, 10_000, 100_000):
+        text = LINE * lines
+        bench(f"find_money(), {len(text):,} characters", lambda: find_money(text), len(text))
+        bench(f"iter_money(), {len(text):,} characters", lambda: list(iter_money(io.StringIO(text), 1 << 16)),
+              len(text))
+
+
+if __name__ == "__main__":
+    run()
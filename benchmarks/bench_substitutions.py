@@ -0,0 +1,46 @@
+"""
+Cost of substitutions per string with SimpleParserWithSubstitutions and growing substitution tables, compared with
+applying the substitutions one by one (one regex pass per entry, as before the substitutions were compiled).
+The compiled substitutions make a single pass per string, whatever the size of the table.
+Run from the repository root: python -m benchmarks.bench_substitutions
+"""
+import re
+import timeit
+
+from simple_money_lib.parsers import SimpleParserWithSubstitutions
+
+NUMBER = 2_000
+INPUTS = ["kr.1 000,25", "$100", "1'234,50 €", "CHF 12.50"]
+BASE_SUBSTITUTIONS = {"kr.": "SEK", "kr": "SEK", "$": "USD", "€": "EUR", ",": ".", "'": "", " ": ""}
+
+
+def one_by_one(substitutions: dict, money_string: str) -> str:
+    """Substitutions applied as before they were compiled"""
+    for old_value, new_value in sorted(substitutions.items(), key=lambda item: len(item[0]), reverse=True):
+        if new_value and new_value[-1].isdigit():
+            new_value = new_value + " "
+        money_string = re.sub(re.escape(old_value), new_value, money_string)
+    return money_string
+
+
+def bench(label: str, statement, number: int = NUMBER) -> None:
+    seconds = min(timeit.repeat(statement, number=number, repeat=3))
+    print(f"{label:<50} {seconds / number / len(INPUTS) * 1e9:>10.0f} ns")
+
+
+def run() -> None:
+    for size in (len(BASE_SUBSTITUTIONS), 20, 200, 2_000):
+        # Unused tokens fill the table up to the size
+        substitutions = dict(BASE_SUBSTITUTIONS, **{f"token{i}~": "" for i in range(size - len(BASE_SUBSTITUTIONS))})
+        parser = SimpleParserWithSubstitutions(substitutions)
+        compiled = parser._compiled
+        assert all(compiled(text) == one_by_one(substitutions, text) for text in INPUTS)
+
+        bench(f"{size} substitutions, one by one", lambda: [one_by_one(substitutions, text) for text in INPUTS],
+              number=max(NUMBER * len(BASE_SUBSTITUTIONS) // size, 1))
+        bench(f"{size} substitutions, compiled", lambda: [compiled(text) for text in INPUTS])
+        bench(f"{size} substitutions, compiled, parse", lambda: [parser.parse(text) for text in INPUTS])
+
+
+if __name__ == "__main__":
+    run()
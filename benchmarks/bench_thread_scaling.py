@@ -0,0 +1,89 @@
+"""
+Throughput of Money construction, arithmetic and parsing with 1 to N threads, and the scaling efficiency:
+throughput with N threads relative to N times the single-thread throughput. Under the GIL, efficiency drops
+to about 1/N; on a free-threaded interpreter (e.g., python3.13t) it should stay close to 100%.
+Run from the repository root: python -m benchmarks.bench_thread_scaling [--max-threads 32] [--ops 20000]
+"""
+from decimal import Decimal
+import argparse
+import os
+import sys
+import threading
+import time
+
+import simple_money_lib
+from simple_money_lib import Money
+
+
+def construction():
+    Money("12.34", "USD")
+
+
+def arithmetic(a=Money("12.34", "USD"), b=Money("0.66", "USD")):
+    (a + b) * 3 - b
+
+
+def parsing():
+    Money("12.34 USD")
+
+
+def decimal_baseline(a=Decimal("12.34"), b=Decimal("0.66")):
+    ((a + b) * 3 - b).quantize(Decimal("0.01"))
+
+
+WORKLOADS = {
+    "decimal (reference)": decimal_baseline,
+    "construction": construction,
+    "arithmetic": arithmetic,
+    "parsing": parsing,
+}
+
+
+def throughput(workload, threads: int, ops: int) -> float:
+    """Return operations per second of all threads together, each running `ops` operations"""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        for _ in range(ops):
+            workload()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * ops / (time.perf_counter() - start)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--max-threads", type=int, default=os.cpu_count())
+    arg_parser.add_argument("--ops", type=int, default=20_000, help="operations per thread")
+    arg_parser.add_argument("--no-preload", action="store_true", help="skip simple_money_lib.preload(freeze=True)")
+    args = arg_parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {os.cpu_count()} CPUs")
+    if not args.no_preload:
+        simple_money_lib.preload(freeze=True)
+
+    thread_counts = [1]
+    while thread_counts[-1] * 2 <= args.max_threads:
+        thread_counts.append(thread_counts[-1] * 2)
+    if thread_counts[-1] != args.max_threads:
+        thread_counts.append(args.max_threads)
+
+    for name, workload in WORKLOADS.items():
+        print(f"\n{name}\n{'threads':>8} {'ops/s':>12} {'efficiency':>11}")
+        single = None
+        for threads in thread_counts:
+            result = throughput(workload, threads, args.ops)
+            single = single or result
+            print(f"{threads:>8} {result:>12,.0f} {result / (threads * single):>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
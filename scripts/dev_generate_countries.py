@@ -0,0 +1,114 @@
+import csv
+import json
+import re
+from pathlib import Path
+
+# Location names used in the ISO 4217 table which differ from ISO 3166 short names
+_NAME_ALIASES = {
+    "bolivia": "BO",
+    "brunei darussalam": "BN",
+    "cabo verde": "CV",
+    "czechia": "CZ",
+    "democratic republic of the congo": "CD",
+    "iran": "IR",
+    "lao people's democratic republic": "LA",
+    "macau": "MO",
+    "moldova": "MD",
+    "north korea": "KP",
+    "north macedonia": "MK",
+    "russia": "RU",
+    "south korea": "KR",
+    "são tomé and príncipe": "ST",
+    "syria": "SY",
+    "taiwan": "TW",
+    "tanzania": "TZ",
+    "turkey": "TR",
+    "united kingdom": "GB",
+    "united states": "US",
+    "venezuela": "VE",
+    "vietnam": "VN",
+}
+
+# Countries where the first matching currency of the ISO 4217 table is not the one in general use
+_PRIMARY_OVERRIDES = {
+    "VE": "VES",
+}
+
+# Currencies which are never the primary currency of a country
+_SPECIAL_MARKERS = ("funds code", "complementary", "unidad")
+
+_ALPHA2_RE = re.compile(r"\(([A-Z]{2})[\s;,)\-]")
+_PARENTHESES_RE = re.compile(r"\(.*?\)")
+
+
+def _split_locations(locations: str) -> list[str]:
+    """Split the list of locations on commas outside of parentheses."""
+    parts, depth, current = [], 0, ""
+    for char in locations:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == "," and depth == 0:
+            parts.append(current.strip())
+            current = ""
+        else:
+            current += char
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def _normalize(name: str) -> str:
+    return " ".join(_PARENTHESES_RE.sub("", name).split()).casefold()
+
+
+def _load_countries(countries_csv: Path) -> dict:
+    countries = {}
+    with open(countries_csv, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            # Namibia's "NA" is read as a missing value by pandas when downloading, recover it from the ISO 3166-2 link
+            alpha2 = row["Alpha-2 code"] or row["Link to ISO 3166-2"].rsplit(":", 1)[-1]
+            countries[alpha2] = {
+                "name": row["English short name (using title case)"],
+                "alpha3": row["Alpha-3 code"],
+                "numeric": int(row["Numeric code"]),
+                "currencies": [],
+            }
+    return countries
+
+
+def generate_countries_json(destination_json_file: Path, countries_csv: Path, currencies_csv: Path) -> None:
+    """Generate a JSON file with ISO 3166 countries and the currencies they use, based on pre-created CSVs."""
+    print("Generating countries...")
+    countries = _load_countries(countries_csv)
+    names = {_normalize(country["name"]): alpha2 for alpha2, country in countries.items()}
+    names.update(_NAME_ALIASES)
+
+    # alpha-2 -> list of (rank, code), lower rank is preferred as the primary currency
+    candidates: dict[str, list] = {}
+    with open(currencies_csv, newline="", encoding="utf-8") as f:
+        for order, row in enumerate(csv.DictReader(f)):
+            special = any(marker in row["Currency"].casefold() for marker in _SPECIAL_MARKERS)
+            for position, location in enumerate(_split_locations(row["Locations listed for this currency"] or "")):
+                if match := _ALPHA2_RE.search(location):
+                    alpha2 = match.group(1)
+                else:
+                    alpha2 = names.get(_normalize(location))
+                if alpha2 not in countries:
+                    print(f"\tSkipped location of {row['Code']}: '{location}'")
+                    continue
+                rank = (special, position > 0, order)
+                candidates.setdefault(alpha2, []).append((rank, row["Code"]))
+
+    for alpha2, ranked in candidates.items():
+        codes = [code for _, code in sorted(ranked)]
+        if (primary := _PRIMARY_OVERRIDES.get(alpha2)) in codes:
+            codes.remove(primary)
+            codes.insert(0, primary)
+        countries[alpha2]["currencies"] = list(dict.fromkeys(codes))
+
+    with open(destination_json_file, "w", encoding="utf-8") as f:
+        json.dump(countries, f, ensure_ascii=False, indent=4)
+
+    print(f"Countries JSON saved to '{destination_json_file.name}'")
@@ -5,18 +5,21 @@ import datetime
 
 _TEMPLATE = """# Auto-generated module
 # CHECKLINE {when}
+# Thin lazy alias: currencies and the collection are created on first access, see CurrencyCollection.load()
 
 from simple_money_lib.currency import Currency as _Currency
 from simple_money_lib.currencies.currency_collections import CurrencyCollection as _CurrencyCollection
 
-# Export individual currencies
-{currency_exports}
+_CODES = frozenset([{currency_list}])
+
+
+def __getattr__(name):
+    if name == "{name}_currencies":
+        return _CurrencyCollection.load("{name}")
+    if name in _CODES:
+        return _Currency(name)
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
 
-{name}_currencies = _CurrencyCollection(
-    {currencies},
-    name="{name}",
-    description="{description}"
-)
 
 __all__ = [{currency_list}, "{name}_currencies"]
 """
@@ -28,15 +31,10 @@ def _load_metadata(metadata_file):
 
 def _generate_module(name, metadata, output_folder: Path):
     """Generate a Python module for a currency collection."""
-    currencies = ", ".join([f'{code}' for code in metadata["currencies"]])
-    currency_exports = "\n".join([f'{code} = _Currency("{code}")' for code in metadata["currencies"]])
     currency_list = ", ".join([f'"{code}"' for code in metadata["currencies"]])
 
     module_content = _TEMPLATE.format(
         name=name,
-        currencies=currencies,
-        description=metadata["description"],
-        currency_exports=currency_exports,
         currency_list=currency_list,
         when=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     )
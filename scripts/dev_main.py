@@ -4,6 +4,7 @@ import argparse
 from dev_update_from_wiki import update_iso_currencies
 from dev_generate_all import generate_currency_all
 from dev_generate_currency_collections import generate_collections
+from dev_generate_countries import generate_countries_json
 
 
 # Get the root directory of the project
@@ -17,6 +18,9 @@ currency_folder = project_root / "simple_money_lib" / "currencies"
 iso_currencies_file = 'predefined_currencies.json'
 all_file = 'all.py'
 collections_file = 'collections_metadata.json'
+countries_file = 'countries.json'
+iso_countries_csv = Path(__file__).resolve().parent / 'iso_country_codes.csv'
+iso_currencies_csv = Path(__file__).resolve().parent / 'iso_currency_codes.csv'
 
 def _ensure_directories_exist():
     # Ensure the directories exist
@@ -37,6 +41,8 @@ def main(wiki_update=False):
     collections_path = data_folder / collections_file
     generate_collections(collections_path, currency_folder)
 
+    generate_countries_json(data_folder / countries_file, iso_countries_csv, iso_currencies_csv)
+
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(
@@ -2,3 +2,5 @@ from simple_money_lib.currency import Currency
 from simple_money_lib.money import Money
 from simple_money_lib.exceptions import *
 
+from simple_money_lib.account_book import AccountBook
+from simple_money_lib.utils.preload import preload
@@ -0,0 +1,275 @@
+from __future__ import annotations
+from contextlib import ExitStack, nullcontext
+from typing import Dict, Hashable
+import threading
+import time
+
+from simple_money_lib.currency import Currency
+from simple_money_lib.money import Money
+from simple_money_lib.exceptions import (CurrencyMismatch, AccountExistsError, AccountNotFoundError,
+                                         InsufficientFundsError, HoldNotFoundError)
+
+
+class _Stripe:
+    """
+    Accounts guarded by one lock, taken for writing with `with stripe:`. The version is incremented when a write
+    starts and when it ends, so it is odd while a write is in progress; AccountBook.snapshot uses it to detect
+    concurrent writes without locking.
+    """
+    __slots__ = ('lock', 'version', 'balances', 'held', 'holds', 'hold_count')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = 0
+        self.balances: Dict[Hashable, int] = {}  # Account -> balance in minor units
+        self.held: Dict[Hashable, int] = {}  # Account -> total of open holds in minor units
+        self.holds: Dict[int, tuple[Hashable, int]] = {}  # Hold id -> (account, minor units)
+        self.hold_count = 0
+
+    def __enter__(self):
+        self.lock.acquire()
+        self.version += 1
+
+    def __exit__(self, *exc_info):
+        self.version += 1
+        self.lock.release()
+
+
+_NO_STRIPE = nullcontext()
+
+
+class AccountBook:
+    """
+    In-memory account balances updated concurrently by many threads.
+    Balances are kept as integer minor units, each account in a fixed currency. Accounts are spread over
+    stripes with a lock each, so that operations on accounts of different stripes do not contend.
+    Amounts are passed and returned as Money; a Money in another currency than the account's raises CurrencyMismatch.
+
+    Example:
+        book = AccountBook()
+        book.open("alice", "EUR", Money("100 EUR"))
+        book.open("bob", "EUR")
+        book.transfer("alice", "bob", Money("30 EUR"))
+        hold = book.reserve("bob", Money("10 EUR"))         # Two-phase debit: reserve now, then commit or release
+        book.commit(hold, to="alice")
+        print(book.balance("alice"), book.balance("bob"))    # 80.00 EUR 20.00 EUR
+    """
+
+    snapshot_attempts = 16  # Optimistic reads before snapshot() locks all stripes
+
+    def __init__(self, stripes: int = 64):
+        """
+        Arguments:
+            stripes: number of locks the accounts are spread over; more stripes mean less contention
+        """
+        if not isinstance(stripes, int) or stripes < 1:
+            raise ValueError(f"Number of stripes must be a positive integer: '{stripes}'")
+        self._stripes = tuple(_Stripe() for _ in range(stripes))
+        self._currencies: Dict[Hashable, Currency] = {}  # Written once per account, read without locking
+
+    def _index(self, account: Hashable) -> int:
+        return hash(account) % len(self._stripes)
+
+    def _currency(self, account: Hashable) -> Currency:
+        try:
+            return self._currencies[account]
+        except KeyError:
+            raise AccountNotFoundError(account) from None
+
+    @staticmethod
+    def _units(money: Money, currency: Currency) -> int:
+        """Return a non-negative amount as minor units of the currency"""
+        if not isinstance(money, Money):
+            raise TypeError("'money' must be a Money instance")
+        if money.currency is not currency:
+            raise CurrencyMismatch
+        units = int(money.amount.scaleb(currency.sub_unit))  # As Money.minor_units, for an amount of the currency
+        if units < 0:
+            raise ValueError(f"Amount must not be negative: {money}")
+        return units
+
+    def _pair(self, first: int, second: int) -> tuple[_Stripe, _Stripe | nullcontext]:
+        """Return the stripes to write for two accounts, as `with low, high:`, ordered to avoid deadlocks"""
+        if first == second:
+            return self._stripes[first], _NO_STRIPE
+        if first > second:
+            first, second = second, first
+        return self._stripes[first], self._stripes[second]
+
+    def _check_available(self, stripe: _Stripe, account: Hashable, units: int) -> None:
+        """Raise InsufficientFundsError if the available balance is less than the units. Call with the stripe locked."""
+        available = stripe.balances[account] - stripe.held[account]
+        if units > available:
+            currency = self._currencies[account]
+            raise InsufficientFundsError(account, Money.from_minor_units(available, currency),
+                                         Money.from_minor_units(units, currency))
+
+    def open(self, account: Hashable, currency: Currency | str, balance: Money | None = None) -> None:
+        """
+        Open an account with a currency and an optional opening balance.
+        Raises:
+            AccountExistsError, CurrencyMismatch if the balance is in another currency
+        """
+        currency = Money._validate_currency(currency)
+        units = self._units(balance, currency) if balance is not None else 0
+        index = self._index(account)
+        stripe = self._stripes[index]
+        with stripe:
+            if account in self._currencies:
+                raise AccountExistsError(account)
+            stripe.held[account] = 0
+            stripe.balances[account] = units
+            self._currencies[account] = currency  # Last, as it makes the account visible to lock-free reads
+
+    def __contains__(self, account: Hashable) -> bool:
+        return account in self._currencies
+
+    def __len__(self) -> int:
+        return len(self._currencies)
+
+    def currency(self, account: Hashable) -> Currency:
+        """Return the currency of an account"""
+        return self._currency(account)
+
+    def balance(self, account: Hashable) -> Money:
+        """Return the balance of an account, including amounts on hold"""
+        currency = self._currency(account)
+        return Money.from_minor_units(self._stripes[self._index(account)].balances[account], currency)
+
+    def available(self, account: Hashable) -> Money:
+        """Return the balance of an account less amounts on hold"""
+        currency = self._currency(account)
+        stripe = self._stripes[self._index(account)]
+        with stripe.lock:
+            units = stripe.balances[account] - stripe.held[account]
+        return Money.from_minor_units(units, currency)
+
+    def credit(self, account: Hashable, money: Money) -> None:
+        """Add money to an account"""
+        units = self._units(money, self._currency(account))
+        stripe = self._stripes[self._index(account)]
+        with stripe:
+            stripe.balances[account] += units
+
+    def debit(self, account: Hashable, money: Money) -> None:
+        """
+        Take money from an account, if its available balance covers it.
+        Raises:
+            InsufficientFundsError, leaving the balance unchanged
+        """
+        units = self._units(money, self._currency(account))
+        stripe = self._stripes[self._index(account)]
+        with stripe:
+            self._check_available(stripe, account, units)
+            stripe.balances[account] -= units
+
+    def transfer(self, source: Hashable, target: Hashable, money: Money) -> None:
+        """
+        Move money from one account to another atomically, if the available balance of the source covers it.
+        Raises:
+            InsufficientFundsError, CurrencyMismatch if the accounts or the money differ in currency
+        """
+        units = self._units(money, self._currency(source))
+        if self._currency(target) is not money.currency:
+            raise CurrencyMismatch
+        source_index, target_index = self._index(source), self._index(target)
+        source_stripe, target_stripe = self._stripes[source_index], self._stripes[target_index]
+        low, high = self._pair(source_index, target_index)
+        with low, high:
+            self._check_available(source_stripe, source, units)
+            source_stripe.balances[source] -= units
+            target_stripe.balances[target] += units
+
+    def reserve(self, account: Hashable, money: Money) -> int:
+        """
+        Put money of an account on hold, the first phase of a two-phase debit. The held amount is not available
+        for other debits, transfers or holds until the hold is committed or released.
+        Returns:
+            hold id, to be passed to commit() or release()
+        Raises:
+            InsufficientFundsError
+        """
+        units = self._units(money, self._currency(account))
+        index = self._index(account)
+        stripe = self._stripes[index]
+        with stripe:
+            self._check_available(stripe, account, units)
+            stripe.held[account] += units
+            # Unique per book: the stripe is recovered from the id as its remainder
+            hold_id = stripe.hold_count * len(self._stripes) + index
+            stripe.hold_count += 1
+            stripe.holds[hold_id] = account, units
+        return hold_id
+
+    def commit(self, hold_id: int, to: Hashable | None = None) -> Money:
+        """
+        Debit the money on hold, optionally crediting it to another account atomically.
+        Returns:
+            the debited money
+        Raises:
+            HoldNotFoundError if the hold does not exist or was already committed or released,
+            CurrencyMismatch if the target account is in another currency
+        """
+        index = hold_id % len(self._stripes) if isinstance(hold_id, int) else None
+        if index is None:
+            raise HoldNotFoundError(hold_id)
+        stripe = self._stripes[index]
+        target_index = self._index(to) if to is not None else index
+        low, high = self._pair(index, target_index)
+        with low, high:
+            if (hold := stripe.holds.get(hold_id)) is None:
+                raise HoldNotFoundError(hold_id)
+            account, units = hold
+            currency = self._currencies[account]
+            if to is not None and self._currency(to) is not currency:
+                raise CurrencyMismatch
+            del stripe.holds[hold_id]
+            stripe.held[account] -= units
+            stripe.balances[account] -= units
+            if to is not None:
+                self._stripes[target_index].balances[to] += units
+        return Money.from_minor_units(units, currency)
+
+    def release(self, hold_id: int) -> Money:
+        """
+        Cancel a hold, making its money available again.
+        Returns:
+            the released money
+        Raises:
+            HoldNotFoundError if the hold does not exist or was already committed or released
+        """
+        index = hold_id % len(self._stripes) if isinstance(hold_id, int) else None
+        if index is None:
+            raise HoldNotFoundError(hold_id)
+        stripe = self._stripes[index]
+        with stripe:
+            if (hold := stripe.holds.pop(hold_id, None)) is None:
+                raise HoldNotFoundError(hold_id)
+            account, units = hold
+            stripe.held[account] -= units
+        return Money.from_minor_units(units, self._currencies[account])
+
+    def snapshot(self) -> Dict[Hashable, Money]:
+        """
+        Return the balances of all accounts at a single point in time, e.g., with the total of all balances
+        unaffected by transfers in progress. Stripes are copied without locking and the copy is repeated if any
+        of them was written meanwhile; only after `snapshot_attempts` interrupted copies are writers blocked.
+        """
+        stripes = self._stripes
+        for _ in range(self.snapshot_attempts):
+            versions = [stripe.version for stripe in stripes]
+            if any(version & 1 for version in versions):
+                time.sleep(0)  # Let the writer finish
+                continue
+            balances = [stripe.balances.copy() for stripe in stripes]
+            if versions == [stripe.version for stripe in stripes]:
+                break
+        else:
+            with ExitStack() as stack:
+                for stripe in stripes:
+                    stack.enter_context(stripe)
+                balances = [stripe.balances.copy() for stripe in stripes]
+
+        currencies = self._currencies
+        return {account: Money.from_minor_units(units, currencies[account])
+                for stripe_balances in balances for account, units in stripe_balances.items()}
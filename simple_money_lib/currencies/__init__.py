@@ -1,3 +1,13 @@
 from simple_money_lib.currencies.all import all_iso_currencies
-from simple_money_lib.currencies.brics import brics_currencies
-from simple_money_lib.currencies.major import major_currencies
+from simple_money_lib.currencies.currency_collections import CurrencyCollection as _CurrencyCollection
+from simple_money_lib.exceptions import CurrencyCollectionNotFoundError as _CurrencyCollectionNotFoundError
+
+
+def __getattr__(name):
+    """Collections from collections metadata are created on first access, e.g., major_currencies."""
+    if name.endswith("_currencies"):
+        try:
+            return _CurrencyCollection.load(name.removesuffix("_currencies"))
+        except _CurrencyCollectionNotFoundError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
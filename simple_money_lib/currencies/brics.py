@@ -1,24 +1,19 @@
 # Auto-generated module
-# CHECKLINE 2024-12-20 12:16:22
+# CHECKLINE 2026-10-19 04:10:52
+# Thin lazy alias: currencies and the collection are created on first access, see CurrencyCollection.load()
 
 from simple_money_lib.currency import Currency as _Currency
 from simple_money_lib.currencies.currency_collections import CurrencyCollection as _CurrencyCollection
 
-# Export individual currencies
-BRL = _Currency("BRL")
-RUB = _Currency("RUB")
-INR = _Currency("INR")
-CNY = _Currency("CNY")
-ZAR = _Currency("ZAR")
-IRR = _Currency("IRR")
-EGP = _Currency("EGP")
-ETB = _Currency("ETB")
-AED = _Currency("AED")
+_CODES = frozenset(["BRL", "RUB", "INR", "CNY", "ZAR", "IRR", "EGP", "ETB", "AED"])
+
+
+def __getattr__(name):
+    if name == "brics_currencies":
+        return _CurrencyCollection.load("brics")
+    if name in _CODES:
+        return _Currency(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-brics_currencies = _CurrencyCollection(
-    BRL, RUB, INR, CNY, ZAR, IRR, EGP, ETB, AED,
-    name="brics",
-    description="Currencies of 9 nine BRICS member states"
-)
 
 __all__ = ["BRL", "RUB", "INR", "CNY", "ZAR", "IRR", "EGP", "ETB", "AED", "brics_currencies"]
@@ -1,7 +1,24 @@
+from pathlib import Path
+from types import MappingProxyType
+
 from simple_money_lib.currency import Currency
-from simple_money_lib.exceptions import CurrencyNotFoundError
+from simple_money_lib.exceptions import CurrencyNotFoundError, CurrencyCollectionNotFoundError
+from simple_money_lib.utils.currency_serialize import load_collections_metadata
 
 class CurrencyCollection:
+    """
+    Immutable collection of currencies. Membership is kept as a bitset over Currency ids, so checking a Currency
+    is a single integer bit test, and set operations (|, &, -, ^) between collections are integer operations.
+    """
+
+    # Attribute queries over all known currencies, see CurrencyCollection.where(). Replaced as a whole when rebuilt:
+    # (registry size, id -> Currency, attribute -> value -> bitset)
+    _query_state: tuple[int, dict[int, Currency], dict[str, dict[object, int]]] = (-1, {}, {})
+
+    # Collections loaded from metadata files: (file path or None for the library's own, name) -> collection
+    _loaded: dict[tuple[str | None, str], "CurrencyCollection"] = {}
+    _metadata: dict[str | None, dict] = {}  # Parsed collections metadata per file
+
     def __init__(self, *currencies, name=None, description=None):
         """
         Initialize a CurrencyCollection with a set of currencies.
@@ -13,17 +30,56 @@ class CurrencyCollection:
         """
         self.name = name
         self.description = description
-        self._currencies = {}
+        collected = {}
         for currency in currencies:
             if isinstance(currency, Currency):
-                self._currencies[currency.code] = currency
+                collected[currency.code] = currency
             elif isinstance(currency, str):
                 try:
-                    self._currencies[currency.upper()] = Currency(currency.upper())
+                    collected[currency.upper()] = Currency(currency.upper())
                 except CurrencyNotFoundError:
                     continue  # Skip invalid currencies
             else:
                 raise ValueError(f"Invalid currency: {currency}")
+        self._set_currencies(collected)
+
+    def _set_currencies(self, currencies: dict):
+        self._currencies = MappingProxyType(currencies)
+        self._mask = 0
+        for currency in currencies.values():
+            self._mask |= 1 << currency.id
+
+    @classmethod
+    def _from_dict(cls, currencies: dict, name=None, description=None):
+        collection = cls.__new__(cls)
+        collection.name = name
+        collection.description = description
+        collection._set_currencies(currencies)
+        return collection
+
+    @classmethod
+    def load(cls, name: str, path: str | Path | None = None):
+        """
+        Load a collection by name from collections metadata, building it on the first request and caching it.
+        Currency codes unknown to the registry are skipped, as on initialization.
+
+        :param name: Collection name, a key of the metadata file (e.g., "major").
+        :param path: Optional user-supplied collections file in the format of data/collections_metadata.json.
+        :raises CurrencyCollectionNotFoundError: If the collection is not defined in the metadata file.
+        :raises CurrencySerializationError: If the metadata file cannot be read.
+        """
+        source = str(Path(path).resolve()) if path is not None else None
+        if (collection := cls._loaded.get((source, name))) is not None:
+            return collection
+
+        if (metadata := cls._metadata.get(source)) is None:
+            metadata = cls._metadata.setdefault(source, load_collections_metadata(path))
+        if name not in metadata:
+            raise CurrencyCollectionNotFoundError(name, source or "predefined collections")
+        entry = metadata[name]
+        collection = cls(*entry["currencies"], name=name, description=entry.get("description"))
+        # Another thread may have loaded the same collection meanwhile, keep a single instance
+        return cls._loaded.setdefault((source, name), collection)
 
     def __contains__(self, item):
         """
@@ -33,7 +89,7 @@ class CurrencyCollection:
         :return: True if the currency is in the collection, False otherwise.
         """
         if isinstance(item, Currency):
-            return item.code in self._currencies
+            return self._mask >> item.id & 1 == 1
         elif isinstance(item, str):
             try:
                 return item.upper() in self._currencies
@@ -50,6 +106,93 @@ class CurrencyCollection:
         """
         return iter(self._currencies.values())
 
+    def __len__(self):
+        return len(self._currencies)
+
+    def __or__(self, other):
+        """Union of two collections."""
+        if not isinstance(other, CurrencyCollection):
+            return NotImplemented
+        return self._from_dict({**self._currencies, **other._currencies})
+
+    def __and__(self, other):
+        """Intersection of two collections."""
+        if not isinstance(other, CurrencyCollection):
+            return NotImplemented
+        mask = self._mask & other._mask
+        return self._from_dict({code: c for code, c in self._currencies.items() if mask >> c.id & 1})
+
+    def __sub__(self, other):
+        """Currencies of this collection which are not in the other one."""
+        if not isinstance(other, CurrencyCollection):
+            return NotImplemented
+        mask = self._mask & ~other._mask
+        return self._from_dict({code: c for code, c in self._currencies.items() if mask >> c.id & 1})
+
+    def __xor__(self, other):
+        """Currencies in exactly one of the two collections."""
+        if not isinstance(other, CurrencyCollection):
+            return NotImplemented
+        return (self - other) | (other - self)
+
+    def __eq__(self, other):
+        if not isinstance(other, CurrencyCollection):
+            return NotImplemented
+        return self._mask == other._mask
+
+    def __hash__(self):
+        return hash(self._mask)
+
+    def __le__(self, other):
+        """Check if all currencies of this collection are in the other one."""
+        if not isinstance(other, CurrencyCollection):
+            return NotImplemented
+        return self._mask & ~other._mask == 0
+
+    def __ge__(self, other):
+        """Check if all currencies of the other collection are in this one."""
+        if not isinstance(other, CurrencyCollection):
+            return NotImplemented
+        return other._mask & ~self._mask == 0
+
+    @classmethod
+    def _query(cls, criteria: dict) -> tuple[int, dict[int, Currency]]:
+        """
+        Return the bitset of all known currencies matching all attribute criteria, e.g., {'sub_unit': 0},
+        together with the mapping of ids to currencies it refers to.
+        """
+        size, currencies, index = cls._query_state
+        # Rebuild when currencies were added to the registry since the index was built
+        if size != len(Currency._registry):
+            currencies = {currency.id: currency for currency in Currency.all_currencies().values()}
+            size, index = len(currencies), {}
+        mask = -1  # All bits set
+        for attribute, value in criteria.items():
+            if attribute not in index:
+                by_value = {}
+                for currency in currencies.values():
+                    key = getattr(currency, attribute)
+                    by_value[key] = by_value.get(key, 0) | 1 << currency.id
+                index = {**index, attribute: by_value}
+            mask &= index[attribute].get(value, 0)
+        cls._query_state = size, currencies, index
+        return mask, currencies
+
+    @classmethod
+    def where(cls, name=None, description=None, **criteria):
+        """
+        Create a collection of all known currencies matching the criteria, using cached per-attribute indexes.
+        Example: CurrencyCollection.where(sub_unit=0) returns all currencies without decimal digits.
+        """
+        mask, currencies = cls._query(criteria)
+        return cls._from_dict({c.code: c for i, c in sorted(currencies.items()) if mask >> i & 1},
+                              name=name, description=description)
+
+    def filter(self, **criteria):
+        """Return the currencies of this collection matching the criteria, e.g., collection.filter(sub_unit=0)."""
+        mask = self._mask & self._query(criteria)[0]
+        return self._from_dict({code: c for code, c in self._currencies.items() if mask >> c.id & 1})
+
     def __repr__(self):
         """
         Return a string representation of the CurrencyCollection.
@@ -57,5 +200,3 @@ class CurrencyCollection:
         :return: A string showing the codes of all currencies in the collection.
         """
         return f"CurrencyCollection({', '.join(self._currencies.keys())})"
-
-
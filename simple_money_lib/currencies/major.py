@@ -1,25 +1,19 @@
 # Auto-generated module
-# CHECKLINE 2024-12-20 12:16:22
+# CHECKLINE 2026-10-19 04:10:52
+# Thin lazy alias: currencies and the collection are created on first access, see CurrencyCollection.load()
 
 from simple_money_lib.currency import Currency as _Currency
 from simple_money_lib.currencies.currency_collections import CurrencyCollection as _CurrencyCollection
 
-# Export individual currencies
-USD = _Currency("USD")
-EUR = _Currency("EUR")
-JPY = _Currency("JPY")
-GBP = _Currency("GBP")
-AUD = _Currency("AUD")
-CAD = _Currency("CAD")
-CHF = _Currency("CHF")
-CNY = _Currency("CNY")
-HKD = _Currency("HKD")
-NZD = _Currency("NZD")
+_CODES = frozenset(["USD", "EUR", "JPY", "GBP", "AUD", "CAD", "CHF", "CNY", "HKD", "NZD"])
+
+
+def __getattr__(name):
+    if name == "major_currencies":
+        return _CurrencyCollection.load("major")
+    if name in _CODES:
+        return _Currency(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-major_currencies = _CurrencyCollection(
-    USD, EUR, JPY, GBP, AUD, CAD, CHF, CNY, HKD, NZD,
-    name="major",
-    description="10 most used currencies globally"
-)
 
 __all__ = ["USD", "EUR", "JPY", "GBP", "AUD", "CAD", "CHF", "CNY", "HKD", "NZD", "major_currencies"]
@@ -1,12 +1,25 @@
 from __future__ import annotations
-from typing import Dict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Callable, Mapping
+import datetime
 import threading
+import time
 
-from simple_money_lib.exceptions import CurrencyNotFoundError, CurrencyExistsError, CurrencyCodeInvalid
-from simple_money_lib.utils.currency_serialize import load_currencies, save_user_currencies
+from simple_money_lib.exceptions import (CurrencyNotFoundError, CurrencyExistsError, CurrencyCodeInvalid,
+                                         CurrencyNumericExistsError, CurrencyRegistryFrozenError)
+from simple_money_lib.utils.currency_serialize import (load_currencies, load_user_currencies, save_user_currencies,
+                                                       user_currencies_signature, load_currency_aliases,
+                                                       load_countries, load_historical_currencies)
+from simple_money_lib.utils.alias_trie import AliasTrie, CurrencyAlias
+from simple_money_lib.utils.historical_index import HistoricalIndex, ValidityInterval
 
+# The signature is taken before loading, so that a concurrent write is detected by the first staleness check
+_loaded_user_file_signature = user_currencies_signature()
 _predefined_currencies, _user_defined_currencies = load_currencies()
 
+_ids_lock = threading.Lock()  # Currency ids are shared by all registries
+
 class Currency:
 
     # Class-level registry for unique instances
@@ -14,41 +27,105 @@ class Currency:
     _lock: threading.Lock = threading.Lock()
     strict_mode: bool = False  # Default to non-strict behavior
 
+    # Visibility of currencies registered by other processes sharing the same data directory
+    reload_interval: float = 5.0  # Minimum number of seconds between periodic checks of the user currencies file
+    _user_file_signature: tuple[int, int] | None = _loaded_user_file_signature
+    _user_file_checked_at: float = 0.0
+
+    # Storage of user-defined currencies. The default registry uses the library's data file,
+    # registries created by Currency.new_registry() have their own, see there.
+    _user_file: Path | None = None
+    _user_store: Dict[str, dict] | None = None
+    _persistent: bool = True
+
+    # Secondary indexes: numeric code -> code and normalized name -> code, built lazily on first lookup
+    _numeric_index: Dict[int, str] | None = None
+    _name_index: Dict[str, str] | None = None
+
+    # Symbols and alternative spellings, loaded from data/currency_aliases.json on first use
+    _alias_trie: AliasTrie | None = None
+
+    # Country code -> currency codes (primary first) and currency code -> alpha-2 country codes,
+    # loaded from data/countries.json on first use
+    _country_index: tuple[Dict[str, tuple[str, ...]], Dict[str, tuple[str, ...]]] | None = None
+
+    # Validity intervals from data/historical_currencies.json, loaded on first use,
+    # and unique instances of withdrawn currencies: (code, valid_from) -> Currency
+    _historical_index: HistoricalIndex | None = None
+    _historical_registry: Dict[tuple[str, datetime.date | None], Currency] = {}
+    _validity: ValidityInterval | None = None  # Set for instances of withdrawn currencies only
+
+    # Set by Currency.freeze(): all currencies are instantiated, indexes are built and the registry is read-only,
+    # so that lookups need no locking. Used by pre-fork servers to share the registry copy-on-write.
+    _frozen: bool = False
+
+    # Read-only snapshot of all known currencies returned by all_currencies(), reset whenever currencies are added
+    _snapshot: Mapping[str, Currency] | None = None
+
+    # Small integer ids, stable per code for the lifetime of the process, e.g., for bitsets of currencies
+    _ids: Dict[str, int] = {}
+
     # Class variables
     default_sub_unit = 2  # Default decimal digits
 
     def __new__(cls, code: str | Currency):
         # If the input is already a Currency instance, return it directly
-        if isinstance(code, cls):
+        if isinstance(code, Currency):
             return code
 
         if not cls._is_valid_code(code):
+            if instance := cls._resolve_alias(code):
+                return instance
             raise CurrencyCodeInvalid(code)
         code = code.upper().strip()
-        with cls._lock:
-            if code in cls._registry:
-                return cls._registry[code]
+        # Instances are never replaced or removed, so known ones are returned without locking
+        if (instance := cls._registry.get(code)) is not None:
+            return instance
+        if not cls._frozen:  # Otherwise all known currencies are already instantiated
+            with cls._lock:
+                if code in cls._registry:
+                    return cls._registry[code]
 
-            if metadata := cls._resolve_metadata(code):
-                numeric = metadata['numeric']
-                sub_unit = metadata['sub_unit']
-                name = metadata['name']
-            else:
-                raise CurrencyNotFoundError(code)
-
-            # Create a new instance and store it in the registry
-            instance = super().__new__(cls)
-            instance._code = code
-            instance._numeric = metadata['numeric']
-            instance._sub_unit = metadata['sub_unit'] if metadata['sub_unit'] is not None else cls.default_sub_unit
-            instance._name = metadata['name']
-            cls._registry[code] = instance
+                if metadata := cls._lookup_metadata(code):
+                    if cls is not Currency and code in _predefined_currencies:
+                        # Predefined currencies are shared by all registries, so that Money in e.g. USD is compatible
+                        instance = Currency(code)
+                    else:
+                        # Create a new instance and store it in the registry
+                        instance = cls._create(code, metadata)
+                    cls._registry[code] = instance
+                    cls._snapshot = None
+                    return instance
+
+        # Not a known code, but it could be an alias, e.g., a legacy code
+        if instance := cls._resolve_alias(code):
             return instance
+        raise CurrencyNotFoundError(code)
+
+    @classmethod
+    def _create(cls, code: str, metadata: dict) -> Currency:
+        """
+        Create a new instance from metadata, bypassing the registry.
+        It must always be called from within a locked context to maintain thread safety!
+        """
+        instance = super().__new__(cls)
+        with _ids_lock:
+            instance._id = cls._ids.setdefault(code, len(cls._ids))
+        instance._code = code
+        instance._numeric = metadata['numeric']
+        instance._sub_unit = metadata['sub_unit'] if metadata['sub_unit'] is not None else cls.default_sub_unit
+        instance._name = metadata['name']
+        return instance
 
     @property
     def code(self):
         return self._code
 
+    @property
+    def id(self) -> int:
+        """Small non-negative integer, unique per code and stable for the lifetime of the process"""
+        return self._id
+
     @property
     def numeric(self):
         return self._numeric
@@ -61,6 +138,22 @@ class Currency:
     def name(self):
         return self._name
 
+    @property
+    def valid_from(self) -> datetime.date | None:
+        """First day the currency was valid, or None if not known or not restricted"""
+        validity = self._validity or self._historical().current(self._code)
+        return validity.valid_from if validity else None
+
+    @property
+    def valid_to(self) -> datetime.date | None:
+        """Last day the currency was valid, or None for currencies in use"""
+        return self._validity.valid_to if self._validity else None
+
+    @property
+    def countries(self) -> tuple[str, ...]:
+        """ISO 3166 alpha-2 codes of the countries using this currency"""
+        return self._countries_index()[1].get(self._code, ())
+
     @staticmethod
     def _is_valid_code(code) -> bool:
         """
@@ -87,19 +180,318 @@ class Currency:
         Resolve metadata for a currency code, checking both predefined and dynamic records.
         It must always be called from within a locked context to maintain thread safety!
         """
-        for source in (_predefined_currencies, _user_defined_currencies):
+        for source in (_predefined_currencies, cls._user_metadata()):
             if code in source:
                 return source[code]
         return None
 
+    @classmethod
+    def _user_metadata(cls) -> Dict[str, dict]:
+        """Return user-defined currency metadata of this registry"""
+        return _user_defined_currencies if cls._user_store is None else cls._user_store
+
+    @classmethod
+    def new_registry(cls, user_file: str | Path | None = None) -> type[Currency]:
+        """
+        Create an isolated currency registry with its own lock, user-defined currencies and caches, e.g., per tenant.
+        The registry is a subclass of Currency used in the same way: TenantCurrency("ABC"), TenantCurrency.register().
+        Predefined currencies are shared with the default registry, so their instances are identical everywhere.
+        A registry is discarded by dropping all references to it.
+        Arguments:
+            user_file: file to persist user-defined currencies of the registry, or None to keep them in memory only
+        """
+        user_file = Path(user_file) if user_file is not None else None
+        user_data, signature = load_user_currencies(user_file) if user_file is not None else ({}, None)
+        return type("Currency", (Currency,), {
+            '_registry': {},
+            '_lock': threading.Lock(),
+            '_user_file': user_file,
+            '_user_store': user_data,
+            '_persistent': user_file is not None,
+            '_user_file_signature': signature,
+            '_user_file_checked_at': 0.0,
+            '_numeric_index': None,
+            '_name_index': None,
+            '_alias_trie': None,
+            '_historical_registry': {},
+            '_frozen': False,
+            '_snapshot': None,
+            '__module__': cls.__module__,
+        })
+
+    @classmethod
+    def _lookup_metadata(cls, code: str) -> dict | None:
+        """
+        Resolve metadata for a currency code. On a miss, check whether another process has registered it since.
+        It must always be called from within a locked context to maintain thread safety!
+        """
+        metadata = cls._resolve_metadata(code)
+        if metadata is None and cls._refresh_user_currencies(force=True):
+            metadata = cls._resolve_metadata(code)
+        return metadata
+
+    @classmethod
+    def _refresh_user_currencies(cls, force: bool = False) -> bool:
+        """
+        Merge currencies saved to the user currencies file by other processes.
+        Staleness is detected by the file signature (mtime and size), checked at most every `reload_interval`
+        seconds unless forced. The merge is incremental: metadata of known codes and existing instances are kept.
+        It must always be called from within a locked context to maintain thread safety!
+        Returns:
+            True if any new currency codes were merged
+        """
+        if not cls._persistent or cls._frozen:
+            return False
+        now = time.monotonic()
+        if not force and now - cls._user_file_checked_at < cls.reload_interval:
+            return False
+        cls._user_file_checked_at = now
+        if user_currencies_signature(cls._user_file) == cls._user_file_signature:
+            return False
+
+        user_data, cls._user_file_signature = load_user_currencies(cls._user_file)
+        user_metadata = cls._user_metadata()
+        new_codes = user_data.keys() - user_metadata.keys()
+        for code in new_codes:
+            user_metadata[code] = user_data[code]
+            cls._index_metadata(code, user_data[code])
+        if new_codes:
+            cls._snapshot = None
+        return bool(new_codes)
+
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        return " ".join(name.split()).casefold()
+
+    @staticmethod
+    def _numeric_key(numeric) -> int | None:
+        """Return a numeric code as an integer, or None if it is missing or not an integer, e.g., "N/A" """
+        try:
+            return int(numeric)
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _index_metadata(cls, code: str, metadata: dict) -> None:
+        """
+        Add a currency record to the secondary indexes, if they are already built.
+        On duplicates the first record wins, so predefined currencies take precedence over user-defined ones.
+        It must always be called from within a locked context to maintain thread safety!
+        """
+        if cls._numeric_index is None:
+            return
+        if (numeric := cls._numeric_key(metadata['numeric'])) is not None:
+            cls._numeric_index.setdefault(numeric, code)
+        if metadata['name']:
+            cls._name_index.setdefault(cls._normalize_name(metadata['name']), code)
+
+    @classmethod
+    def _ensure_indexes(cls) -> None:
+        """
+        Build the secondary indexes from currency metadata, unless already built. They are published when complete,
+        so that once built, lookups can read them without locking.
+        """
+        if cls._numeric_index is not None:
+            return
+        with cls._lock:
+            if cls._numeric_index is not None:
+                return
+            numeric_index, name_index = {}, {}
+            for source in (_predefined_currencies, cls._user_metadata()):
+                for code, metadata in source.items():
+                    # Numeric codes of user data which are not integers are not indexed
+                    if (numeric := cls._numeric_key(metadata['numeric'])) is not None:
+                        numeric_index.setdefault(numeric, code)
+                    if metadata['name']:
+                        name_index.setdefault(cls._normalize_name(metadata['name']), code)
+            cls._name_index = name_index
+            cls._numeric_index = numeric_index
+
+    @classmethod
+    def by_numeric(cls, numeric: int | str) -> Currency | None:
+        """
+        Get currency by its ISO 4217 numeric code, e.g., 978 or "978" for EUR, or None if not known.
+        If several currencies share a numeric code, the predefined or earliest registered one is returned.
+        """
+        try:
+            numeric = int(numeric)
+        except (TypeError, ValueError):
+            return None
+        cls._ensure_indexes()
+        code = cls._numeric_index.get(numeric)
+        return cls(code) if code else None
+
+    @classmethod
+    def by_name(cls, name: str) -> Currency | None:
+        """Get currency by its name, e.g., "Swedish krona", or None if not known. Case and whitespace insensitive."""
+        if not isinstance(name, str):
+            return None
+        cls._ensure_indexes()
+        code = cls._name_index.get(cls._normalize_name(name))
+        return cls(code) if code else None
+
+    @classmethod
+    def aliases(cls) -> AliasTrie:
+        """
+        Return the trie of currency aliases (symbols, alternative spellings, legacy codes) for longest-match lookup.
+        The trie is immutable and replaced on changes, so it can be used without locking.
+        """
+        if (trie := cls._alias_trie) is not None:
+            return trie
+        with cls._lock:
+            if cls._alias_trie is None:
+                aliases = []
+                for alias, entry in load_currency_aliases().items():
+                    code = entry['code'].upper()
+                    # Aliases of unknown currencies are skipped, so that each alias always resolves
+                    if cls._resolve_metadata(code) is not None:
+                        aliases.append(CurrencyAlias(alias, code, entry.get('ambiguous', False)))
+                cls._alias_trie = AliasTrie(aliases)
+            return cls._alias_trie
+
+    @classmethod
+    def register_alias(cls, alias: str, code: str | Currency, ambiguous: bool = False) -> None:
+        """
+        Register an alias for a known currency, e.g., Currency.register_alias("₿", "BTC"), for this process.
+        An existing alias with the same spelling is replaced. Persistent aliases belong in data/currency_aliases.json.
+        """
+        if not isinstance(alias, str) or not alias.strip():
+            raise ValueError(f"Invalid currency alias: '{alias}'")
+        if cls._frozen:
+            raise CurrencyRegistryFrozenError(alias)
+        currency = cls(code)
+        cls.aliases()  # Ensure predefined aliases are loaded
+        with cls._lock:
+            cls._alias_trie = cls._alias_trie.with_alias(CurrencyAlias(alias.strip(), currency.code, ambiguous))
+
+    @classmethod
+    def from_alias(cls, alias: str, allow_ambiguous: bool = True) -> Currency | None:
+        """
+        Get currency by alias, e.g., "€", "US$" or "RUR", ignoring case. Returns None if the alias is not known, or if
+        it is ambiguous (e.g., "$" or "kr") and allow_ambiguous is False.
+        """
+        if not isinstance(alias, str):
+            return None
+        entry = cls.aliases().get(alias)
+        if entry is None or (entry.ambiguous and not allow_ambiguous):
+            return None
+        return cls(entry.code)
+
+    @classmethod
+    def _resolve_alias(cls, alias) -> Currency | None:
+        """Resolve an unambiguous alias when a currency is requested by a string which is not a known code."""
+        return cls.from_alias(alias, allow_ambiguous=False)
+
+    @classmethod
+    def _countries_index(cls) -> tuple[Dict[str, tuple[str, ...]], Dict[str, tuple[str, ...]]]:
+        """Return the bidirectional country index, building it on first use. Once built, it is never modified."""
+        if (index := cls._country_index) is not None:
+            return index
+        with cls._lock:
+            if cls._country_index is None:
+                by_country, by_currency = {}, {}
+                for alpha2, country in load_countries().items():
+                    codes = tuple(country['currencies'])
+                    by_country[alpha2] = by_country[country['alpha3']] = codes
+                    for code in codes:
+                        by_currency.setdefault(code, []).append(alpha2)
+                cls._country_index = by_country, {code: tuple(alpha2s) for code, alpha2s in by_currency.items()}
+            return cls._country_index
+
+    @classmethod
+    def for_country(cls, country: str) -> Currency | None:
+        """
+        Get the primary currency of a country by its ISO 3166 alpha-2 or alpha-3 code, e.g., "SE" or "SWE".
+        Returns None for unknown countries and countries without a currency of their own, e.g., Antarctica.
+        """
+        if not isinstance(country, str):
+            return None
+        codes = cls._countries_index()[0].get(country.strip().upper())
+        return cls(codes[0]) if codes else None
+
+    @classmethod
+    def _historical(cls) -> HistoricalIndex:
+        """Return the index of currency validity intervals, building it on first use."""
+        if (index := cls._historical_index) is not None:
+            return index
+        with cls._lock:
+            if cls._historical_index is None:
+                cls._historical_index = HistoricalIndex(load_historical_currencies())
+            return cls._historical_index
+
+    @classmethod
+    def as_of(cls, code: str | Currency, day: datetime.date | str) -> Currency | None:
+        """
+        Get the currency a code referred to on a given day, including withdrawn currencies, e.g., DEM or VEF.
+        Withdrawn currencies are unique instances per validity interval, kept apart from the main registry,
+        so that Currency("DEM") still fails.
+        Arguments:
+            code: currency code or Currency
+            day: date, datetime or ISO formatted date string, e.g., "2001-05-03"
+        Returns:
+            Currency, or None if the code was not valid on that day
+        Raises:
+            CurrencyCodeInvalid, CurrencyNotFoundError if the code is neither current nor historical
+        """
+        if isinstance(code, Currency):
+            code = code.code
+        if not cls._is_valid_code(code):
+            raise CurrencyCodeInvalid(code)
+        code = code.upper().strip()
+        if isinstance(day, datetime.datetime):
+            day = day.date()
+        elif isinstance(day, str):
+            day = datetime.date.fromisoformat(day)
+
+        index = cls._historical()
+        if code not in index:
+            return cls(code)
+        if (interval := index.lookup(code, day)) is None:
+            return None
+        if interval.metadata is None:
+            return cls(code)
+
+        key = (code, interval.valid_from)
+        with cls._lock:
+            if (instance := cls._historical_registry.get(key)) is None:
+                instance = cls._create(code, interval.metadata)
+                instance._validity = interval
+                cls._historical_registry[key] = instance
+            return instance
+
+    @classmethod
+    def as_of_cache(cls) -> Callable[[str | Currency, datetime.date | str], Currency | None]:
+        """
+        Return a memoizing variant of Currency.as_of, to be used for one batch of records, e.g., a ledger file.
+        Rows from the same day resolve with a single dictionary lookup instead of an interval search.
+        The cache is not synchronized; use one per thread.
+        """
+        cache = {}
+
+        def as_of(code: str | Currency, day: datetime.date | str) -> Currency | None:
+            key = (code, day)
+            try:
+                return cache[key]
+            except KeyError:
+                result = cache[key] = cls.as_of(code, day)
+                return result
+
+        return as_of
+
     @classmethod
     def register(cls, code: str, numeric: int | None, sub_unit: int | None, name: str) -> Currency:
         """Register a new currency dynamically by adding metadata and relying on __new__."""
         if not cls._is_valid_code(code):
             raise CurrencyCodeInvalid(code)
         code = code.upper().strip()
+        if numeric is not None and cls._numeric_key(numeric) is None:
+            raise ValueError(f"Invalid numeric code: '{numeric}'")
+        if cls._frozen:
+            raise CurrencyRegistryFrozenError(code)
         instance = None
         do_save = False
+        if cls.strict_mode and numeric is not None:
+            cls._ensure_indexes()
         with cls._lock:
             # Prevent duplicates
             if cls._registry.get(code):
@@ -108,25 +500,33 @@ class Currency:
                     raise CurrencyExistsError(code)
                 else:
                     instance = cls._registry.get(code)
-            elif cls._resolve_metadata(code) is not None:
+            elif cls._lookup_metadata(code) is not None:
                 # Not registered, but known
                 if cls.strict_mode:
                     raise CurrencyExistsError(code)
             else:
                 # Not registered and not found - Add the new currency to the metadata source
-                _user_defined_currencies[code] = {
+                if cls.strict_mode and numeric is not None:
+                    if (owner := cls._numeric_index.get(int(numeric))) is not None:
+                        raise CurrencyNumericExistsError(numeric, owner)
+                user_metadata = cls._user_metadata()
+                user_metadata[code] = {
                     'numeric': numeric,
                     'sub_unit': sub_unit,
                     'name': name
                 }
-                do_save = True
+                cls._index_metadata(code, user_metadata[code])
+                user_data = dict(user_metadata)
+                do_save = cls._persistent
 
 
         # Process outside the lock
         if instance is None:
             if do_save:
-                # Save updated user_defined currencies
-                save_user_currencies(_user_defined_currencies)
+                # Save updated user_defined currencies, merging with records saved meanwhile by other processes
+                save_user_currencies(user_data, cls._user_file)
+                with cls._lock:
+                    cls._refresh_user_currencies(force=True)
             # Create a new currency instance using __new__
             instance = cls(code)
             # Assure that the newly registered currency is in the register
@@ -139,29 +539,65 @@ class Currency:
     @classmethod
     def get(cls, code: str) -> Currency | None:
         """Get currency instance or None if not registered"""
-        with cls._lock:
-            if code not in cls._registry:
-                return None
-            return cls._registry[code]
+        return cls._registry.get(code)
 
     @classmethod
-    def all_currencies(cls) -> Dict[str, Currency]:
-        """Return a snapshot of all known currencies, including dynamically registered ones."""
-        missing_codes = []
-        with cls._lock:
-            # Collect missing codes that are not yet instantiated
-            for source in (_predefined_currencies, _user_defined_currencies):
-                for code in source:
-                    if code not in cls._registry:
-                        missing_codes.append(code)
+    def all_currencies(cls) -> Mapping[str, Currency]:
+        """
+        Return a read-only snapshot of all known currencies, including dynamically registered ones.
+        The snapshot is shared until currencies are added, so that repeated calls neither lock nor copy.
+        For a frozen registry, a read-only view of the registry is returned.
+        """
+        if cls._frozen:
+            return cls._snapshot
+        if time.monotonic() - cls._user_file_checked_at >= cls.reload_interval:
+            with cls._lock:
+                cls._refresh_user_currencies()
+        if (snapshot := cls._snapshot) is not None:
+            return snapshot
 
-        # Instantiate missing currencies outside the lock
-        for code in missing_codes:
-            cls(code)  # This safely calls __new__, which uses the lock internally
+        while True:
+            with cls._lock:
+                # Collect missing codes that are not yet instantiated
+                missing_codes = [code for source in (_predefined_currencies, cls._user_metadata())
+                                 for code in source if code not in cls._registry]
+                if not missing_codes:
+                    cls._snapshot = MappingProxyType(cls._registry.copy())
+                    return cls._snapshot
 
+            # Instantiate missing currencies outside the lock
+            for code in missing_codes:
+                cls(code)  # This safely calls __new__, which uses the lock internally
+
+    @classmethod
+    def preload(cls) -> None:
+        """
+        Instantiate all known currencies and build all lazily built indexes (numeric codes, names, aliases,
+        countries, validity intervals), so that no lookup creates them later, e.g., in every forked worker.
+        """
+        cls.all_currencies()
+        cls._ensure_indexes()
+        cls.aliases()
+        cls._countries_index()
+        cls._historical()
+
+    @classmethod
+    def freeze(cls) -> None:
+        """
+        Preload the registry and make it read-only: lookups do not lock anymore, registering currencies or aliases
+        raises CurrencyRegistryFrozenError and the user currencies file is not checked for changes anymore.
+        Withdrawn currencies returned by Currency.as_of are still created on first use.
+        A frozen registry cannot be unfrozen; use Currency.new_registry() for a registry that needs to change.
+        """
+        cls.preload()
         with cls._lock:
-            # Return a copy of the fully populated registry
-            return cls._registry.copy()
+            cls._snapshot = MappingProxyType(cls._registry)
+            cls._frozen = True
+
+    @classmethod
+    def is_frozen(cls) -> bool:
+        """Return whether the registry was frozen by Currency.freeze()"""
+        return cls._frozen
 
     def __str__(self):
         return self.code
@@ -169,6 +605,19 @@ class Currency:
     def __repr__(self):
         return f"Currency(code='{self.code}', name='{self.name}', numeric='{self.numeric}', sub_unit='{self.sub_unit}')"
 
+    def __reduce__(self):
+        """
+        Pickle as the code only, so that unpickling, e.g., in a worker process, returns the unique instance of the
+        loading process and Money comparisons by identity keep working. Withdrawn currencies are restored with
+        Currency.as_of. Currencies of isolated registries are resolved with the registry active for Money in the
+        loading process, as registries are not shared between processes.
+        """
+        if self._validity is not None:
+            return _restore_currency, (self._code, self._validity.valid_from)
+        if type(self) is not Currency:
+            return _restore_registry_currency, (self._code,)
+        return Currency, (self._code,)
+
     def __hash__(self) -> int:
         """
         Make a Currency instance hashable to allow Currency objects to be used as keys in dictionaries,
@@ -182,3 +631,14 @@ class Currency:
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
+
+def _restore_currency(code: str, valid_from: datetime.date | None) -> Currency:
+    """Unpickle a withdrawn currency, see Currency.__reduce__"""
+    # An interval without a start date, e.g., of ATS, contains all days up to its end
+    return Currency.as_of(code, valid_from or datetime.date.min)
+
+
+def _restore_registry_currency(code: str) -> Currency:
+    """Unpickle a currency of an isolated registry with the active registry, see Currency.__reduce__"""
+    from simple_money_lib.utils.registry import RegistryManager  # Imported here, as it depends on this module
+    return RegistryManager().get()(code)
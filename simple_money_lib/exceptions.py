@@ -9,6 +9,13 @@ class CurrencyExistsError(ValueError):
         super().__init__(f"Currency with code '{code}' is already registered.")
         self.code = code
 
+class CurrencyNumericExistsError(ValueError):
+    """Raised in strict mode when registering a currency with a numeric code already used by another currency."""
+    def __init__(self, numeric: int, code: str):
+        super().__init__(f"Numeric code '{numeric}' is already used by currency '{code}'.")
+        self.numeric = numeric
+        self.code = code
+
 class CurrencyCodeInvalid(ValueError):
     """Raised when an invalid currency code is passed: not a string and less than 3 symbols"""
     def __init__(self, code: str):
@@ -24,6 +31,44 @@ class CurrencyNotFoundError(ValueError):
         )
         self.code = code
 
+class CurrencyRegistryFrozenError(RuntimeError):
+    """Raised when trying to register a currency or an alias in a frozen registry."""
+    def __init__(self, code: str):
+        super().__init__(f"Cannot register '{code}': the currency registry is frozen.")
+        self.code = code
+
+class CurrencyCollectionNotFoundError(ValueError):
+    """Raised when a currency collection is not found in collections metadata."""
+    def __init__(self, name: str, source: str):
+        super().__init__(f"Currency collection '{name}' not found in {source}.")
+        self.name = name
+
+class AccountExistsError(ValueError):
+    """Raised when trying to open an account that already exists in an AccountBook."""
+    def __init__(self, account):
+        super().__init__(f"Account '{account}' already exists.")
+        self.account = account
+
+class AccountNotFoundError(ValueError):
+    """Raised when an account is not found in an AccountBook."""
+    def __init__(self, account):
+        super().__init__(f"Account '{account}' not found.")
+        self.account = account
+
+class InsufficientFundsError(ValueError):
+    """Raised when a debit, transfer or hold would make the available balance of an account negative."""
+    def __init__(self, account, available, requested):
+        super().__init__(f"Insufficient funds on account '{account}': {requested} requested, {available} available.")
+        self.account = account
+        self.available = available
+        self.requested = requested
+
+class HoldNotFoundError(ValueError):
+    """Raised when a hold is not found in an AccountBook, e.g., because it was already committed or released."""
+    def __init__(self, hold_id: int):
+        super().__init__(f"Hold '{hold_id}' not found.")
+        self.hold_id = hold_id
+
 class CurrencyMismatch(TypeError):
     """Raised when trying to conduct operations on different currencies."""
     def __init__(self, message="Currencies must be the same for this operation"):
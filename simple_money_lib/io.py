@@ -0,0 +1,360 @@
+"""
+Reading money columns of files, e.g., CSV exports of payments or settlements, and parsing large files of money
+strings in parallel processes.
+"""
+from __future__ import annotations
+from array import array
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Iterator, NamedTuple, Sequence, TextIO
+import csv
+import decimal
+import multiprocessing.context
+import os
+import pickle
+
+from simple_money_lib.currency import Currency
+from simple_money_lib.money import Money
+from simple_money_lib.parsers.base_parser import BaseParser
+from simple_money_lib.parsers.parse_result import ParseResult, INVALID
+from simple_money_lib.utils import context as _context
+from simple_money_lib.utils.context import MoneyContext, get_context
+
+
+class MoneyRow(NamedTuple):
+    """A row of a CSV file read by read_csv_money()"""
+    line: int  # Line number in the file of the end of the row
+    moneys: tuple[Money, ...]  # Amounts of the money columns, in the order of the columns argument
+    row: list[str]  # All cells of the row
+
+
+class BadRow(NamedTuple):
+    """A row of a CSV file which could not be read by read_csv_money()"""
+    line: int
+    column: str | int  # The first money or currency column which could not be read
+    error: str
+    row: list[str]
+
+
+class MoneyColumns(NamedTuple):
+    """
+    Money columns of a CSV file read by read_csv_money(columnar=True): per column, an array of minor units and
+    an array of indexes into the table of currencies, e.g., the amount of the first row in column "amount" is
+    Money.from_minor_units(units["amount"][0], currencies[currency_indexes["amount"][0]]).
+    """
+    currencies: tuple[Currency, ...]
+    units: Dict[str | int, array]  # Signed 64-bit integers ('q')
+    currency_indexes: Dict[str | int, array]  # Unsigned 16-bit integers ('H')
+    lines: array  # Line numbers of the rows read ('Q')
+
+
+def read_csv_money(path: str | os.PathLike, columns: Sequence[str | int], currency: str | int | Currency | None = None,
+                   columnar: bool = False, bad_rows: list[BadRow] | None = None, header: bool | None = None,
+                   encoding: str = "utf-8", **fmtparams) -> Iterator[MoneyRow] | MoneyColumns:
+    """
+    Read money columns of a CSV file, e.g., an export of payments. The parser, rounding mode, default currency and
+    registry active for Money are resolved once per file, not per cell, when the function is called: the file is
+    opened and its header row checked then, not when the rows are first iterated.
+
+    Arguments:
+        path: path of the CSV file
+        columns: money columns, as names in the header row (the first row) or as indexes, e.g., ["amount", "fee"]
+        currency: where the currency of the amounts is read from:
+            - None: from the cells, e.g., "12.34 EUR", with the default currency for cells without one;
+            - a column name or index: from a column of currency codes, e.g., "currency";
+            - a Currency: the same currency for all cells, e.g., Currency("EUR").
+            A currency in a cell must then be the same as that of the column or the fixed currency.
+        columnar: whether to return the amounts as integer arrays of minor units (MoneyColumns), read at once,
+            instead of a generator of MoneyRow objects
+        bad_rows: list to append rows which could not be read to, e.g., with an invalid amount or an empty cell,
+            which are then skipped. By default, a ValueError is raised on the first one.
+        header: whether the first row is a header row; by default, if columns are given by name
+        encoding: encoding of the file
+        fmtparams: formatting parameters of csv.reader, e.g., delimiter=";"
+    Returns:
+        generator of MoneyRow objects, reading the file as it is consumed, or MoneyColumns if columnar is set
+    Raises:
+        ValueError
+
+    Example:
+        bad_rows = []
+        for line, (amount, fee), row in read_csv_money("payments.csv", ["amount", "fee"], currency="currency",
+                                                      bad_rows=bad_rows):
+            ...
+    """
+    if not columns:
+        raise ValueError("No money columns to read")
+    context = get_context()
+    file = open(path, encoding=encoding, newline="")
+    try:
+        reader = csv.reader(file, **fmtparams)
+        fixed_currency = currency if isinstance(currency, Currency) else None
+        currency_column = None if fixed_currency is not None else currency
+        names = [column for column in (*columns, currency_column) if isinstance(column, str)]
+        if header is None:
+            header = bool(names)
+        header_row = next(reader, []) if header else []
+        if missing := [column for column in names if column not in header_row]:
+            raise ValueError(f"Columns not found in the header of '{path}': {', '.join(missing)}")
+        positions = [header_row.index(column) if isinstance(column, str) else column for column in columns]
+        if isinstance(currency_column, str):
+            currency_column = header_row.index(currency_column)
+    except BaseException:
+        file.close()
+        raise
+    rows = _read_rows(file, reader, path, columns, positions, currency, currency_column, bad_rows, context)
+    return _columns(rows, columns, context.rounding) if columnar else _money_rows(rows, context.rounding)
+
+
+def _money_rows(rows: Iterator[tuple[int, list[tuple[decimal.Decimal, Currency]], list[str]]],
+                rounding: str | None) -> Iterator[MoneyRow]:
+    new = Money.__new__
+    for line, amounts, row in rows:
+        moneys = []
+        for amount, currency in amounts:
+            # As Money(amount, currency), without looking up the settings again
+            money = new(Money)
+            money.currency = currency
+            money.amount = money._quantize_amount(amount, rounding)
+            moneys.append(money)
+        yield MoneyRow(line, tuple(moneys), row)
+
+
+def _columns(rows: Iterator[tuple[int, list[tuple[decimal.Decimal, Currency]], list[str]]],
+             columns: Sequence[str | int], rounding: str | None) -> MoneyColumns:
+    currencies: Dict[Currency, int] = {}  # Currency -> index in the table of currencies
+    sub_units: list[int] = []
+    units = [array('q') for _ in columns]
+    indexes = [array('H') for _ in columns]
+    lines = array('Q')
+    for line, amounts, _ in rows:
+        lines.append(line)
+        for column_units, column_indexes, (amount, currency) in zip(units, indexes, amounts):
+            if (index := currencies.get(currency)) is None:
+                index = currencies[currency] = len(currencies)
+                sub_units.append(currency.sub_unit if currency.sub_unit is not None else Currency.default_sub_unit)
+            # As Money(amount, currency).minor_units
+            column_units.append(int(amount.scaleb(sub_units[index]).to_integral_value(rounding=rounding)))
+            column_indexes.append(index)
+    return MoneyColumns(tuple(currencies), dict(zip(columns, units)), dict(zip(columns, indexes)), lines)
+
+
+def _read_rows(file: TextIO, reader: Iterator[list[str]], path: str | os.PathLike, columns: Sequence[str | int],
+               positions: list[int], currency: str | int | Currency | None, currency_column: int | None,
+               bad_rows: list[BadRow] | None, context: MoneyContext
+               ) -> Iterator[tuple[int, list[tuple[decimal.Decimal, Currency]], list[str]]]:
+    """
+    Yield the line number, the amounts and currencies of the money columns, and the cells of each valid row
+    after the header, closing the file at the end
+    """
+    parse, registry, default_currency = context.parser.parse, context.registry, context.default_currency
+    fixed_currency = currency if isinstance(currency, Currency) else None
+    known: Dict[str, Currency] = {}  # Currency by code in the currency column or in cells
+
+    def resolve(code: str) -> Currency:
+        if (resolved := known.get(code)) is None:
+            resolved = known[code] = registry(code)
+        return resolved
+
+    with file:
+        for row in reader:
+            column = currency
+            try:
+                if currency_column is not None:
+                    row_currency = resolve(row[currency_column].strip())
+                else:
+                    row_currency = fixed_currency
+                amounts = []
+                for column, position in zip(columns, positions):
+                    amount, code = parse(row[position])
+                    if code is None:
+                        cell_currency = row_currency or default_currency
+                    else:
+                        cell_currency = resolve(code)
+                        if row_currency is not None and cell_currency != row_currency:
+                            raise ValueError(f"Currency {cell_currency.code} of the amount differs from "
+                                             f"{row_currency.code}: '{row[position]}'")
+                    amounts.append((amount, cell_currency))
+            except (ValueError, ArithmeticError, IndexError) as error:
+                if isinstance(error, IndexError):
+                    error = ValueError(f"Missing column {column!r}")
+                if bad_rows is None:
+                    raise ValueError(f"Line {reader.line_num} of '{path}': {error}") from error
+                bad_rows.append(BadRow(reader.line_num, column, str(error), row))
+                continue
+            yield reader.line_num, amounts, row
+
+
+class ChunkResult(NamedTuple):
+    """
+    Money strings of a chunk of a file parsed by parse_file_parallel(): totals per currency and, if requested,
+    the amounts of the parsed lines as integer arrays of minor units with indexes into the table of currencies.
+    """
+    offset: int  # Byte offset of the chunk in the file
+    lines: int  # Number of lines of the chunk, including blank and invalid ones
+    currencies: tuple[Currency, ...]
+    totals: Dict[Currency, int]  # Sum of the minor units of the parsed lines per currency
+    units: array | None  # Signed 64-bit integers ('q'), or None if arrays were not requested
+    currency_indexes: array | None  # Unsigned 16-bit integers ('H'), or None if arrays were not requested
+    errors: list[ParseResult]  # Invalid lines; position is the index of the line in the chunk
+
+
+def parse_file_parallel(path: str | os.PathLike, workers: int | None = None, chunk_size: int = 16 << 20,
+                        ordered: bool = True, arrays: bool = False, encoding: str = "utf-8",
+                        mp_context: multiprocessing.context.BaseContext | None = None) -> Iterator[ChunkResult]:
+    """
+    Parse a large file of money strings, one per line, e.g., "12.34 USD", in a pool of worker processes. The file is
+    split into chunks on line boundaries, and each chunk is parsed to minor units (see BaseParser.parse_minor_units())
+    in a worker, which sends back its totals per currency and, with arrays set, the minor units of each line.
+    The parser, rounding mode, default currency and registry active for Money are sent to each worker once,
+    where the registry and the parser tables are built before the first chunk, so that results are the same as
+    when parsing in one process. The parser must be picklable if processes are spawned rather than forked, and
+    an isolated registry (see Currency.new_registry()) can then not be sent to the workers: it is only supported
+    with forked processes. Workers send back currency codes, which are resolved in the calling process.
+
+    Arguments:
+        path: path of the file
+        workers: number of worker processes, by default the number of CPUs. With 1, chunks are parsed in
+            the calling process.
+        chunk_size: approximate size of the chunks in bytes
+        ordered: whether to yield the results in the order of the chunks in the file, or as they are completed
+        arrays: whether to send back the minor units and currencies of all lines, not only totals
+        encoding: encoding of the file, in which a line feed is a single byte, e.g., UTF-8 or Latin-1
+        mp_context: multiprocessing context of the pool, e.g., multiprocessing.get_context("spawn")
+    Returns:
+        generator of a ChunkResult per chunk; at most twice as many chunks as workers are parsed ahead
+    Raises:
+        ValueError
+
+    Example:
+        totals = collections.Counter()
+        for result in parse_file_parallel("settlements.txt", workers=8, ordered=False):
+            totals.update(result.totals)
+            rejected += len(result.errors)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or chunk_size < 1:
+        raise ValueError(f"Invalid number of workers or chunk size: {workers}, {chunk_size}")
+    chunks = _chunk_bounds(path, chunk_size)
+    context = get_context()
+    settings = context.parser, context.rounding, context.default_currency, context.registry
+    resolve = _resolver(context)
+    if workers == 1:
+        return (_chunk_result(_parse_chunk(path, start, end, arrays, encoding), resolve) for start, end in chunks)
+    if mp_context is None:
+        mp_context = multiprocessing.get_context()
+    if mp_context.get_start_method() != "fork":
+        # Initialization arguments are pickled for spawned processes, but not for forked ones
+        try:
+            pickle.dumps(settings)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            raise ValueError(f"The parser and currency settings cannot be sent to {mp_context.get_start_method()} "
+                             f"worker processes, e.g., with an isolated registry; use forked processes: {error}"
+                             ) from error
+    return _parse_in_pool(path, chunks, workers, ordered, arrays, encoding, mp_context, settings, resolve)
+
+
+def _parse_in_pool(path: str | os.PathLike, chunks: Iterator[tuple[int, int]], workers: int, ordered: bool,
+                   arrays: bool, encoding: str, mp_context: multiprocessing.context.BaseContext, settings: tuple,
+                   resolve: Callable[[str], Currency]) -> Iterator[ChunkResult]:
+    with ProcessPoolExecutor(workers, mp_context, initializer=_init_worker, initargs=settings) as executor:
+        pending: deque[Future] = deque()
+        for start, end in chunks:
+            pending.append(executor.submit(_parse_chunk, path, start, end, arrays, encoding))
+            if len(pending) >= 2 * workers:
+                yield _chunk_result(_next_result(pending, ordered), resolve)
+        while pending:
+            yield _chunk_result(_next_result(pending, ordered), resolve)
+
+
+def _next_result(pending: deque[Future], ordered: bool) -> ChunkResult:
+    """Remove and return the result of the first pending chunk, or of the first completed one"""
+    if ordered:
+        return pending.popleft().result()
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    future = next(future for future in pending if future in done)
+    pending.remove(future)
+    return future.result()
+
+
+def _resolver(context: MoneyContext) -> Callable[[str], Currency]:
+    """
+    Return a function resolving the currency codes sent back by workers in the calling process, as the parser
+    resolves them, so that currencies of isolated registries are not unpickled where another registry is active
+    """
+    registry = getattr(context.parser, "registry", None) or context.registry
+    known: Dict[str, Currency] = {context.default_currency.code: context.default_currency}
+
+    def resolve(code: str) -> Currency:
+        if (currency := known.get(code)) is None:
+            currency = known[code] = registry(code)
+        return currency
+    return resolve
+
+
+def _chunk_result(result: ChunkResult, resolve: Callable[[str], Currency]) -> ChunkResult:
+    """Replace the currency codes of a chunk parsed by _parse_chunk() with currencies"""
+    currencies = tuple(map(resolve, result.currencies))
+    return result._replace(currencies=currencies, totals=dict(zip(currencies, result.totals.values())))
+
+
+def _init_worker(parser: BaseParser, rounding: str | None, default_currency: Currency,
+                 registry: type[Currency]) -> None:
+    """Apply the settings of the parent process in a worker process and build the registry and parser tables"""
+    _context.set_defaults(parser=parser, rounding=rounding, default_currency=default_currency, registry=registry)
+    _context.set_local(parser=None, rounding=None, default_currency=None, registry=None)  # Inherited when forked
+    registry.preload()
+    if prepare := getattr(parser, "prepare", None):
+        prepare()
+
+
+def _chunk_bounds(path: str | os.PathLike, chunk_size: int) -> Iterator[tuple[int, int]]:
+    """Yield the start and end byte offsets of chunks of about chunk_size bytes, ending after a line feed"""
+    size = os.path.getsize(path)
+    with open(path, "rb") as file:
+        start = 0
+        while start < size:
+            if start + chunk_size >= size:
+                end = size
+            else:
+                file.seek(start + chunk_size - 1)
+                file.readline()
+                end = file.tell()
+            yield start, end
+            start = end
+
+
+def _parse_chunk(path: str | os.PathLike, start: int, end: int, arrays: bool, encoding: str) -> ChunkResult:
+    """
+    Parse the lines of a chunk of a file with the parser and rounding mode of the current context. Currencies and
+    the keys of totals are currency codes, see _chunk_result().
+    """
+    with open(path, "rb") as file:
+        file.seek(start)
+        lines = file.read(end - start).decode(encoding).split("\n")
+    if lines[-1] == "":
+        lines.pop()  # After the last line feed
+
+    parse_minor_units = get_context().parser.parse_minor_units
+    currencies: Dict[str, int] = {}  # Currency code -> index in the table of currencies
+    totals: list[int] = []
+    units = array('q') if arrays else None
+    indexes = array('H') if arrays else None
+    errors = []
+    for position, line in enumerate(lines):
+        if not line or line.isspace():
+            continue
+        try:
+            value, currency = parse_minor_units(line)
+        except (ValueError, ArithmeticError) as error:
+            errors.append(ParseResult(position, line, error=INVALID, exception=error))
+            continue
+        if (index := currencies.get(currency.code)) is None:
+            index = currencies[currency.code] = len(currencies)
+            totals.append(0)
+        totals[index] += value
+        if arrays:
+            units.append(value)
+            indexes.append(index)
+    return ChunkResult(start, len(lines), tuple(currencies), dict(zip(currencies, totals)), units, indexes, errors)
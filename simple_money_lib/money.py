@@ -11,16 +11,22 @@ from simple_money_lib.exceptions import CurrencyMismatch, MoneyDivisionIllegal,
 from simple_money_lib.parsers import ParserManager as _ParserManager
 from simple_money_lib.utils.rounding import RoundingManager as _RoundingManager
 from simple_money_lib.utils.default_currency import DefaultCurrency as _DefaultCurrency
+from simple_money_lib.utils.registry import RegistryManager as _RegistryManager
+from simple_money_lib.utils.context import get_context as _get_context
 
 # Constants
 _NUMERIC_TYPES = (int, float, Decimal)  # Permitted numeric types for operations
 
+# Quantization exponents by number of decimal digits, e.g., 2 -> Decimal("0.00"), filled on first use
+_QUANTIZERS: dict[int, Decimal] = {}
+
 class Money:
 
     # Class variables for additional functionality
     rounding = _RoundingManager()
     parser = _ParserManager()
     default_currency = _DefaultCurrency()
+    registry = _RegistryManager()
 
     @overload
     def __init__(self, money_string: str) -> None:
@@ -38,42 +44,48 @@ class Money:
 
         # Dev note: always initialize self.currency first, as amount initialization requires self.currency to be set
 
+        # Rounding, parser, default currency and registry are looked up at once, see simple_money_lib.utils.context
+        context = _get_context()
+
         match args, kwargs:
             # Case: Positional amount and currency
             case (amount, currency), {}:
-                self.currency = self._validate_currency(currency)
-                self.amount = self._validate_amount(amount)
+                self.currency = self._validate_currency(currency, context.registry)
+                self.amount = self._validate_amount(amount, context.rounding)
 
             # Case: Named amount and currency
             case (), {"amount": amount, "currency": currency}:
-                self.currency = self._validate_currency(currency)
-                self.amount = self._validate_amount(amount)
+                self.currency = self._validate_currency(currency, context.registry)
+                self.amount = self._validate_amount(amount, context.rounding)
                 kwargs.pop("amount", None)
                 kwargs.pop("currency", None)
 
             # Case: Named amount only, with default currency
             case (), {"amount": amount}:
-                self.currency = self.default_currency.get()
-                self.amount = self._validate_amount(amount)
+                self.currency = context.default_currency
+                self.amount = self._validate_amount(amount, context.rounding)
                 kwargs.pop("amount", None)
 
             # Case: Named currency only, with default amount
             case (amount,), {"currency": currency}:
-                self.currency = self._validate_currency(currency)
-                self.amount = self._validate_amount(amount)
+                self.currency = self._validate_currency(currency, context.registry)
+                self.amount = self._validate_amount(amount, context.rounding)
                 kwargs.pop("currency", None)
 
             # Case: Single string positional argument (e.g., "100 USD")
             case (money_string, ), {} if isinstance(money_string, str):
-                parser = self.parser.get()
-                parsed_amount, parsed_currency = parser.parse(money_string)
-                self.currency = Currency(parsed_currency) if parsed_currency else self.default_currency.get()
-                self.amount = self._validate_amount(parsed_amount)
+                parsed_amount, parsed_currency = context.parser.parse(money_string)
+                if parsed_currency:
+                    # Resolved with the registry of the parser, if bound to one, e.g., BaseParser(registry=tenant)
+                    self.currency = (getattr(context.parser, "registry", None) or context.registry)(parsed_currency)
+                else:
+                    self.currency = context.default_currency
+                self.amount = self._validate_amount(parsed_amount, context.rounding)
 
             # Case: Positional amount only, with default currency
             case (amount, ), {}:
-                self.currency = self.default_currency.get()
-                self.amount = self._validate_amount(amount)
+                self.currency = context.default_currency
+                self.amount = self._validate_amount(amount, context.rounding)
 
             # Error: Too many positional arguments
             case _ if len(args) > 2:
@@ -87,17 +99,17 @@ class Money:
         if kwargs:
             raise TypeError(f"Unexpected keyword arguments: {', '.join(kwargs.keys())}")
 
-    @staticmethod
-    def _validate_currency(currency: str | Currency):
-        """Validate and return a Currency instance."""
+    @classmethod
+    def _validate_currency(cls, currency: str | Currency, registry: type[Currency] | None = None):
+        """Validate and return a Currency instance, resolving codes with the given or the active registry."""
         if isinstance(currency, Currency):
             return currency
         elif isinstance(currency, str):
-            return Currency(currency)
+            return (registry or cls.registry.get())(currency)
         else:
             raise TypeError("'currency' must be a Currency instance or a valid currency code string")
 
-    def _validate_amount(self, amount: Decimal | int | float | str) -> Decimal:
+    def _validate_amount(self, amount: Decimal | int | float | str, rounding: str | None = None) -> Decimal:
         """Ensure amount is a valid Decimal and format it based on currency subunits."""
         try:
             # Convert all acceptable types to Decimal directly
@@ -106,17 +118,29 @@ class Money:
         except (decimal.InvalidOperation, ValueError, TypeError):
             raise ValueError("'amount' must be a Decimal, int, float, or str representing a valid numeric value.")
 
-        return self._quantize_amount(amount)
+        return self._quantize_amount(amount, rounding)
+
+    @property
+    def minor_units(self) -> int:
+        """Amount as an integer number of minor units of the currency, e.g., 1234 for 12.34 USD"""
+        return int(self.amount.scaleb(self._get_currency_subunit()))
+
+    @classmethod
+    def from_minor_units(cls, units: int, currency: Currency | str) -> "Money":
+        """Create a Money object from an integer number of minor units, e.g., Money.from_minor_units(1234, "USD")"""
+        currency = cls._validate_currency(currency)
+        sub_unit = currency.sub_unit if currency.sub_unit is not None else Currency.default_sub_unit
+        return cls(Decimal(units).scaleb(-sub_unit), currency)
 
     def _get_currency_subunit(self) -> int:
         return self.currency.sub_unit if self.currency.sub_unit is not None else Currency.default_sub_unit
 
-    def _quantize_amount(self, amount: Decimal) -> Decimal:
+    def _quantize_amount(self, amount: Decimal, rounding: str | None = None) -> Decimal:
         """Quantize (ensure number of decimal digits) the amount respecting currency subunits and rounding rules"""
-        return amount.quantize(
-            Decimal("0." + "0" * self._get_currency_subunit()),
-            rounding=Money.rounding.get()
-        )
+        sub_unit = self._get_currency_subunit()
+        if (quantizer := _QUANTIZERS.get(sub_unit)) is None:
+            quantizer = _QUANTIZERS[sub_unit] = Decimal("0." + "0" * sub_unit)
+        return amount.quantize(quantizer, rounding=rounding or Money.rounding.get())
 
     def __str__(self):
         return f"{self.amount:.{self._get_currency_subunit()}f} {self.currency}"
@@ -124,6 +148,19 @@ class Money:
     def __repr__(self):
         return f"Money(amount={self.amount:.{self._get_currency_subunit()}f}, currency='{self.currency}')"
 
+    def __reduce__(self):
+        """
+        Pickle compactly as the amount in minor units and the currency, which is unpickled as the unique instance
+        of the loading process (see Currency.__reduce__). Amounts which are not a whole number of minor units are
+        pickled as a decimal tuple. Attributes added by subclasses are not included.
+        """
+        exponent = self.amount.as_tuple().exponent
+        if exponent == -self._get_currency_subunit():
+            amount = int(self.amount.scaleb(-exponent))
+        else:
+            amount = tuple(self.amount.as_tuple())
+        return _restore_money, (self.__class__, amount, self.currency)
+
     def __hash__(self) -> int:
         """
         Make a Money instance hashable to allow Money objects to be used as keys in dictionaries,
@@ -380,3 +417,16 @@ class Money:
         print 'amount' in Money(100, 'EUR')  # True
         """
         return key in self.keys()
+
+
+def _restore_money(cls: type[Money], amount: int | tuple, currency: Currency) -> Money:
+    """Unpickle Money without validating it again, see Money.__reduce__"""
+    money = cls.__new__(cls)
+    money.currency = currency
+    if isinstance(amount, int):
+        amount = Decimal(amount).scaleb(-(currency.sub_unit if currency.sub_unit is not None
+                                          else Currency.default_sub_unit))
+    else:
+        amount = Decimal(amount)
+    money.amount = amount
+    return money
@@ -1,2 +1,8 @@
 from simple_money_lib.parsers.parser_manager import ParserManager
-from simple_money_lib.parsers.base_parser import BaseParser, SimpleParserWithSubstitutions
+from simple_money_lib.parsers.parse_result import ParseResult
+from simple_money_lib.parsers.base_parser import BaseParser, SimpleParserWithSubstitutions, SimpleParserWithAliases
+from simple_money_lib.parsers.complex_parser import ComplexMoneyParser
+from simple_money_lib.parsers.learning_parser import LearningParser
+from simple_money_lib.parsers.cached_parser import CachedParser
+from simple_money_lib.parsers.money_scanner import MoneyScanner, MoneyMatch, find_money, iter_money
+from simple_money_lib.parsers.parser_pipeline import ParserPipeline
@@ -1,7 +1,53 @@
+from typing import Hashable, Iterable, Iterator, Mapping
 import decimal
 import re
+import unicodedata
+import weakref
 
 from simple_money_lib import Currency
+from simple_money_lib.utils.currency_matcher import CurrencyMatcher
+from simple_money_lib.utils.registry import RegistryManager
+from simple_money_lib.utils.context import get_context
+from simple_money_lib.parsers.parse_result import (ParseResult, EMPTY, NOT_A_STRING, INVALID_AMOUNT, UNKNOWN_CURRENCY,
+                                                   INVALID)
+
+_AMOUNT_PATTERN = re.compile(r"(-?)(\d+)(?:\.(\d+))?")
+# An amount of the format of BaseParser next to a word, e.g., "5 XYZ"
+_UNKNOWN_CURRENCY_PATTERN = re.compile(r"[^\W\d_]+\s*-?\d+(?:\.\d+)?|-?\d+(?:\.\d+)?\s*[^\W\d_]+")
+# Parsers with a _lock attribute, whose locks are replaced in forked child processes, see preload.py
+_parsers_with_locks: weakref.WeakSet = weakref.WeakSet()
+
+
+def _ascii_digits(digits: str) -> str:
+    """Return decimal digits of any script matched by \\d, e.g., Arabic-Indic ones, as ASCII digits"""
+    return digits if digits.isascii() else "".join(str(unicodedata.decimal(char)) for char in digits)
+
+
+def _round_units(units: int, dropped: str, negative: bool, rounding: str) -> int:
+    """
+    Round a non-negative number of minor units, followed by the dropped digits, as Decimal.quantize does
+    with the rounding mode, e.g., _round_units(1234, "5", False, decimal.ROUND_HALF_UP) == 1235
+    """
+    first, rest = dropped[0], dropped[1:].strip("0")
+    if rounding == decimal.ROUND_DOWN:
+        increment = False
+    elif rounding == decimal.ROUND_UP:
+        increment = True
+    elif rounding == decimal.ROUND_CEILING:
+        increment = not negative
+    elif rounding == decimal.ROUND_FLOOR:
+        increment = negative
+    elif rounding == decimal.ROUND_HALF_UP:
+        increment = first >= "5"
+    elif rounding == decimal.ROUND_HALF_DOWN:
+        increment = first > "5" or (first == "5" and bool(rest))
+    elif rounding == decimal.ROUND_HALF_EVEN:
+        increment = first > "5" or (first == "5" and (bool(rest) or units % 2 == 1))
+    elif rounding == decimal.ROUND_05UP:
+        increment = units % 5 == 0
+    else:
+        raise ValueError(f"Unknown rounding mode: '{rounding}'")
+    return units + 1 if increment else units
 
 
 class BaseParser:
@@ -9,6 +55,49 @@ class BaseParser:
     Base class for money parser. In addition to being the base, it also provides the baseline functionality.
     It is capable of converting a simpler string to a tuple of a decimal and a valid currency code
     """
+    def __init__(self, registry: type[Currency] | None = None):
+        """
+        Args:
+            registry: currency registry to resolve codes with, e.g., one created with Currency.new_registry().
+                By default, the registry active for Money (Money.registry) is used.
+        """
+        self.registry = registry
+        # Compiled currency matcher, with the registry and its snapshot it was built from
+        self._matcher_table: tuple[type[Currency], Mapping[str, Currency], CurrencyMatcher] | None = None
+
+    def _registry(self) -> type[Currency]:
+        # Subclasses overriding __init__ without calling it have no registry attribute
+        return getattr(self, "registry", None) or RegistryManager().get()
+
+    def __getstate__(self) -> dict:
+        # Pickled without the matcher, which is built again in the loading process, e.g., a worker process
+        state = self.__dict__.copy()
+        state['_matcher_table'] = None
+        return state
+
+    def _matcher(self) -> CurrencyMatcher:
+        """Return the matcher of the known currency codes, building it again only when the registry changed"""
+        registry = self._registry()
+        currencies = registry.all_currencies()
+        table = getattr(self, "_matcher_table", None)
+        if table is None or table[0] is not registry or table[1] is not currencies:
+            table = self._matcher_table = registry, currencies, CurrencyMatcher(currencies)
+        return table[2]
+
+    def prepare(self) -> None:
+        """
+        Build the tables used for parsing ahead of the first parse, e.g., before forking worker processes.
+        See simple_money_lib.preload().
+        """
+        self._matcher()
+
+    def cache_key(self) -> Hashable:
+        """
+        Return a value which changes whenever the configuration of the parser or the currency registry changes,
+        so that a result of parse() can be reused for the same string and cache key. See CachedParser.
+        """
+        return self._matcher()  # Rebuilt whenever the registry changes
+
     def parse(self, money_string: str) -> tuple[decimal.Decimal, str | None]:
         """
         This parser implements parsing of simple strings representing Money, without complex formatting.
@@ -22,41 +111,199 @@ class BaseParser:
             ValueError
         """
         money_string = money_string.strip()
+        currency, amount_str = self._split(money_string)
+        return self._parse_amount(amount_str, money_string), currency.code if currency else None
 
-        if code := self.match_currency(money_string):
-            # Case-insensitive replace
-            amount_str = re.sub(re.escape(code), "", money_string, count=1, flags=re.IGNORECASE).strip()
-        else:
-            amount_str = money_string
+    def parse_minor_units(self, money_string: str, strict: bool = False) -> tuple[int, Currency]:
+        """
+        Parse a money string directly to an integer number of minor units and its currency, e.g., for integer or
+        columnar storage: "12.34 USD" -> (1234, Currency("USD")). Strings without a currency are in the default
+        currency (Money.default_currency). Digits beyond the sub-unit of the currency are rounded with the active
+        rounding mode (Money.rounding), as by Money, unless strict is set.
+        Strings of the format of BaseParser are scanned without constructing a Decimal; subclasses parsing other
+        formats convert the result of their parse().
+        Arguments:
+            money_string: a string representing amount and (optionally) currency: "EUR 567.89"
+            strict: whether to raise a ValueError for digits beyond the sub-unit instead of rounding them
+        Returns:
+            tuple of an integer and a Currency: (56789, Currency("EUR"))
+        Raises:
+            ValueError
+        """
+        context = get_context()
+        if type(self).parse is not BaseParser.parse:
+            amount, code = self.parse(money_string)
+            currency = self._registry()(code) if code else context.default_currency
+            units = amount.scaleb(currency.sub_unit)
+            integral = units.to_integral_value(rounding=decimal.ROUND_DOWN)
+            if units != integral:
+                if strict:
+                    raise ValueError(f"Amount has more decimals than {currency.code} allows: '{money_string}'")
+                integral = units.to_integral_value(rounding=context.rounding or decimal.getcontext().rounding)
+            return int(integral), currency
+
+        currency, amount_str = self._split(money_string.strip())
+        currency = currency or context.default_currency
+        if not (amount := _AMOUNT_PATTERN.fullmatch(amount_str)):
+            raise ValueError(f"Invalid monetary amount: '{amount_str}'")
+        sign, integer, fraction = amount.groups()
+        fraction = fraction or ""
+        if not amount_str.isascii():  # Digits are compared and stripped as ASCII characters
+            integer, fraction = _ascii_digits(integer), _ascii_digits(fraction)
+
+        sub_unit = currency.sub_unit
+        units = int(integer + fraction[:sub_unit].ljust(sub_unit, "0"))
+        if (dropped := fraction[sub_unit:]) and dropped.strip("0"):
+            if strict:
+                raise ValueError(f"Amount has more decimals than {currency.code} allows: '{money_string}'")
+            units = _round_units(units, dropped, bool(sign), context.rounding or decimal.getcontext().rounding)
+        return -units if sign else units, currency
+
+    def _own_format(self) -> bool:
+        """Whether the parser reads the format of BaseParser, which can be scanned without parse()"""
+        return type(self).parse is BaseParser.parse
+
+    def _split(self, money_string: str) -> tuple[Currency | None, str]:
+        """Return the currency matched at either end of a stripped string, or None, and the rest of the string"""
+        if match := self._matcher().match(money_string):
+            currency, start, end = match
+            return currency, (money_string[:start] + money_string[end:]).strip()
+        return None, money_string
+
+    def is_valid(self, money_string: str) -> bool:
+        """
+        Return whether the string can be parsed, without raising. For the format of BaseParser, only the syntax
+        is checked, without constructing a Decimal.
+        """
+        if not isinstance(money_string, str):
+            return False
+        if self._own_format():
+            return _AMOUNT_PATTERN.fullmatch(self._split(money_string.strip())[1]) is not None
+        try:
+            self.parse(money_string)
+        except (ValueError, ArithmeticError):
+            return False
+        return True
+
+    def parse_many(self, money_strings: Iterable[str]) -> Iterator[ParseResult]:
+        """
+        Parse strings in bulk without raising: yield a ParseResult per string, with its position, the amount and
+        currency, or an error code, e.g., for feeds with many invalid rows. Error messages are only formatted
+        when read. Strings without a currency are in the default currency (Money.default_currency).
+
+        Example:
+            for result in parser.parse_many(column):
+                if result.ok:
+                    amounts.append(Money(result.amount, result.currency))
+                else:
+                    rejected[result.position] = result.error
+        """
+        default_currency = get_context().default_currency
+        own_format = self._own_format()
+        for position, money_string in enumerate(money_strings):
+            if not isinstance(money_string, str):
+                yield ParseResult(position, money_string, error=NOT_A_STRING)
+                continue
+            if own_format:
+                stripped = money_string.strip()
+                if not stripped:
+                    yield ParseResult(position, money_string, error=EMPTY)
+                    continue
+                currency, amount_str = self._split(stripped)
+                if _AMOUNT_PATTERN.fullmatch(amount_str):
+                    yield ParseResult(position, money_string, decimal.Decimal(amount_str), currency or default_currency)
+                elif currency is None and _UNKNOWN_CURRENCY_PATTERN.fullmatch(amount_str):
+                    yield ParseResult(position, money_string, error=UNKNOWN_CURRENCY)
+                else:
+                    yield ParseResult(position, money_string, error=INVALID_AMOUNT)
+                continue
+            try:
+                amount, code = self.parse(money_string)
+                currency = self._registry()(code) if code else default_currency
+            except (ValueError, ArithmeticError) as error:
+                yield ParseResult(position, money_string, error=INVALID, exception=error)
+            else:
+                yield ParseResult(position, money_string, amount, currency)
 
+    @staticmethod
+    def _parse_amount(amount_str: str, money_string: str) -> decimal.Decimal:
+        """Convert the amount part of a money string to a decimal. Raises ValueError if it is not a plain number."""
         # Check for invalid patterns
         if not re.match(r"^-?\d+(\.\d+)?$", amount_str):
             raise ValueError(f"Invalid monetary amount: '{amount_str}'")
 
         try:
-            amount_decimal = decimal.Decimal(amount_str)
+            return decimal.Decimal(amount_str)
         except decimal.InvalidOperation:
             raise ValueError(f"Unable to convert amount: {money_string}")
-        return amount_decimal, code
 
-    @staticmethod
-    def match_currency(money_string: str) -> str | None:
-        money_string = money_string.upper()
-        known_currencies = sorted(Currency.all_currencies().keys(), key=len, reverse=True)
-        # Iterate to find the longest match
-        for code in known_currencies:
-            if code[-1].isdigit():  # Currency ends with a digit
-                # Check if it starts with the code + space, or ends with the code
-                if money_string.startswith(f"{code} ") or money_string.endswith(code):
-                    return code
-            else:  # Standard matching
-                if money_string.startswith(code) or money_string.endswith(code):
-                    return code
+    def match_currency(self, money_string: str) -> Currency | None:
+        """
+        Return the currency of the longest code at the beginning or at the end of the string, or None.
+        A code ending with a digit only matches at the beginning if followed by a space.
+        """
+        if match := self._matcher().match(money_string.strip()):
+            return match[0]
         return None
 
 
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Return a regex matching the longest of the words, shaped as a trie of them, e.g., "kr(?:\\.)?|\\$", so that
+    matching at a position does not try each word in turn
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # End of a word
+
+    def pattern(node: dict) -> str:
+        branches = [re.escape(char) + pattern(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        group = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:  # A word ends here, matched only if no longer word does
+            return f"(?:{group})?"
+        return group
+
+    return pattern(trie)
+
+
+class _CompiledSubstitutions:
+    """
+    Substitutions compiled into a single pass over the string: str.translate if all old values are single
+    characters, otherwise one regex with a lookup of the new value. The regex has the shape of a trie of the old
+    values (see _trie_pattern), so that the longest old value wins.
+    Immutable, so that it can be shared between threads.
+    """
+    __slots__ = ('_apply',)
+
+    def __init__(self, substitutions: Mapping[str, str]):
+        table = {}
+        for old_value, new_value in substitutions.items():
+            if not old_value:
+                continue
+            # Add a trailing space if the new value ends with a digit
+            if new_value and new_value[-1].isdigit():
+                new_value = new_value + " "
+            table[old_value] = new_value
+
+        if all(len(old_value) == 1 for old_value in table):
+            translation = str.maketrans(table)
+            self._apply = lambda text: text.translate(translation)
+        else:
+            pattern = re.compile(_trie_pattern(table))
+            lookup = table.__getitem__
+            self._apply = lambda text: pattern.sub(lambda match: lookup(match.group()), text)
+
+    def __call__(self, text: str) -> str:
+        return self._apply(text)
+
+
 class SimpleParserWithSubstitutions(BaseParser):
-    def __init__(self, substitutions: dict = None):
+    def __init__(self, substitutions: dict = None, registry: type[Currency] | None = None):
         """
         A parser that extends SimpleMoneyParser by allowing value substitutions in the input string.
 
@@ -64,6 +311,8 @@ class SimpleParserWithSubstitutions(BaseParser):
             substitutions (dict): A dictionary of old_value : new_value pairs.
                 For example, {"$": "USD", ",": "."} will replace all occurrences of '$' with 'USD'
                 and all commas with dots. If no substitutions are provided, the parser behaves like SimpleMoneyParser.
+                All substitutions are made in a single pass, longest old value first; new values are not
+                substituted again. The substitutions are compiled when set: assign a new dictionary to change them.
 
         Comparison example:
             parser = SimpleMoneyParser()
@@ -79,16 +328,78 @@ class SimpleParserWithSubstitutions(BaseParser):
             print(result)  # (Decimal('1250.50'), 'EUR')
         """
         self.substitutions = substitutions
-        super().__init__()  # Ensure the parent class is initialized
+        super().__init__(registry)  # Ensure the parent class is initialized
+
+    @property
+    def substitutions(self) -> dict | None:
+        return self._substitutions
+
+    @substitutions.setter
+    def substitutions(self, substitutions: dict | None) -> None:
+        self._substitutions = substitutions
+        self._compiled = _CompiledSubstitutions(substitutions) if substitutions else None
+
+    def cache_key(self) -> Hashable:
+        return super().cache_key(), self._compiled  # Compiled again whenever the substitutions are set
+
+    def __getstate__(self) -> dict:
+        state = super().__getstate__()
+        del state['_compiled']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.substitutions = self._substitutions  # Compiled again
 
     def parse(self, money_string: str) -> tuple[decimal.Decimal, str | None]:
-        if self.substitutions:
-            # Sorted by length: longest first - to make sure that 'old1' is processed before 'old'
-            sorted_substitutions = sorted(self.substitutions.items(), key=lambda item: len(item[0]), reverse=True)
-            for old_value, new_value in sorted_substitutions:
-                # Add a trailing space if the new value ends with a digit
-                if new_value and new_value[-1].isdigit():
-                    new_value = new_value + " "
-                money_string = re.sub(re.escape(old_value), new_value, money_string)
+        if compiled := self._compiled:
+            money_string = compiled(money_string)
         # Delegate parsing to the parent class
         return super().parse(money_string)
+
+
+class SimpleParserWithAliases(BaseParser):
+    def __init__(self, allow_ambiguous: bool = True, registry: type[Currency] | None = None):
+        """
+        A parser that extends BaseParser by recognizing currency aliases from the registry-level alias table
+        (see Currency.aliases()): symbols, alternative spellings and legacy codes, e.g., "€", "US$", "kr" or "RUR".
+        The longest alias at the start or at the end of the string is found in a single pass, without rewriting it.
+
+        Args:
+            allow_ambiguous (bool): Whether aliases shared by several currencies, e.g., "$" or "kr", are accepted
+                and resolved to their default currency. If False, such strings raise a ValueError.
+
+        Example:
+            parser = SimpleParserWithAliases()
+            print(parser.parse("€567.89"))  # (Decimal('567.89'), 'EUR')
+            print(parser.parse("1250 kr"))  # (Decimal('1250'), 'SEK')
+        """
+        self.allow_ambiguous = allow_ambiguous
+        super().__init__(registry)
+
+    def parse(self, money_string: str) -> tuple[decimal.Decimal, str | None]:
+        money_string = money_string.strip()
+        # Currency codes take precedence over aliases
+        if self.match_currency(money_string):
+            return super().parse(money_string)
+
+        aliases = self._registry().aliases()
+        if match := aliases.longest_prefix(money_string):
+            alias, end = match
+            amount_str = money_string[end:]
+        elif match := aliases.longest_suffix(money_string):
+            alias, start = match
+            amount_str = money_string[:start]
+        else:
+            return super().parse(money_string)
+
+        if alias.ambiguous and not self.allow_ambiguous:
+            raise ValueError(f"Ambiguous currency alias: '{alias.alias}'")
+        return self._parse_amount(amount_str.strip(), money_string), alias.code
+
+    def prepare(self) -> None:
+        super().prepare()
+        self._registry().aliases()
+
+    def cache_key(self) -> Hashable:
+        return super().cache_key(), self.allow_ambiguous, self._registry().aliases()  # Replaced on changes
@@ -0,0 +1,101 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Hashable, NamedTuple
+import decimal
+import threading
+
+from simple_money_lib.parsers.base_parser import BaseParser, _parsers_with_locks
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CachedParser:
+    """
+    Parser wrapper keeping the results of the most recently parsed strings, for feeds repeating a small set of money
+    strings, e.g., "0.00 EUR" or fixed fees. Results are keyed by the string and by the cache_key() of the wrapped
+    parser, which changes with its configuration and with the currency registry, so that entries parsed before
+    a change are not returned afterward. Strings failing to parse are not cached.
+    Safe to share between threads.
+
+    Example:
+        parser = CachedParser(SimpleParserWithAliases(), maxsize=1024)
+        Money.parser.set_default(parser)
+        ...
+        print(parser.cache_info())  # CacheInfo(hits=99000, misses=1000, maxsize=1024, currsize=1000)
+    """
+
+    def __init__(self, parser: BaseParser, maxsize: int = 1024):
+        """
+        Args:
+            parser: the parser to cache results of
+            maxsize: maximum number of cached results; least recently used ones are dropped first
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(f"Cache size must be a positive integer: '{maxsize}'")
+        self.parser = parser
+        self.maxsize = maxsize
+        self._cache: OrderedDict[tuple[str, Hashable], tuple[decimal.Decimal, str | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        _parsers_with_locks.add(self)
+        self._hits = 0
+        self._misses = 0
+
+    def parse(self, money_string: str) -> tuple[decimal.Decimal, str | None]:
+        cache_key = getattr(self.parser, "cache_key", None)
+        key = money_string, cache_key() if cache_key else None
+        with self._lock:
+            if (result := self._cache.get(key)) is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return result
+            self._misses += 1
+
+        result = self.parser.parse(money_string)  # Not locked, so that threads missing the cache parse in parallel
+        with self._lock:
+            self._cache[key] = result
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return result
+
+    # Run on the cached parse() rather than forwarded to the wrapped parser, so that they are cached too.
+    # Strings of the format of BaseParser are still scanned without parse(), which is cheaper than the cache.
+    parse_minor_units = BaseParser.parse_minor_units
+    parse_many = BaseParser.parse_many
+    is_valid = BaseParser.is_valid
+
+    def cache_info(self) -> CacheInfo:
+        """Return the hit and miss counts and the current size of the cache"""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        """Drop all cached results and reset the counts"""
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = 0
+
+    def prepare(self) -> None:
+        """See BaseParser.prepare()"""
+        if prepare := getattr(self.parser, "prepare", None):
+            prepare()
+
+    def __getstate__(self) -> dict:
+        # Pickled without the cached results, e.g., for a worker process, whose registry is another one
+        return {"parser": self.parser, "maxsize": self.maxsize}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["parser"], state["maxsize"])
+
+    def __getattr__(self, name: str):
+        # Other attributes, e.g., match_currency() or registry, are those of the wrapped parser
+        if name == "parser":  # Not yet set, e.g., while unpickling
+            raise AttributeError(name)
+        return getattr(self.parser, name)
+
+    def __repr__(self) -> str:
+        return f"CachedParser({self.parser!r}, maxsize={self.maxsize})"
@@ -1,116 +1,211 @@
-# import re
-# import decimal
-# from typing import Tuple
-#
-# from simple_money_lib import CurrencyContext
-#
-#
-# class ComplexMoneyParser:
-#     thousand_separators = [".", ",", "'", " ", "\xa0", "\u202F", "\u066C", "\uFF0C"]
-#     decimal_separators = [".", ",", "\u066B", "\uFF0E"]
-#     currency_symbols = ["$", "€", "£", "¥", "₹"]
-#
-#     # Build regex patterns
-#     thousand_separators_re = ''.join(re.escape(sep) for sep in thousand_separators)
-#     decimal_separators_re = ''.join(re.escape(sep) for sep in decimal_separators)
-#     currency_symbols_re = ''.join(re.escape(sep) for sep in currency_symbols)
-#     currency_codes_re = r"[A-Za-z]{1,3}"
-#
-#     @classmethod
-#     def _split_currency_and_value(cls, value_string: str) -> tuple:
-#         value_string = value_string.strip()
-#
-#         # Build the currency symbols regex from the higher-level declarations
-#         currencies_re = rf"({cls.currency_symbols_re}|{cls.currency_codes_re})"
-#         # Initialize variables to hold the parts
-#         currency_start = ''
-#         currency_end = ''
-#
-#         # If the string contains only currency symbols or codes
-#         if re.fullmatch(currencies_re, value_string):
-#             return value_string, None
-#
-#         # Find the first position of a digit or whitespace to determine where currency ends
-#         for i, char in enumerate(value_string):
-#             if char in cls.decimal_separators:
-#                 currency_start = value_string[:i].strip()
-#                 value_string = "0" + value_string[i:].strip()  # ".5" -> "0.5"
-#                 break
-#             if char.isdigit() or char.isspace():
-#                 currency_start = value_string[:i].strip()
-#                 value_string = value_string[i:].strip()
-#                 break
-#
-#         # Now reverse the string to find if there's currency at the end
-#         for i, char in enumerate(reversed(value_string)):
-#             if char.isdigit() or char.isspace() or char in cls.decimal_separators:
-#                 currency_end = value_string[len(value_string) - i:].strip()
-#                 value_string = value_string[:len(value_string) - i].strip()
-#                 break
-#
-#         # If both start and end have currency, prioritize the start section
-#         if currency_start:
-#             currency_part = currency_start
-#         elif currency_end:
-#             currency_part = currency_end
-#         else:
-#             currency_part = None
-#
-#         # The remaining part is the value (cleaned up)
-#         value_part = value_string
-#
-#         return currency_part, value_part
-#
-#     def parse(self, value_string: str) -> Tuple[decimal.Decimal, str]:
-#         """Convert string like '50.00 kr' or '$100' to tuple of Decimal value and Currency"""
-#         error_invalid_value = f"Invalid value: '{value_string}'"
-#
-#         if not value_string:
-#             raise ValueError(error_invalid_value)
-#
-#         # Split currency and value
-#         currency_part, value_part = self._split_currency_and_value(value_string)
-#
-#         # Value must be present
-#         if not value_part:
-#             raise ValueError(error_invalid_value)
-#
-#         # Convert to Currency object
-#         if currency_part:
-#             currency = CurrencyContext.get_currency(currency_part)
-#         else:
-#             currency = CurrencyContext.get_default_currency()
-#
-#         # Modify the pattern to capture the decimal separator and decimal part, which is 1 or 2 digits
-#         pattern = rf"^(.*?)([{self.decimal_separators_re}])(\d{{1,2}})$"
-#
-#         if match := re.match(pattern, value_part):
-#             value_part, decimal_separator_used, decimal_part = match.group(1), match.group(2), match.group(3)
-#         else:
-#             decimal_part = '00'  # No decimal part found
-#             decimal_separator_used = None
-#
-#         # Ensure 2-digits decimal part
-#         if len(decimal_part) == 1:
-#             decimal_part = f"{decimal_part}0"
-#
-#         # Ensure the decimal separator doesn't appear in the value part before the decimal
-#         if decimal_separator_used and decimal_separator_used in value_part:
-#             raise ValueError(error_invalid_value)
-#
-#         # Verify validity of the main value if it is not already decimal
-#         if not value_part.isdecimal():
-#             for separator in self.thousand_separators:
-#                 parts = value_part.split(separator)
-#                 # First part can be 1-3 digits, rest must be exactly 3 digits
-#                 if len(parts[0]) in {1, 2, 3} and all(len(part) == 3 for part in parts[1:]):
-#                     # If valid, clean the value by removing the separator
-#                     value_part = int(''.join(parts))
-#                     break
-#             else:
-#                 # If no valid thousand separator is found or the format is incorrect, raise an error
-#                 raise ValueError(error_invalid_value)
-#
-#         value = decimal.Decimal(f"{value_part}.{decimal_part}")
-#
-#         return value, str(currency.code)
+from typing import Hashable
+import decimal
+import unicodedata
+
+from simple_money_lib import Currency
+from simple_money_lib.parsers.base_parser import BaseParser
+
+# Character classes
+_SPACES = frozenset(" \t\xa0\u2009\u202f")  # Also thousands separators between digits
+_THOUSANDS_ONLY = frozenset("'\u2019\u066c\uff0c") | _SPACES  # Apostrophes, Arabic and fullwidth separators
+_DECIMAL_ONLY = frozenset("\u066b\uff0e")  # Arabic decimal separator, fullwidth full stop
+_SEPARATORS = frozenset(".,") | _THOUSANDS_ONLY | _DECIMAL_ONLY
+_MINUS = frozenset("-\u2212")  # Hyphen-minus, minus sign
+_DIGITS = {str(digit): str(digit) for digit in range(10)}
+
+# States of the scanner
+_PREFIX, _NUMBER, _SUFFIX = 0, 1, 2
+
+
+class ComplexMoneyParser(BaseParser):
+    """
+    Parser of formatted money strings, as found in documents and exports of various locales, e.g.,
+    "1.234,56 €", "CHF 1'234.50", "$1,250.50", "(1,234.56) USD", "-kr 5", "€ 1 250,50", "１２３ 円" or "₹1,00,000".
+
+    The string is read in a single pass by a state machine over character classes: a prefix (currency, sign,
+    opening parenthesis), the number (digits of any script and separators), and a suffix (currency, trailing minus,
+    closing parenthesis). Separators are resolved afterward from their sequence:
+    - apostrophes, spaces (also non-breaking) and Arabic or fullwidth thousands separators group thousands;
+    - if "." and "," both occur, the last one separates decimals ("1.234,56", "1,234.56");
+    - a single "." or "," followed by exactly 3 digits groups thousands ("1,250" is 1250), otherwise it separates
+      decimals ("0,5", "12.50", ".5"); pass decimal_separator to decide by locale instead.
+    Groups of thousands are validated, including Indian grouping ("1,00,000").
+    Accounting negatives in parentheses, leading and trailing minus are accepted.
+    The currency is a code or an alias of the registry (see Currency.aliases()).
+    """
+
+    def __init__(self, decimal_separator: str | None = None, allow_ambiguous: bool = True,
+                 registry: type[Currency] | None = None):
+        """
+        Args:
+            decimal_separator: "." or "," to always read that character as the decimal separator and the other one
+                as a thousands separator, e.g., "," for German or French inputs. By default, decided per string.
+            allow_ambiguous: whether aliases shared by several currencies, e.g., "$" or "kr", are accepted
+                and resolved to their default currency. If False, such strings raise a ValueError.
+            registry: currency registry, see BaseParser
+        """
+        if decimal_separator not in (None, ".", ","):
+            raise ValueError(f"Decimal separator must be '.' or ',': '{decimal_separator}'")
+        self.decimal_separator = decimal_separator
+        self.allow_ambiguous = allow_ambiguous
+        super().__init__(registry)
+
+    def prepare(self) -> None:
+        super().prepare()
+        self._registry().aliases()
+
+    def cache_key(self) -> Hashable:
+        return super().cache_key(), self.decimal_separator, self.allow_ambiguous, self._registry().aliases()
+
+    def parse(self, money_string: str) -> tuple[decimal.Decimal, str | None]:
+        """
+        Arguments:
+            money_string: a formatted string representing amount and (optionally) currency: "1.234,56 €"
+        Returns:
+            tuple of a decimal and a valid currency code or None: (Decimal("1234.56"), "EUR")
+        Raises:
+            ValueError
+        """
+        text = money_string
+        length = len(text)
+        currencies = self._registry().all_currencies()
+
+        state = _PREFIX
+        prefix: list[str] = []
+        suffix: list[str] = []
+        digits: list[str] = []
+        separators: list[tuple[int, str]] = []  # Number of digits before the separator, separator
+        negative = False
+        parentheses = 0  # 1 when opened, 2 when closed
+
+        i = 0
+        while i < length:
+            char = text[i]
+            digit = _DIGITS.get(char)
+            if digit is None and char.isdecimal():
+                digit = str(unicodedata.decimal(char))
+
+            if state == _PREFIX:
+                if digit is not None:
+                    if prefix:
+                        # A code ending with a digit, e.g., "BTC_8 100", is followed by a space
+                        end = i
+                        while end < length and not text[end].isspace():
+                            end += 1
+                        code = "".join(prefix) + text[i:end]
+                        if end < length and code[-1].isdigit() and code.upper() in currencies:
+                            prefix.append(text[i:end])
+                            i = end
+                            continue
+                    state = _NUMBER
+                    digits.append(digit)
+                elif char in _SEPARATORS and char not in _THOUSANDS_ONLY and i + 1 < length \
+                        and text[i + 1].isdecimal():
+                    state = _NUMBER  # Leading decimal separator, e.g., ".5"
+                    separators.append((0, char))
+                elif char.isspace():
+                    if prefix:
+                        prefix.append(char)  # Kept, so that "U S D" is not read as "USD"
+                elif char in _MINUS:
+                    if negative:
+                        raise ValueError(f"Invalid monetary amount: '{money_string}'")
+                    negative = True
+                elif char == "+":
+                    pass
+                elif char == "(":
+                    if parentheses:
+                        raise ValueError(f"Invalid monetary amount: '{money_string}'")
+                    parentheses = 1
+                else:
+                    prefix.append(char)
+
+            elif state == _NUMBER:
+                if digit is not None:
+                    digits.append(digit)
+                elif char in _SEPARATORS and i + 1 < length and text[i + 1].isdecimal():
+                    separators.append((len(digits), char))
+                else:
+                    state = _SUFFIX
+                    continue  # Read the character again as a part of the suffix
+
+            else:  # _SUFFIX
+                if char.isspace():
+                    if suffix:
+                        suffix.append(char)
+                elif char in _MINUS:
+                    if negative:
+                        raise ValueError(f"Invalid monetary amount: '{money_string}'")
+                    negative = True
+                elif char == ")":
+                    if parentheses != 1:
+                        raise ValueError(f"Invalid monetary amount: '{money_string}'")
+                    parentheses = 2
+                elif char == "(":
+                    raise ValueError(f"Invalid monetary amount: '{money_string}'")
+                else:
+                    suffix.append(char)
+            i += 1
+
+        if not digits or parentheses == 1 or (parentheses and negative):
+            raise ValueError(f"Invalid monetary amount: '{money_string}'")
+        amount = self._amount(digits, separators, money_string)
+        if parentheses or negative:
+            amount = -amount
+
+        before, after = "".join(prefix).strip(), "".join(suffix).strip()
+        if before and after:
+            raise ValueError(f"Currency both before and after the amount: '{money_string}'")
+        code = self._currency_code(before or after, currencies, money_string) if before or after else None
+        return amount, code
+
+    def _amount(self, digits: list[str], separators: list[tuple[int, str]], money_string: str) -> decimal.Decimal:
+        """Return the amount of the digits, deciding which separator, if any, separates decimals"""
+        decimal_at = None
+        if separators:
+            position, char = separators[-1]
+            if char in _DECIMAL_ONLY:
+                decimal_at = position
+            elif char in _THOUSANDS_ONLY:
+                pass
+            elif self.decimal_separator is not None:
+                if char == self.decimal_separator:
+                    decimal_at = position
+            elif any(other == char for _, other in separators[:-1]):
+                pass  # Repeated, e.g., "1,234,567"
+            elif len(separators) > 1:
+                decimal_at = position  # After separators of another kind, e.g., "1.234,56" or "1 234.5"
+            elif not (len(digits) - position == 3 and 0 < position <= 3 and digits[0] != "0"):
+                decimal_at = position  # "0,5", "12.50" or ".5", but not "1,250"
+            if decimal_at is not None:
+                separators = separators[:-1]
+
+        if separators:
+            # Groups of thousands: 1 to 3 leading digits, then groups of 3 digits, or of 2 digits and a last group
+            # of 3 digits (Indian grouping, e.g., "1,00,000")
+            kinds = {" " if char in _SPACES else char for _, char in separators}
+            if len(kinds) > 1 or self.decimal_separator in kinds:
+                raise ValueError(f"Invalid monetary amount: '{money_string}'")
+            bounds = [position for position, _ in separators] + [len(digits) if decimal_at is None else decimal_at]
+            groups = [end - start for start, end in zip(bounds, bounds[1:])]
+            if not (0 < bounds[0] <= 3 and groups[-1] == 3 and
+                    (all(group == 3 for group in groups) or all(group == 2 for group in groups[:-1]))):
+                raise ValueError(f"Invalid monetary amount: '{money_string}'")
+
+        number = "".join(digits)
+        if decimal_at is not None:
+            number = f"{number[:decimal_at] or '0'}.{number[decimal_at:]}"
+        return decimal.Decimal(number)
+
+    def _currency_code(self, token: str, currencies, money_string: str) -> str:
+        """Return the code of a currency code or alias, e.g., "usd", "€" or "kr." """
+        if (code := token.upper()) in currencies:
+            return code
+        aliases = self._registry().aliases()
+        alias = aliases.get(token)
+        if alias is None and token.endswith("."):
+            alias = aliases.get(token[:-1])  # Abbreviation, e.g., "Kč."
+        if alias is None:
+            raise ValueError(f"Unknown currency: '{token}' in '{money_string}'")
+        if alias.ambiguous and not self.allow_ambiguous:
+            raise ValueError(f"Ambiguous currency alias: '{alias.alias}'")
+        return alias.code
@@ -0,0 +1,175 @@
+from __future__ import annotations
+from typing import Hashable, NamedTuple
+import decimal
+import re
+import threading
+
+from simple_money_lib import Currency
+from simple_money_lib.parsers.base_parser import BaseParser, _parsers_with_locks
+from simple_money_lib.parsers.complex_parser import ComplexMoneyParser
+
+_SIGNS = "-−"  # Hyphen-minus, minus sign
+
+
+class MoneyFormat(NamedTuple):
+    """Format fingerprint of money strings, e.g., for "€ 1.234,56": ("€ ", "", ".", ",", 2, "EUR")"""
+    prefix: str  # Text before the number, without a minus sign
+    suffix: str  # Text after the number, without a minus sign
+    thousands_separator: str | None
+    decimal_separator: str | None
+    decimals: int
+    code: str | None  # Currency code the prefix or suffix stands for
+
+
+class LearningParser(BaseParser):
+    """
+    Parser for homogeneous feeds, e.g., a partner file with one fixed money format. The first strings are parsed
+    with a general parser (by default ComplexMoneyParser) and their format fingerprint is inferred: text before
+    and after the number (currency code or symbol), thousands and decimal separators and the number of decimals.
+    If all samples share one format, a parser specialized to it, a single anchored regex, parses the rest of the feed.
+    Strings not matching the format, e.g., accounting negatives in an otherwise plain feed, are parsed with
+    the general parser. If the samples differ in format, all strings are parsed with the general parser.
+
+    Example:
+        parser = LearningParser(sample_size=20)
+        Money.parser.set(parser)
+        amounts = [Money(cell) for cell in column]  # e.g., "1.234,56 €", "12,00 €", ...
+        print(parser.format)                        # MoneyFormat(prefix='', suffix=' €', ...)
+    """
+
+    def __init__(self, parser: BaseParser | None = None, sample_size: int = 20, registry: type[Currency] | None = None):
+        """
+        Args:
+            parser: general parser for the samples and for strings not matching the format
+            sample_size: number of strings to infer the format from
+            registry: currency registry of the default general parser, see BaseParser
+        """
+        if not isinstance(sample_size, int) or sample_size < 1:
+            raise ValueError(f"Sample size must be a positive integer: '{sample_size}'")
+        super().__init__(registry)
+        self.parser = parser or ComplexMoneyParser(registry=registry)
+        self.sample_size = sample_size
+        self._lock = threading.Lock()
+        _parsers_with_locks.add(self)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the format and learn it again from the next strings, e.g., for the next file"""
+        with self._lock:
+            self._samples: list[tuple[str, tuple[decimal.Decimal, str | None], MoneyFormat | None]] = []
+            self._format: MoneyFormat | None = None
+            self._pattern: re.Pattern | None = None
+            self._learning = True
+            # Counts of strings parsed after learning, not synchronized between threads
+            self.matched = 0  # With the specialized parser
+            self.fallbacks = 0  # With the general parser
+
+    def __getstate__(self) -> dict:
+        state = super().__getstate__()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        _parsers_with_locks.add(self)
+
+    @property
+    def format(self) -> MoneyFormat | None:
+        """The learned format, or None while learning or if the samples differ in format"""
+        return self._format
+
+    def prepare(self) -> None:
+        super().prepare()
+        if prepare := getattr(self.parser, "prepare", None):
+            prepare()
+
+    def cache_key(self) -> Hashable:
+        cache_key = getattr(self.parser, "cache_key", None)
+        return cache_key() if cache_key else None, self._format
+
+    def parse(self, money_string: str) -> tuple[decimal.Decimal, str | None]:
+        if self._learning:
+            return self._learn(money_string)
+        if (pattern := self._pattern) is not None and (match := pattern.fullmatch(money_string)):
+            if (result := self._from_match(match, self._format)) is not None:
+                self.matched += 1
+                return result
+        self.fallbacks += 1
+        return self.parser.parse(money_string)
+
+    def _learn(self, money_string: str) -> tuple[decimal.Decimal, str | None]:
+        result = self.parser.parse(money_string)
+        with self._lock:
+            if self._learning:
+                self._samples.append((money_string, result, self._fingerprint(money_string, result)))
+                if len(self._samples) >= self.sample_size:
+                    self._compile()
+                    self._learning = False
+        return result
+
+    @staticmethod
+    def _fingerprint(money_string: str, result: tuple[decimal.Decimal, str | None]) -> MoneyFormat | None:
+        """Return the format of a parsed string, or None if it has none, e.g., digits of other scripts"""
+        amount, code = result
+        digits = [i for i, char in enumerate(money_string) if "0" <= char <= "9"]
+        if not digits:
+            return None
+        start, end = digits[0], digits[-1] + 1
+        number = money_string[start:end]
+        exponent = amount.as_tuple().exponent
+        decimals = -exponent if isinstance(exponent, int) and exponent < 0 else 0
+
+        decimal_separator = None
+        if decimals:
+            if decimals >= len(number) or number[-decimals - 1].isdigit():
+                return None
+            decimal_separator = number[-decimals - 1]
+            number = number[:-decimals - 1]
+        separators = {char for char in number if not "0" <= char <= "9"}
+        if len(separators) > 1:
+            return None
+        return MoneyFormat(money_string[:start].strip(_SIGNS), money_string[end:].strip(_SIGNS),
+                           separators.pop() if separators else None, decimal_separator, decimals, code)
+
+    def _compile(self) -> None:
+        """Build the specialized parser if all samples share one format and it parses them as the general parser"""
+        formats = {fingerprint._replace(thousands_separator=None) for _, _, fingerprint in self._samples
+                   if fingerprint is not None}
+        thousands = {fingerprint.thousands_separator for _, _, fingerprint in self._samples
+                     if fingerprint is not None} - {None}
+        if len(formats) != 1 or len(thousands) > 1 or any(sample[2] is None for sample in self._samples):
+            return
+        money_format = formats.pop()._replace(thousands_separator=thousands.pop() if thousands else None)
+
+        if money_format.thousands_separator is None:
+            number = "([0-9]+)"
+        else:
+            # Groups start with a non-zero digit: ComplexMoneyParser reads "0.500" as a decimal, not as 500
+            number = f"([1-9][0-9]{{0,2}}(?:{re.escape(money_format.thousands_separator)}[0-9]{{3}})*|[0-9]+)"
+        if money_format.decimals:
+            number += f"{re.escape(money_format.decimal_separator)}([0-9]{{{money_format.decimals}}})"
+        else:
+            number += "()"
+        sign = f"([{_SIGNS}]?)"
+        pattern = re.compile(f"{sign}{re.escape(money_format.prefix)}{sign}{number}"
+                             f"{re.escape(money_format.suffix)}{sign}")
+
+        for money_string, result, _ in self._samples:
+            match = pattern.fullmatch(money_string)
+            if match is None or self._from_match(match, money_format) != result:
+                return
+        self._format, self._pattern = money_format, pattern
+
+    @staticmethod
+    def _from_match(match: re.Match, money_format: MoneyFormat) -> tuple[decimal.Decimal, str | None] | None:
+        """Return the result of a string matching the format, or None if it has more than one minus sign"""
+        leading, inner, integer, fraction, trailing = match.groups()
+        if len(leading) + len(inner) + len(trailing) > 1:
+            return None
+        if money_format.thousands_separator is not None:
+            integer = integer.replace(money_format.thousands_separator, "")
+        amount = decimal.Decimal(f"{integer}.{fraction}" if fraction else integer)
+        if leading or inner or trailing:
+            amount = -amount
+        return amount, money_format.code
@@ -0,0 +1,164 @@
+from __future__ import annotations
+from typing import Iterator, Mapping, NamedTuple, TextIO
+import decimal
+import re
+import unicodedata
+
+from simple_money_lib import Currency
+from simple_money_lib.parsers.base_parser import _trie_pattern
+from simple_money_lib.parsers.complex_parser import ComplexMoneyParser
+from simple_money_lib.utils.alias_trie import AliasTrie
+from simple_money_lib.utils.registry import RegistryManager
+
+# Numbers, with digits of any script: digit groups with thousands separators, including Indian groups of 2 digits
+# before the last group of 3, e.g., "1,00,000", and an optional decimal part, or plain digits with one;
+# not preceded or followed by other digits or separators, so that a number is never matched in part
+_NUMBER = (r"(?<![\d.,])-?(?:\d{1,3}(?:[,.'’ \xa0 ]\d{2})*(?:[,.'’ \xa0 ]\d{3})+(?:[.,]\d+)?|\d+(?:[.,]\d+)?)"
+           r"(?![\d]|[.,]\d)")
+_SPACE = r"[ \xa0 ]?"
+
+
+class MoneyMatch(NamedTuple):
+    """A monetary mention found in a text"""
+    start: int  # Index of the first character of the mention in the text or stream
+    end: int  # Index after the last character of the mention
+    text: str
+    amount: decimal.Decimal
+    currency: Currency
+
+
+class MoneyScanner:
+    """
+    Finds monetary mentions, e.g., "USD 1,250.00", "€5" or "12,50 kr", in free text such as invoices, emails
+    or logs. Currency codes (in upper case, as whole words) and aliases of the registry are compiled, together with
+    the grammar of numbers, into a single regex, which finds all mentions in one pass over the text.
+    Separators of the amounts are resolved as by ComplexMoneyParser.
+    The regex is compiled again when currencies or aliases are added to the registry.
+
+    Example:
+        scanner = MoneyScanner()
+        for match in scanner.find("Invoice total: USD 1,250.00, paid €500 on 12.03."):
+            print(match.start, match.amount, match.currency.code)  # 15 1250.00 USD, then 34 500 EUR
+    """
+
+    margin = 1024  # Characters of a stream scanned again with the next chunk; longer mentions may be split
+
+    def __init__(self, registry: type[Currency] | None = None, allow_ambiguous: bool = True,
+                 decimal_separator: str | None = None):
+        """
+        Args:
+            registry: currency registry, by default the one active for Money (Money.registry)
+            allow_ambiguous: whether aliases shared by several currencies, e.g., "$" or "kr", are found and resolved
+                to their default currency
+            decimal_separator: see ComplexMoneyParser
+        """
+        self.registry = registry
+        self.allow_ambiguous = allow_ambiguous
+        self._parser = ComplexMoneyParser(decimal_separator=decimal_separator, registry=registry)
+        # Compiled regex and currency by token, with the registry, its snapshot and aliases they were built from
+        self._compiled: tuple[type[Currency], Mapping[str, Currency], AliasTrie, re.Pattern, dict] | None = None
+
+    def _automaton(self) -> tuple[re.Pattern, dict[str, Currency]]:
+        registry = self.registry or RegistryManager().get()
+        currencies, aliases = registry.all_currencies(), registry.aliases()
+        compiled = self._compiled
+        if compiled is None or compiled[0] is not registry or compiled[1] is not currencies or compiled[2] is not aliases:
+            tokens = {alias.alias.strip(): currencies[alias.code] for alias in aliases
+                      if alias.code in currencies and (self.allow_ambiguous or not alias.ambiguous)}
+            tokens.update(currencies)
+            # Currencies are not matched inside words, e.g., "ALL" in "ALLOW" or "kr" in "krone"
+            currency = rf"(?<![^\W\d_])(?:{_trie_pattern(tokens)})(?![^\W\d_])"
+            # A class of the characters mentions start with rejects other positions without trying the alternatives
+            first = "".join(sorted({re.escape(token[0]) for token in tokens}))
+            pattern = re.compile(rf"(?=[{first}\d-])(?:(?P<before>{currency}){_SPACE}(?P<number>{_NUMBER})|"
+                                 rf"(?P<amount>{_NUMBER}){_SPACE}(?P<after>{currency}))")
+            compiled = self._compiled = registry, currencies, aliases, pattern, tokens
+        return compiled[3], compiled[4]
+
+    def prepare(self) -> None:
+        """Compile the regex ahead of the first scan, see BaseParser.prepare()"""
+        self._automaton()
+
+    def _matches(self, text: str, pos: int, endpos: int, offset: int) -> Iterator[tuple[int, MoneyMatch]]:
+        """Yield the end in the text and the match of mentions starting in text[pos:endpos]"""
+        pattern, tokens = self._automaton()
+        amount_of = self._amount
+        search = pattern.search
+        while (match := search(text, pos)) is not None and match.start() < endpos:
+            try:
+                amount = amount_of(match.group("number") or match.group("amount"))
+            except ValueError:  # E.g., mixed groups of thousands; a shorter mention may start inside the match
+                pos = match.start() + 1
+                continue
+            currency = tokens[match.group("before") or match.group("after")]
+            yield match.end(), MoneyMatch(offset + match.start(), offset + match.end(), match.group(), amount, currency)
+            pos = match.end()
+
+    def _amount(self, number: str) -> decimal.Decimal:
+        """Return the amount of a number matched by the regex, with separators resolved as by ComplexMoneyParser"""
+        negative = number[0] == "-"
+        digits: list[str] = []
+        separators: list[tuple[int, str]] = []
+        for char in number[1:] if negative else number:
+            if "0" <= char <= "9":
+                digits.append(char)
+            elif char.isdecimal():  # Matched by \d, e.g., Arabic-Indic digits
+                digits.append(str(unicodedata.decimal(char)))
+            else:
+                separators.append((len(digits), char))
+        amount = self._parser._amount(digits, separators, number)
+        return -amount if negative else amount
+
+    def finditer(self, text: str) -> Iterator[MoneyMatch]:
+        """Yield the monetary mentions of a text, in order"""
+        for _, match in self._matches(text, 0, len(text), 0):
+            yield match
+
+    def find(self, text: str) -> list[MoneyMatch]:
+        """Return the monetary mentions of a text, in order"""
+        return list(self.finditer(text))
+
+    def iter_stream(self, stream: TextIO, chunk_size: int = 1 << 20) -> Iterator[MoneyMatch]:
+        """
+        Yield the monetary mentions of a text stream, e.g., an open file, read in chunks of chunk_size characters,
+        so that files of any size are scanned in constant memory. Positions are indexes in the whole stream.
+        """
+        offset = 0  # Index in the stream of buffer[0]
+        buffer = ""
+        pos = 0  # Index in the buffer to continue scanning from; characters before it are kept as context
+        while True:
+            chunk = stream.read(chunk_size)
+            buffer += chunk
+            final = not chunk
+            # Mentions starting close to the end of the buffer may continue in the next chunk
+            limit = len(buffer) if final else max(len(buffer) - self.margin, pos)
+            for end, match in self._matches(buffer, pos, limit, offset):
+                if not final and end >= len(buffer):
+                    limit = match.start - offset  # May continue in the next chunk, so scanned again with it
+                    break
+                yield match
+                pos = end
+            if final:
+                return
+            pos = max(pos, limit)
+            keep = max(pos - self.margin, 0)  # Context for the lookbehind of the regex
+            buffer, offset, pos = buffer[keep:], offset + keep, pos - keep
+
+
+_scanner = MoneyScanner()  # Follows the registry active for Money
+
+
+def find_money(text: str) -> list[MoneyMatch]:
+    """
+    Return the monetary mentions of a text, e.g., find_money("Paid €5 and USD 1,250.00") returns matches of
+    5 EUR and 1250.00 USD. See MoneyScanner.
+    """
+    return _scanner.find(text)
+
+
+def iter_money(stream: TextIO, chunk_size: int = 1 << 20) -> Iterator[MoneyMatch]:
+    """
+    Yield the monetary mentions of a text stream, e.g., of a file opened with open(path, encoding="utf-8"),
+    read in chunks. See MoneyScanner.
+    """
+    return _scanner.iter_stream(stream, chunk_size)
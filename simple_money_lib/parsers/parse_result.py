@@ -0,0 +1,49 @@
+from __future__ import annotations
+from typing import NamedTuple, TYPE_CHECKING
+import decimal
+
+if TYPE_CHECKING:
+    from simple_money_lib.currency import Currency
+
+# Error codes of ParseResult
+EMPTY = "empty"  # Empty or blank string
+NOT_A_STRING = "not_a_string"
+INVALID_AMOUNT = "invalid_amount"  # The amount is not a number of the expected format
+UNKNOWN_CURRENCY = "unknown_currency"  # A valid amount next to text which is not a known currency
+INVALID = "invalid"  # Rejected by a parser with its own format, see ParseResult.exception
+
+_MESSAGES = {
+    EMPTY: "Empty monetary amount",
+    NOT_A_STRING: "Not a string: {text!r}",
+    INVALID_AMOUNT: "Invalid monetary amount: '{text}'",
+    UNKNOWN_CURRENCY: "Unknown currency: '{text}'",
+}
+
+
+class ParseResult(NamedTuple):
+    """
+    Outcome of parsing one string with BaseParser.parse_many(): either an amount and its currency, or an error code.
+    Errors are not raised, and their message is only formatted when read.
+    """
+    position: int  # Index of the string in the input
+    text: str
+    amount: decimal.Decimal | None = None
+    currency: Currency | None = None  # The default currency (Money.default_currency) if the string has none
+    error: str | None = None  # Error code, e.g., INVALID_AMOUNT
+    exception: Exception | None = None  # Raised by a parser with its own format, for error INVALID
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def message(self) -> str | None:
+        """
+        Error message quoting the whole string, e.g., "Invalid monetary amount: '12,34 USD'", where parse() may quote
+        the amount only; for error INVALID, the message of the exception. None for a parsed string.
+        """
+        if self.error is None:
+            return None
+        if self.exception is not None:
+            return str(self.exception)
+        return _MESSAGES[self.error].format(text=self.text)
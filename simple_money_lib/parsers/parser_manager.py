@@ -1,32 +1,31 @@
-import threading
 from simple_money_lib.parsers.base_parser import BaseParser
+from simple_money_lib.utils import context as _context
 
 class ParserManager:
-    """Manages thread-local and global parsers in a thread-safe manner."""
-
-    _global_lock = threading.Lock()
-    _thread_local = threading.local()
-    _global_default_parser = BaseParser()  # Default global parser
+    """
+    Manages parsers: a global default and overrides in the current thread or asyncio task.
+    See simple_money_lib.utils.context for the storage.
+    """
 
     def set_default(self, parser: BaseParser):
         """Set the global default parser."""
-        with self._global_lock:
-            self._global_default_parser = parser
+        _context.set_defaults(parser=parser)
 
     def get_default(self) -> BaseParser:
         """Get the global default parser."""
-        with self._global_lock:
-            return self._global_default_parser
+        return _context.get_defaults().parser
 
     def set(self, parser: BaseParser):
-        """Set a thread-local parser."""
-        self._thread_local.parser = parser
+        """Set the parser of the current thread or asyncio task."""
+        _context.set_local(parser=parser)
 
     def get(self) -> BaseParser:
-        """Get the effective parser: thread-local or global default."""
-        return getattr(self._thread_local, "parser", None) or self.get_default()
+        """Get the effective parser: of the current thread or asyncio task, or the global default."""
+        return _context.get_context().parser
 
     def reset(self):
-        """Reset the thread-local parser to the global default."""
-        if hasattr(self._thread_local, "parser"):
-            del self._thread_local.parser
+        """Reset the parser of the current thread or asyncio task to the global default."""
+        _context.set_local(parser=None)
+
+
+_context.set_defaults(parser=BaseParser())  # Default global parser
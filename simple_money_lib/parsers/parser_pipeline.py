@@ -0,0 +1,93 @@
+from __future__ import annotations
+from typing import Hashable, NamedTuple
+import decimal
+import time
+
+from simple_money_lib import Currency
+from simple_money_lib.parsers.base_parser import BaseParser
+
+
+class StageStats(NamedTuple):
+    """Counts and time of a stage of a ParserPipeline"""
+    stage: str  # Class name of the stage parser
+    calls: int
+    parsed: int  # Strings parsed by the stage, not passed on to the next one
+    failed: int  # Strings the stage raised a ValueError for
+    seconds: float | None  # Time spent in the stage, or None if it was never timed
+
+
+class ParserPipeline(BaseParser):
+    """
+    Parser trying a sequence of parsers (stages) in turn: the first stage parsing a string gives the result,
+    and a string raising a ValueError is passed on to the next stage. Cheap, strict stages go first, e.g.,
+    BaseParser for canonical strings, with the locale-aware ComplexMoneyParser as a fallback for the others.
+    If no stage parses a string, the ValueError of the last stage is raised.
+
+    The calls, results and errors of each stage are counted, and with timed=True the time spent in each stage
+    is measured, so that it can be seen at runtime which stages a feed is parsed by. Counts are not synchronized
+    between threads, so they are approximate for a pipeline shared by threads.
+
+    Example:
+        parser = ParserPipeline(BaseParser(), ComplexMoneyParser(), timed=True)
+        Money.parser.set(parser)
+        amounts = [Money(cell) for cell in column]  # e.g., "12.34 USD", "1.234,56 €", ...
+        for stats in parser.stats():
+            print(stats)  # StageStats(stage='BaseParser', calls=1000, parsed=900, failed=100, seconds=0.0012), ...
+    """
+
+    def __init__(self, *stages: BaseParser, timed: bool = False, registry: type[Currency] | None = None):
+        """
+        Args:
+            stages: parsers to try in turn
+            timed: whether to measure the time spent in each stage; can be changed at runtime
+            registry: currency registry to resolve codes of the results with, see BaseParser
+        """
+        if not stages:
+            raise ValueError("A parser pipeline needs at least one stage")
+        super().__init__(registry)
+        self.stages = stages
+        self.timed = timed
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Reset the counts and times of all stages"""
+        self._calls = [0] * len(self.stages)
+        self._failed = [0] * len(self.stages)
+        self._nanoseconds = [0] * len(self.stages)
+
+    def stats(self) -> list[StageStats]:
+        """Return the counts and times of the stages, in order"""
+        return [StageStats(type(stage).__name__, calls, calls - failed, failed,
+                           nanoseconds / 1e9 if self.timed or nanoseconds else None)
+                for stage, calls, failed, nanoseconds in zip(self.stages, self._calls, self._failed, self._nanoseconds)]
+
+    def prepare(self) -> None:
+        super().prepare()
+        for stage in self.stages:
+            if prepare := getattr(stage, "prepare", None):
+                prepare()
+
+    def cache_key(self) -> Hashable:
+        return tuple(cache_key() if (cache_key := getattr(stage, "cache_key", None)) else None
+                     for stage in self.stages)
+
+    def parse(self, money_string: str) -> tuple[decimal.Decimal, str | None]:
+        calls, failed = self._calls, self._failed
+        timed = self.timed
+        error = None
+        for i, stage in enumerate(self.stages):
+            calls[i] += 1
+            if timed:
+                start = time.perf_counter_ns()
+            try:
+                return stage.parse(money_string)
+            except ValueError as e:
+                failed[i] += 1
+                error = e
+            finally:
+                if timed:
+                    self._nanoseconds[i] += time.perf_counter_ns() - start
+        raise error
+
+    def __repr__(self) -> str:
+        return f"ParserPipeline({', '.join(map(repr, self.stages))}, timed={self.timed})"
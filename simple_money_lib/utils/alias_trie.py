@@ -0,0 +1,91 @@
+from typing import NamedTuple, Iterable
+
+
+class CurrencyAlias(NamedTuple):
+    """An alternative representation of a currency: a symbol ("€"), a spelling ("US$") or a legacy code ("RUR")."""
+    alias: str
+    code: str
+    ambiguous: bool = False  # The alias is also used for other currencies, e.g., "$" or "kr"
+
+
+class AliasTrie:
+    """
+    Immutable, case-insensitive trie of currency aliases supporting the longest match at either end of a string.
+    Two tries are kept: over the aliases and over the reversed aliases, so suffixes are matched in the same way.
+    Being immutable, an instance can be shared between threads without locking; changes create a new instance.
+    """
+    _TERMINAL = ""  # Edge keys are single (lower-cased) characters, so an empty key marks the end of an alias
+
+    def __init__(self, aliases: Iterable[CurrencyAlias] = ()):
+        self._aliases: dict[str, CurrencyAlias] = {}
+        self._forward: dict = {}
+        self._backward: dict = {}
+        for alias in aliases:
+            key = self._key(alias.alias)
+            if not key:
+                continue
+            self._aliases[key] = alias
+        for alias in self._aliases.values():
+            text = alias.alias.strip()
+            self._insert(self._forward, text, alias)
+            self._insert(self._backward, reversed(text), alias)
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return "".join(char.lower() for char in text.strip())
+
+    @classmethod
+    def _insert(cls, root: dict, chars: Iterable[str], alias: CurrencyAlias) -> None:
+        node = root
+        for char in chars:
+            node = node.setdefault(char.lower(), {})
+        node[cls._TERMINAL] = alias
+
+    def with_alias(self, alias: CurrencyAlias) -> "AliasTrie":
+        """Return a new trie with the alias added or replaced."""
+        aliases = dict(self._aliases)
+        aliases[self._key(alias.alias)] = alias
+        return AliasTrie(aliases.values())
+
+    def get(self, text: str) -> CurrencyAlias | None:
+        """Return the alias exactly matching the text, ignoring case and surrounding whitespace."""
+        return self._aliases.get(self._key(text))
+
+    def longest_prefix(self, text: str, start: int = 0) -> tuple[CurrencyAlias, int] | None:
+        """
+        Find the longest alias at the beginning of text[start:].
+        Returns:
+            tuple of the alias and the index in text right after it, or None
+        """
+        node, found = self._forward, None
+        for i in range(start, len(text)):
+            node = node.get(text[i].lower())
+            if node is None:
+                break
+            if self._TERMINAL in node:
+                found = node[self._TERMINAL], i + 1
+        return found
+
+    def longest_suffix(self, text: str, end: int | None = None) -> tuple[CurrencyAlias, int] | None:
+        """
+        Find the longest alias at the end of text[:end].
+        Returns:
+            tuple of the alias and the index in text where it starts, or None
+        """
+        node, found = self._backward, None
+        for i in range(len(text) if end is None else end, 0, -1):
+            node = node.get(text[i - 1].lower())
+            if node is None:
+                break
+            if self._TERMINAL in node:
+                found = node[self._TERMINAL], i - 1
+        return found
+
+    def __contains__(self, text: str) -> bool:
+        return self.get(text) is not None
+
+    def __iter__(self):
+        return iter(self._aliases.values())
+
+    def __len__(self) -> int:
+        return len(self._aliases)
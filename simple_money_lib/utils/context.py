@@ -0,0 +1,118 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import NamedTuple, Any, Callable, Iterator, TYPE_CHECKING
+import contextvars
+import decimal
+import functools
+import threading
+
+from simple_money_lib.currency import Currency
+from simple_money_lib.currencies.all import XXX
+
+if TYPE_CHECKING:
+    from simple_money_lib.parsers.base_parser import BaseParser
+
+
+class MoneyContext(NamedTuple):
+    """
+    Settings used by Money: rounding mode, parser, default currency and currency registry.
+    In overrides of the current context, None stands for the global default.
+    """
+    rounding: str | None = None
+    parser: BaseParser | None = None
+    default_currency: Currency | None = None
+    registry: type[Currency] | None = None
+
+
+# Global defaults, replaced as a whole on changes, so that they can be read without locking.
+# The default parser is set by simple_money_lib.parsers.parser_manager, which depends on this module.
+_global_lock = threading.Lock()
+_global_context = MoneyContext(rounding=decimal.ROUND_DOWN, default_currency=XXX, registry=Currency)
+
+# Overrides of the current thread or asyncio task, None if there are none: (overrides, global defaults at the time
+# the effective settings were resolved, effective settings)
+_money_context: contextvars.ContextVar[tuple[MoneyContext, MoneyContext, MoneyContext] | None] = \
+    contextvars.ContextVar("money_context", default=None)
+
+
+def get_context() -> MoneyContext:
+    """Return the effective settings in the current thread or asyncio task, with overrides applied to global defaults"""
+    entry = _money_context.get()
+    if entry is None:
+        return _global_context
+    if entry[1] is not _global_context:
+        # Global defaults changed since the effective settings were resolved
+        entry = _resolve(entry[0])
+        _money_context.set(entry)
+    return entry[2]
+
+
+def _get_overrides() -> MoneyContext:
+    entry = _money_context.get()
+    return entry[0] if entry is not None else MoneyContext()
+
+
+def _resolve(local: MoneyContext) -> tuple[MoneyContext, MoneyContext, MoneyContext]:
+    """Apply overrides to the current global defaults"""
+    default = _global_context
+    return local, default, MoneyContext(*(override or value for override, value in zip(local, default)))
+
+
+def get_defaults() -> MoneyContext:
+    """Return the global default settings"""
+    return _global_context
+
+
+def set_defaults(**settings) -> None:
+    """Change global default settings, e.g., set_defaults(rounding=decimal.ROUND_HALF_UP)"""
+    global _global_context
+    with _global_lock:
+        _global_context = _global_context._replace(**settings)
+
+
+def set_local(**settings) -> None:
+    """
+    Override settings in the current thread or asyncio task until changed again, e.g., set_local(parser=parser).
+    A setting of None restores the global default.
+    """
+    local = _get_overrides()._replace(**settings)
+    _money_context.set(None if local == MoneyContext() else _resolve(local))
+
+
+@contextmanager
+def money_context(rounding: str | None = None, parser: BaseParser | None = None,
+                  default_currency: Currency | str | None = None,
+                  registry: type[Currency] | None = None) -> Iterator[MoneyContext]:
+    """
+    Override settings within a block, in the current thread or asyncio task only. Other settings are inherited.
+    Example:
+        with money_context(rounding=decimal.ROUND_HALF_UP, default_currency="EUR"):
+            print(Money("1.005"))  # 1.01 EUR
+    Yields:
+        the effective settings within the block
+    """
+    if isinstance(default_currency, str):
+        default_currency = (registry or get_context().registry)(default_currency)
+    overrides = MoneyContext(rounding, parser, default_currency, registry)
+    entry = _resolve(MoneyContext(*(new or old for new, old in zip(overrides, _get_overrides()))))
+    token = _money_context.set(entry)
+    try:
+        yield entry[2]
+    finally:
+        _money_context.reset(token)
+
+
+def bind_context(fn: Callable, /, *args, **kwargs) -> Callable[[], Any]:
+    """
+    Bind a function and its arguments to a copy of the current context, including money settings, e.g., for
+    loop.run_in_executor(None, bind_context(fn, arg)). Threads of an executor do not inherit the context otherwise.
+    """
+    return functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor running each task in a copy of the context it was submitted from, see bind_context()"""
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+from typing import Mapping, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from simple_money_lib.currency import Currency
+
+
+class CurrencyMatcher:
+    """
+    Immutable tries of currency codes for finding the longest code at the beginning or at the end of a string.
+    The cost of a match depends on the length of the codes, not on the number of known currencies.
+    Matching is case-insensitive for codes in upper case. A code ending with a digit, e.g., "BTC_8", only matches
+    at the beginning if followed by a space, so that "BTC_8100" is not read as 100 BTC_8.
+    Being immutable, an instance can be shared between threads without locking.
+    """
+    _TERMINAL = ""  # Edge keys are single characters, so an empty key marks the end of a code
+
+    def __init__(self, currencies: Mapping[str, Currency]):
+        self._forward: dict = {}
+        self._backward: dict = {}
+        for code, currency in currencies.items():
+            if code:
+                self._insert(self._forward, code, currency)
+                self._insert(self._backward, reversed(code), currency)
+
+    @classmethod
+    def _insert(cls, root: dict, chars, currency: Currency) -> None:
+        node = root
+        for char in chars:
+            node = node.setdefault(char, {})
+        node[cls._TERMINAL] = currency
+
+    def match(self, text: str) -> tuple[Currency, int, int] | None:
+        """
+        Find the longest currency code at the beginning or at the end of the text, preferring the beginning.
+        Returns:
+            tuple of the currency and the start and end index of the code in the text, or None
+        """
+        found = None
+        node = self._forward
+        for i, char in enumerate(text):
+            node = node.get(char.upper())
+            if node is None:
+                break
+            if (currency := node.get(self._TERMINAL)) is not None:
+                if not currency.code[-1].isdigit() or text[i + 1:i + 2] == " ":
+                    found = currency, 0, i + 1
+
+        node = self._backward
+        for i in range(len(text) - 1, -1, -1):
+            node = node.get(text[i].upper())
+            if node is None:
+                break
+            if (currency := node.get(self._TERMINAL)) is not None:
+                if found is None or len(text) - i > found[2] - found[1]:
+                    found = currency, i, len(text)
+        return found
@@ -1,12 +1,22 @@
+import contextlib
 import json
 import tempfile
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Non-POSIX platforms: cross-process locking is not available
+    fcntl = None
+
 from simple_money_lib.exceptions import CurrencySerializationError
 
 _DATA_DIR = Path(__file__).parent.parent / "data"
 _PREDEFINED_FILE = _DATA_DIR / "predefined_currencies.json"
 _USER_FILE = _DATA_DIR / "user_currencies.json"
+_ALIASES_FILE = _DATA_DIR / "currency_aliases.json"
+_COUNTRIES_FILE = _DATA_DIR / "countries.json"
+_HISTORICAL_FILE = _DATA_DIR / "historical_currencies.json"
+_COLLECTIONS_FILE = _DATA_DIR / "collections_metadata.json"
 
 def load_currencies():
     """Load predefined and user-defined currencies."""
@@ -26,29 +36,123 @@ def _load_predefined_currencies():
         raise CurrencySerializationError(
             f"Critical error: Failed to parse predefined currencies file: {_PREDEFINED_FILE}")
 
-def _load_user_currencies():
+def _load_user_currencies(path: Path | None = None):
     """Load optional user-defined currencies"""
-    if not _USER_FILE.exists():
+    path = path or _USER_FILE
+    if not path.exists():
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        raise CurrencySerializationError(
+            f"Critical error: Failed to parse user-defined currencies file: {path}")
+
+def load_currency_aliases() -> dict:
+    """Load optional currency aliases: symbols and alternative spellings mapped to currency codes."""
+    if not _ALIASES_FILE.exists():
+        return {}
+    try:
+        with open(_ALIASES_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        raise CurrencySerializationError(
+            f"Critical error: Failed to parse currency aliases file: {_ALIASES_FILE}")
+
+def load_countries() -> dict:
+    """Load optional ISO 3166 country metadata, including the currencies used in each country."""
+    if not _COUNTRIES_FILE.exists():
         return {}
     try:
-        with open(_USER_FILE, 'r') as f:
+        with open(_COUNTRIES_FILE, 'r', encoding='utf-8') as f:
             return json.load(f)
     except json.JSONDecodeError:
         raise CurrencySerializationError(
-            f"Critical error: Failed to parse user-defined currencies file: {_USER_FILE}")
-
-def save_user_currencies(user_data: dict):
-    print(user_data)
-    """Save user-defined currencies to JSON safely."""
-    try:
-        _USER_FILE.parent.mkdir(parents=True, exist_ok=True)
-        # Write to a temporary file first
-        with tempfile.NamedTemporaryFile('w', delete=False, dir=_USER_FILE.parent, suffix=".json") as temp_file:
-            json.dump(user_data, temp_file, indent=4)
-            temp_name = temp_file.name
-        # Replace the old file with the new one atomically
-        Path(temp_name).replace(_USER_FILE)
+            f"Critical error: Failed to parse countries file: {_COUNTRIES_FILE}")
+
+def load_historical_currencies() -> dict:
+    """Load optional validity intervals of currencies, including withdrawn ones."""
+    if not _HISTORICAL_FILE.exists():
+        return {}
+    try:
+        with open(_HISTORICAL_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        raise CurrencySerializationError(
+            f"Critical error: Failed to parse historical currencies file: {_HISTORICAL_FILE}")
+
+def load_collections_metadata(path: str | Path | None = None) -> dict:
+    """
+    Load currency collections metadata: {name: {"currencies": [codes], "name": ..., "description": ...}}.
+    Arguments:
+        path: a user-supplied collections file, or None for the collections shipped with the library
+    """
+    path = Path(path) if path is not None else _COLLECTIONS_FILE
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise CurrencySerializationError(f"Collections file not found: {path}")
+    except json.JSONDecodeError:
+        raise CurrencySerializationError(f"Failed to parse collections file: {path}")
+
+def load_user_currencies(path: Path | None = None):
+    """
+    Load user-defined currencies together with the signature of the file they were read from.
+    The signature is taken before reading, so a concurrent write is detected by the next staleness check.
+    Arguments:
+        path: user currencies file, or None for the library's default file (applies to all functions below)
+    """
+    signature = user_currencies_signature(path)
+    return _load_user_currencies(path), signature
+
+def user_currencies_signature(path: Path | None = None) -> tuple[int, int] | None:
+    """Return a cheap (mtime_ns, size) signature of the user-defined currencies file, or None if it is missing."""
+    try:
+        stat = (path or _USER_FILE).stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+@contextlib.contextmanager
+def _user_file_lock(path: Path):
+    """
+    Hold an exclusive cross-process lock on the user-defined currencies file.
+    The lock is taken on a sidecar '.lock' file, as the data file itself is replaced atomically on save.
+    Without fcntl (non-POSIX platforms) only the in-process locking of the callers applies.
+    """
+    if fcntl is None:
+        yield
+        return
+    lock_path = path.with_name(path.name + ".lock")
+    with open(lock_path, 'a') as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+def save_user_currencies(user_data: dict, path: Path | None = None) -> dict:
+    """
+    Save user-defined currencies to JSON safely, also when several processes share the data directory.
+    The file is re-read under an exclusive lock and currencies saved by other processes are kept.
+    For codes present in both, the provided user_data wins.
+    Returns:
+        the merged dictionary which has been written to disk
+    """
+    path = path or _USER_FILE
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _user_file_lock(path):
+            merged = {**_load_user_currencies(path), **user_data}
+            # Write to a temporary file first
+            with tempfile.NamedTemporaryFile('w', delete=False, dir=path.parent, suffix=".json") as temp_file:
+                json.dump(merged, temp_file, indent=4)
+                temp_name = temp_file.name
+            # Replace the old file with the new one atomically
+            Path(temp_name).replace(path)
     except OSError as e:
         raise CurrencySerializationError(f"Unable to save user-defined currencies. Error: {e}")
     except TypeError as e:
         raise CurrencySerializationError(f"User-defined currencies contain unserializable data. Error: {e}")
+    return merged
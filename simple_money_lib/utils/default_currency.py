@@ -1,11 +1,12 @@
-import threading
 from simple_money_lib.currency import Currency
 from simple_money_lib.currencies.all import XXX
+from simple_money_lib.utils import context as _context
 
 class DefaultCurrency:
-    """Manages the global default currency with thread safety."""
-    _default_currency = XXX  # Default to ISO 'XXX'
-    _lock = threading.Lock()
+    """
+    Manages the global default currency with thread safety. It can be overridden within a block of the current
+    thread or asyncio task, see simple_money_lib.utils.context.money_context.
+    """
 
     @classmethod
     def set(cls, currency: Currency | str = XXX) -> None:
@@ -15,11 +16,9 @@ class DefaultCurrency:
             currency: Currency object, or a string with valid currency code. Default is ISO's XXX, representing
                       undefined currency.
         """
-        with cls._lock:
-            cls._default_currency = Currency(currency)
+        _context.set_defaults(default_currency=Currency(currency))
 
     @classmethod
     def get(cls) -> Currency:
-        """Get the global default currency in a thread-safe manner."""
-        with cls._lock:
-            return cls._default_currency
+        """Get the effective default currency: of the current block, see money_context, or the global default."""
+        return _context.get_context().default_currency
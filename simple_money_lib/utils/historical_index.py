@@ -0,0 +1,59 @@
+import bisect
+import datetime
+from typing import NamedTuple
+
+
+class ValidityInterval(NamedTuple):
+    """A period of time in which a currency code had the given metadata. Open ends are None."""
+    valid_from: datetime.date | None
+    valid_to: datetime.date | None
+    metadata: dict | None  # None for the current record of the code, kept in the currency registry
+
+    def __contains__(self, day: datetime.date) -> bool:
+        return (self.valid_from is None or self.valid_from <= day) and (self.valid_to is None or day <= self.valid_to)
+
+
+class HistoricalIndex:
+    """
+    Immutable index of currency validity intervals, sorted by start date per code for binary search.
+    Codes not present in the index are not restricted in time.
+    """
+    def __init__(self, records: dict[str, list[dict]]):
+        self._intervals: dict[str, list[ValidityInterval]] = {}
+        self._starts: dict[str, list[datetime.date]] = {}
+        for code, code_records in records.items():
+            intervals = []
+            for record in code_records:
+                is_current = record.get('valid_to') is None and 'sub_unit' not in record
+                intervals.append(ValidityInterval(
+                    valid_from=self._parse_date(record.get('valid_from')),
+                    valid_to=self._parse_date(record.get('valid_to')),
+                    metadata=None if is_current else record,
+                ))
+            intervals.sort(key=lambda interval: interval.valid_from or datetime.date.min)
+            self._intervals[code.upper()] = intervals
+            self._starts[code.upper()] = [interval.valid_from or datetime.date.min for interval in intervals]
+
+    @staticmethod
+    def _parse_date(value: str | None) -> datetime.date | None:
+        return datetime.date.fromisoformat(value) if value else None
+
+    def lookup(self, code: str, day: datetime.date) -> ValidityInterval | None:
+        """Return the interval of the code containing the day, or None if the code was not valid on that day."""
+        intervals = self._intervals.get(code)
+        if not intervals:
+            return None
+        position = bisect.bisect_right(self._starts[code], day) - 1
+        if position >= 0 and day in intervals[position]:
+            return intervals[position]
+        return None
+
+    def current(self, code: str) -> ValidityInterval | None:
+        """Return the interval of the current record of the code, if its validity is restricted."""
+        for interval in self._intervals.get(code, ()):
+            if interval.metadata is None:
+                return interval
+        return None
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._intervals
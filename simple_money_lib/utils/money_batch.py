@@ -0,0 +1,105 @@
+from __future__ import annotations
+from array import array
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, Sequence
+
+from simple_money_lib.currency import Currency
+from simple_money_lib.money import Money, _restore_money
+
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def _compact(values: array, typecodes: str) -> array:
+    """Return the values as an array of the first of the typecodes able to hold all of them"""
+    if not values:
+        return array(typecodes[0])
+    low, high = min(values), max(values)
+    for typecode in typecodes:
+        bits = array(typecode).itemsize * 8
+        signed = typecode.islower()
+        if (-2 ** (bits - 1) if signed else 0) <= low and high < (2 ** (bits - 1) if signed else 2 ** bits):
+            return array(typecode, values)
+    return values
+
+
+class MoneyBatch(Sequence[Money]):
+    """
+    Compact, picklable sequence of Money objects, for shipping many amounts between processes, e.g., as an argument
+    of ProcessPoolExecutor tasks. Amounts are stored as integer arrays of minor units, each with an index into a
+    table of currencies. Currencies are pickled once per batch as codes and re-interned on load, so Money objects
+    read from an unpickled batch compare equal to those of the loading process.
+    Amounts which do not fit are kept as decimals.
+
+    Example:
+        batch = MoneyBatch(payments)                      # e.g., a list of 1M Money objects
+        future = executor.submit(settle, batch)           # settle(batch) iterates over Money objects
+    """
+
+    def __init__(self, moneys: Iterable[Money] = ()):
+        currencies: Dict[Currency, int] = {}  # Currency -> index in the table of currencies
+        sub_units: list[int] = []
+        indexes = array('I')
+        units = array('q')
+        decimals: Dict[int, Decimal] = {}  # Position -> amount not representable as 64-bit minor units
+        for position, money in enumerate(moneys):
+            currency = money.currency
+            if (index := currencies.get(currency)) is None:
+                index = currencies[currency] = len(currencies)
+                sub_units.append(currency.sub_unit if currency.sub_unit is not None else Currency.default_sub_unit)
+            indexes.append(index)
+            scaled = money.amount.scaleb(sub_units[index])
+            value = int(scaled) if scaled.is_finite() else None
+            if value is None or value != scaled or not _INT64_MIN <= value <= _INT64_MAX:
+                decimals[position] = money.amount
+                value = 0
+            units.append(value)
+        # Stored in the smallest integer types, as pickles of arrays are their raw bytes
+        self._set_state(tuple(currencies), _compact(indexes, 'BHI'), _compact(units, 'bhiq'), decimals)
+
+    def _set_state(self, currencies: tuple[Currency, ...], indexes: array, units: array,
+                   decimals: Dict[int, Decimal]) -> None:
+        self._currencies = currencies
+        self._indexes = indexes
+        self._units = units
+        self._decimals = decimals
+
+    def __getstate__(self):
+        return self._currencies, self._indexes, self._units, self._decimals
+
+    def __setstate__(self, state):
+        self._set_state(*state)
+
+    @property
+    def currencies(self) -> tuple[Currency, ...]:
+        """Distinct currencies of the batch, in order of first occurrence"""
+        return self._currencies
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def _money(self, position: int) -> Money:
+        currency = self._currencies[self._indexes[position]]
+        if self._decimals and position in self._decimals:
+            return _restore_money(Money, tuple(self._decimals[position].as_tuple()), currency)
+        return _restore_money(Money, self._units[position], currency)
+
+    def __getitem__(self, position: int | slice) -> Money | MoneyBatch:
+        if isinstance(position, slice):
+            return MoneyBatch(self._money(i) for i in range(*position.indices(len(self))))
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("MoneyBatch index out of range")
+        return self._money(position)
+
+    def __iter__(self) -> Iterator[Money]:
+        currencies = self._currencies
+        decimals = self._decimals
+        for position, (index, units) in enumerate(zip(self._indexes, self._units)):
+            if decimals and position in decimals:
+                yield _restore_money(Money, tuple(decimals[position].as_tuple()), currencies[index])
+            else:
+                yield _restore_money(Money, units, currencies[index])
+
+    def __repr__(self) -> str:
+        return f"MoneyBatch({len(self)} amounts in {', '.join(c.code for c in self._currencies) or 'no currency'})"
@@ -0,0 +1,65 @@
+import gc
+import os
+import threading
+
+import simple_money_lib.currency as _currency_module
+from simple_money_lib.currency import Currency
+from simple_money_lib.currencies.currency_collections import CurrencyCollection
+from simple_money_lib.money import Money
+from simple_money_lib.parsers import base_parser as _base_parser
+from simple_money_lib.utils import context as _context
+
+
+def preload(freeze: bool = False, gc_freeze: bool = False, registry: type[Currency] | None = None) -> None:
+    """
+    Fully materialize the currency registry and parser tables, e.g., in the parent process of a pre-fork server
+    (gunicorn with preload_app, multiprocessing), so that worker processes share them copy-on-write instead of
+    building them lazily each.
+    Arguments:
+        freeze: make the registry read-only afterward, so that lookups need no locks (see Currency.freeze)
+        gc_freeze: move all objects tracked by the garbage collector to the permanent generation (see gc.freeze),
+                   so that collections in the workers do not touch, and thereby copy, the shared memory pages
+        registry: registry to preload, by default the one active for Money (Money.registry)
+    Example:
+        # gunicorn.conf.py
+        preload_app = True
+
+        def on_starting(server):
+            simple_money_lib.preload(freeze=True, gc_freeze=True)
+    """
+    registry = registry or Money.registry.get()
+    if freeze:
+        registry.freeze()
+    else:
+        registry.preload()
+
+    CurrencyCollection.where()  # Builds the id mapping used by where() and filter()
+    default_parser, parser = Money.parser.get_default(), Money.parser.get()
+    default_parser.prepare()
+    if parser is not default_parser:
+        parser.prepare()
+
+    if gc_freeze:
+        gc.collect()
+        gc.freeze()
+
+
+def _reinit_locks_after_fork() -> None:
+    """
+    Replace all locks of the library in a forked child process. A lock held by another thread of the parent at
+    the time of the fork would never be released in the child.
+    """
+    registries = [Currency]
+    while registries:
+        registry = registries.pop()
+        if '_lock' in vars(registry):
+            registry._lock = threading.Lock()
+        registries.extend(registry.__subclasses__())
+    _currency_module._ids_lock = threading.Lock()
+    _context._global_lock = threading.Lock()
+    for parser in list(_base_parser._parsers_with_locks):  # E.g., CachedParser and LearningParser instances
+        parser._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows, where processes are spawned instead
+    os.register_at_fork(after_in_child=_reinit_locks_after_fork)
@@ -0,0 +1,29 @@
+from simple_money_lib.currency import Currency
+from simple_money_lib.utils import context as _context
+
+
+class RegistryManager:
+    """
+    Manages currency registries: a global default and overrides in the current thread or asyncio task.
+    See simple_money_lib.utils.context for the storage.
+    """
+
+    def set_default(self, registry: type[Currency]):
+        """Set the global default registry, e.g., one created with Currency.new_registry()."""
+        _context.set_defaults(registry=registry)
+
+    def get_default(self) -> type[Currency]:
+        """Get the global default registry."""
+        return _context.get_defaults().registry
+
+    def set(self, registry: type[Currency]):
+        """Set the registry of the current thread or asyncio task, e.g., for the tenant served by it."""
+        _context.set_local(registry=registry)
+
+    def get(self) -> type[Currency]:
+        """Get the effective registry: of the current thread or asyncio task, or the global default."""
+        return _context.get_context().registry
+
+    def reset(self):
+        """Reset the registry of the current thread or asyncio task to the global default."""
+        _context.set_local(registry=None)
@@ -0,0 +1,202 @@
+from __future__ import annotations
+from array import array
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterable, Iterator
+import datetime
+import struct
+
+from simple_money_lib.currency import Currency
+from simple_money_lib.money import Money, _restore_money
+from simple_money_lib.exceptions import CurrencyMismatch
+from simple_money_lib.utils.money_batch import MoneyBatch
+from simple_money_lib.utils.registry import RegistryManager
+
+# Layout of the shared memory block: header, currencies (code of up to 8 characters and, for withdrawn currencies,
+# the ordinal of a day of their validity, else 0), currency index per row (uint16), minor units per row (int64).
+# Sections start at multiples of 8 bytes.
+_MAGIC = b"SMLCOL2\0"
+_HEADER = struct.Struct("<8sqq")  # Magic, number of rows, number of currencies
+_CURRENCY = struct.Struct("<8sq")  # Code, day ordinal
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) // 8 * 8
+
+
+class SharedMoneyColumn:
+    """
+    Column of Money amounts in shared memory (multiprocessing.shared_memory), stored as int64 minor units and
+    uint16 indexes into a table of currency codes, for reading and aggregating in several processes without copying.
+    The creating process owns the memory; other processes attach by name, or receive the column as an argument,
+    which pickles as its name only. Works with both fork and spawn start methods.
+
+    Memory is released deterministically with close() in each process and unlink() by the owner, or by using
+    the column as a context manager, which does both as applicable.
+
+    Example:
+        with SharedMoneyColumn.create(amounts) as column:         # In the parent process
+            chunks = [(column, start, start + 100_000) for start in range(0, len(column), 100_000)]
+            totals = list(executor.map(partial_total, *zip(*chunks)))
+
+        def partial_total(column, start, stop):                    # In a worker process
+            with column:
+                return column.total(start, stop)                   # Money
+    """
+
+    def __init__(self, memory: SharedMemory, owner: bool):
+        """Use SharedMoneyColumn.create() or SharedMoneyColumn.attach()"""
+        self._memory = memory
+        self._owner = owner
+        self._closed = False
+        buffer = memory.buf
+        magic, length, count = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            raise ValueError(f"Shared memory '{memory.name}' does not contain a Money column")
+        offset = _HEADER.size
+        registry = RegistryManager().get()
+        currencies = []
+        for code, day in _CURRENCY.iter_unpack(bytes(buffer[offset:offset + count * _CURRENCY.size])):
+            code = code.rstrip(b"\0").decode("ascii")
+            # Withdrawn currencies are restored as when unpickled, see Currency.__reduce__
+            currencies.append(Currency.as_of(code, datetime.date.fromordinal(day)) if day else registry(code))
+        self._currencies = tuple(currencies)
+        offset = _align(offset + count * _CURRENCY.size)
+        self._indexes = buffer[offset:offset + length * 2].cast("H")
+        offset = _align(offset + length * 2)
+        self._units = buffer[offset:offset + length * 8].cast("q")
+
+    @classmethod
+    def create(cls, moneys: Iterable[Money], name: str | None = None) -> SharedMoneyColumn:
+        """
+        Copy Money amounts into a new shared memory block, owned by the calling process.
+        Arguments:
+            moneys: Money objects, or a MoneyBatch
+            name: name of the shared memory block, by default a unique one
+        Raises:
+            ValueError if an amount is not a whole number of minor units fitting into 64 bits,
+            or if there are more than 65536 currencies
+        """
+        batch = moneys if isinstance(moneys, MoneyBatch) else MoneyBatch(moneys)
+        if batch._decimals:
+            position = next(iter(batch._decimals))
+            raise ValueError(f"Amount cannot be stored as 64-bit minor units: {batch[position]}")
+        if len(batch.currencies) > 0x10000:
+            raise ValueError("A Money column supports at most 65536 currencies")
+
+        length, count = len(batch), len(batch.currencies)
+        currencies_offset = _HEADER.size
+        indexes_offset = _align(currencies_offset + count * _CURRENCY.size)
+        units_offset = _align(indexes_offset + length * 2)
+        memory = SharedMemory(name=name, create=True, size=max(units_offset + length * 8, 1))
+        try:
+            buffer = memory.buf
+            _HEADER.pack_into(buffer, 0, _MAGIC, length, count)
+            for i, currency in enumerate(batch.currencies):
+                validity = currency._validity
+                day = (validity.valid_from or datetime.date.min).toordinal() if validity is not None else 0
+                _CURRENCY.pack_into(buffer, currencies_offset + i * _CURRENCY.size, currency.code.encode("ascii"), day)
+            with buffer[indexes_offset:indexes_offset + length * 2].cast("H") as indexes:
+                indexes[:] = array("H", batch._indexes)
+            with buffer[units_offset:units_offset + length * 8].cast("q") as units:
+                units[:] = array("q", batch._units)
+            return cls(memory, owner=True)
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name: str) -> SharedMoneyColumn:
+        """
+        Attach to a column created by another process. Currency codes are resolved with the active registry,
+        and withdrawn currencies with Currency.as_of().
+        """
+        try:
+            memory = SharedMemory(name=name, track=False)  # Python 3.13+
+        except TypeError:
+            memory = SharedMemory(name=name)
+            # Only the owner unlinks the memory; the resource tracker would do so when this process exits
+            resource_tracker.unregister(memory._name, "shared_memory")
+        return cls(memory, owner=False)
+
+    def __reduce__(self):
+        """Pickle as the name, so that workers attach to the same memory instead of receiving a copy"""
+        return SharedMoneyColumn.attach, (self.name,)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def currencies(self) -> tuple[Currency, ...]:
+        """Distinct currencies of the column; currency_indexes refer to them"""
+        return self._currencies
+
+    @property
+    def minor_units(self) -> memoryview:
+        """Amounts as minor units of their currencies, a read-write view of the shared memory"""
+        return self._units
+
+    @property
+    def currency_indexes(self) -> memoryview:
+        """Index into currencies per row, a read-write view of the shared memory"""
+        return self._indexes
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def __getitem__(self, position: int) -> Money:
+        return _restore_money(Money, self._units[position], self._currencies[self._indexes[position]])
+
+    def __iter__(self) -> Iterator[Money]:
+        currencies = self._currencies
+        for index, units in zip(self._indexes, self._units):
+            yield _restore_money(Money, units, currencies[index])
+
+    def totals(self, start: int = 0, stop: int | None = None) -> Dict[Currency, Money]:
+        """Return the sum of the rows start to stop (exclusive) per currency"""
+        units, indexes = self._units[start:stop], self._indexes[start:stop]
+        if len(self._currencies) == 1:
+            sums = {0: sum(units)} if len(units) else {}
+        else:
+            sums = {}
+            for index, value in zip(indexes, units):
+                sums[index] = sums.get(index, 0) + value
+        return {self._currencies[index]: _restore_money(Money, value, self._currencies[index])
+                for index, value in sorted(sums.items())}
+
+    def total(self, start: int = 0, stop: int | None = None) -> Money | int:
+        """
+        Return the sum of the rows start to stop (exclusive), or 0 if there are none.
+        Raises:
+            CurrencyMismatch if the rows are in different currencies
+        """
+        totals = self.totals(start, stop)
+        if len(totals) > 1:
+            raise CurrencyMismatch
+        return next(iter(totals.values()), 0)
+
+    def close(self) -> None:
+        """Release the views and detach from the shared memory. The column cannot be used afterward."""
+        if self._closed:
+            return
+        self._closed = True
+        self._units.release()
+        self._indexes.release()
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Free the shared memory once all processes have closed it. Called by the owner only."""
+        self._memory.unlink()
+
+    def __enter__(self) -> SharedMoneyColumn:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __repr__(self) -> str:
+        return f"SharedMoneyColumn(name='{self.name}'{', closed' if self._closed else f', {len(self)} amounts'})"
@@ -0,0 +1,107 @@
+import pytest
+
+import random
+import threading
+from decimal import Decimal
+
+from simple_money_lib import AccountBook, Money, Currency
+from simple_money_lib.exceptions import (CurrencyMismatch, AccountExistsError, AccountNotFoundError,
+                                         InsufficientFundsError, HoldNotFoundError)
+
+
+@pytest.fixture
+def book():
+    book = AccountBook(stripes=4)
+    book.open("alice", "EUR", Money("100 EUR"))
+    book.open("bob", Currency("EUR"))
+    book.open("yuki", "JPY", Money("1000 JPY"))
+    return book
+
+def test_open(book):
+    assert "alice" in book and "carol" not in book and len(book) == 3
+    assert book.balance("alice") == Money("100 EUR") and book.balance("bob") == Money("0 EUR")
+    assert book.currency("yuki") is Currency("JPY")
+    with pytest.raises(AccountExistsError):
+        book.open("alice", "EUR")
+    with pytest.raises(CurrencyMismatch):
+        book.open("carol", "USD", Money("1 EUR"))
+    with pytest.raises(AccountNotFoundError):
+        book.balance("carol")
+
+def test_credit_and_debit(book):
+    book.credit("bob", Money("12.34 EUR"))
+    book.debit("alice", Money("0.01 EUR"))
+    assert book.balance("bob") == Money("12.34 EUR") and book.balance("alice") == Money("99.99 EUR")
+
+    with pytest.raises(InsufficientFundsError) as error:
+        book.debit("bob", Money("12.35 EUR"))
+    assert error.value.available == Money("12.34 EUR")
+    assert book.balance("bob") == Money("12.34 EUR")
+
+    with pytest.raises(CurrencyMismatch):
+        book.credit("yuki", Money("1 EUR"))
+    with pytest.raises(ValueError):
+        book.credit("bob", Money("-1 EUR"))
+    with pytest.raises(TypeError):
+        book.credit("bob", Decimal("1"))
+
+def test_transfer(book):
+    book.transfer("alice", "bob", Money("30 EUR"))
+    assert book.balance("alice") == Money("70 EUR") and book.balance("bob") == Money("30 EUR")
+    with pytest.raises(InsufficientFundsError):
+        book.transfer("bob", "alice", Money("30.01 EUR"))
+    with pytest.raises(CurrencyMismatch):
+        book.transfer("alice", "yuki", Money("1 EUR"))
+    assert book.balance("alice") == Money("70 EUR") and book.balance("yuki") == Money("1000 JPY")
+
+def test_holds(book):
+    hold = book.reserve("alice", Money("60 EUR"))
+    assert book.balance("alice") == Money("100 EUR") and book.available("alice") == Money("40 EUR")
+    with pytest.raises(InsufficientFundsError):
+        book.debit("alice", Money("40.01 EUR"))
+    with pytest.raises(InsufficientFundsError):
+        book.reserve("alice", Money("40.01 EUR"))
+
+    assert book.commit(hold, to="bob") == Money("60 EUR")
+    assert book.balance("alice") == Money("40 EUR") and book.available("alice") == Money("40 EUR")
+    assert book.balance("bob") == Money("60 EUR")
+    with pytest.raises(HoldNotFoundError):
+        book.commit(hold)
+
+    hold = book.reserve("alice", Money("40 EUR"))
+    with pytest.raises(CurrencyMismatch):
+        book.commit(hold, to="yuki")
+    assert book.release(hold) == Money("40 EUR")
+    assert book.available("alice") == Money("40 EUR")
+    with pytest.raises(HoldNotFoundError):
+        book.release(hold)
+
+def test_concurrent_transfers_keep_total():
+    book = AccountBook(stripes=8)
+    accounts = [f"account{i}" for i in range(50)]
+    for account in accounts:
+        book.open(account, "USD", Money("100 USD"))
+    snapshot_totals = []
+
+    def transfers(seed):
+        rng = random.Random(seed)
+        for _ in range(2000):
+            source, target = rng.sample(accounts, 2)
+            try:
+                book.transfer(source, target, Money(rng.randint(1, 5000), "USD"))
+            except InsufficientFundsError:
+                pass
+
+    def snapshots():
+        for _ in range(50):
+            snapshot_totals.append(sum(book.snapshot().values()))
+
+    threads = [threading.Thread(target=transfers, args=(seed,)) for seed in range(4)]
+    threads.append(threading.Thread(target=snapshots))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert set(snapshot_totals) == {Money("5000 USD")}
+    assert all(balance.amount >= 0 for balance in book.snapshot().values())
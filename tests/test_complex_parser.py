@@ -1,79 +1,147 @@
-# import pytest
-#
-# from decimal import Decimal
-#
-# from simple_money_lib.parsers.complex_parser import ComplexMoneyParser
-# from _inactive.context_templates import *
-#
-#
-# no_currency_value: str = 'SEK'
-#
-#
-# # Set up the context
-# @pytest.fixture(scope="module", autouse=True)
-# def setup_context():
-#     DefaultCurrencyContext.activate()
-#
-#
-# def test_zero_decimals():
-#     test_cases = [
-#         ("0", (Decimal('0.00'), no_currency_value)),
-#         ("0.0", (Decimal('0.00'), no_currency_value)),
-#         ("0,0", (Decimal('0.00'), no_currency_value)),
-#         ("0.00", (Decimal('0.00'), no_currency_value)),
-#         ("0,00", (Decimal('0.00'), no_currency_value)),
-#         ("0USD", (Decimal('0.00'), 'USD')),
-#         ("USD0.0", (Decimal('0.00'), 'USD')),
-#         ("0,0 USD", (Decimal('0.00'), 'USD')),
-#         ("USD 0.00", (Decimal('0.00'), 'USD')),
-#         ("0,00EUR", (Decimal('0.00'), 'EUR')),
-#     ]
-#
-#     mp = ComplexMoneyParser()
-#
-#     for test_input, expected_output in test_cases:
-#         result = mp.parse(test_input)
-#         assert result == expected_output, f"Failed on '{test_input}'"
-#
-#
-# def test_non_zero_decimals():
-#     test_cases = [
-#         ("0.01", (Decimal('0.01'), no_currency_value)),
-#         ("0.1", (Decimal('0.10'), no_currency_value)),
-#         ("0,10", (Decimal('0.10'), no_currency_value)),
-#         ("0.77", (Decimal('0.77'), no_currency_value)),
-#         ("0.03USD", (Decimal('0.03'), 'USD')),
-#         ("USD0.03", (Decimal('0.03'), 'USD')),
-#         ("0,3 USD", (Decimal('0.30'), 'USD')),
-#         ("USD 0.30", (Decimal('0.30'), 'USD')),
-#         ("123,31EUR", (Decimal('123.31'), 'EUR')),
-#         ("123,31", (Decimal('123.31'), no_currency_value)),
-#     ]
-#
-#     mp = ComplexMoneyParser()
-#
-#     for test_input, expected_output in test_cases:
-#         result = mp.parse(test_input)
-#         assert result == expected_output, f"Failed on '{test_input}'"
-#
-#
-# def test_money_parser():
-#     test_cases = [
-#         ("kr000", (Decimal('0.00'), 'SEK')),
-#         ("000kr", (Decimal('0.00'), 'SEK')),
-#         ("$1,250.50", (Decimal('1250.50'), 'USD')),
-#         ("1,250.50$", (Decimal('1250.50'), 'USD')),
-#         ("€ 1 250,50", (Decimal('1250.50'), 'EUR')),
-#         ("USD 1000", (Decimal('1000'), 'USD')),
-#         ("50.55 kr", (Decimal('50.55'), 'SEK')),
-#         ("kr.55", (Decimal('0.55'), 'SEK')),
-#         ("0", (Decimal('0.00'), 'SEK')),
-#         (".5", (Decimal('0.50'), 'SEK'))  # Adjust based on behavior
-#     ]
-#
-#     mp = ComplexMoneyParser()
-#
-#     for test_input, expected_output in test_cases:
-#         result = mp.parse(test_input)
-#         # print(result[0], str(result[1]))
-#         assert result == expected_output, f"Failed on '{test_input}'"
+import pytest
+
+from decimal import Decimal
+
+from simple_money_lib import Money
+from simple_money_lib.parsers.complex_parser import ComplexMoneyParser
+
+
+no_currency_value = None  # Money falls back to its default currency
+
+
+def test_zero_decimals():
+    test_cases = [
+        ("0", (Decimal('0.00'), no_currency_value)),
+        ("0.0", (Decimal('0.00'), no_currency_value)),
+        ("0,0", (Decimal('0.00'), no_currency_value)),
+        ("0.00", (Decimal('0.00'), no_currency_value)),
+        ("0,00", (Decimal('0.00'), no_currency_value)),
+        ("0USD", (Decimal('0.00'), 'USD')),
+        ("USD0.0", (Decimal('0.00'), 'USD')),
+        ("0,0 USD", (Decimal('0.00'), 'USD')),
+        ("USD 0.00", (Decimal('0.00'), 'USD')),
+        ("0,00EUR", (Decimal('0.00'), 'EUR')),
+    ]
+
+    mp = ComplexMoneyParser()
+
+    for test_input, expected_output in test_cases:
+        result = mp.parse(test_input)
+        assert result == expected_output, f"Failed on '{test_input}'"
+
+
+def test_non_zero_decimals():
+    test_cases = [
+        ("0.01", (Decimal('0.01'), no_currency_value)),
+        ("0.1", (Decimal('0.10'), no_currency_value)),
+        ("0,10", (Decimal('0.10'), no_currency_value)),
+        ("0.77", (Decimal('0.77'), no_currency_value)),
+        ("0.03USD", (Decimal('0.03'), 'USD')),
+        ("USD0.03", (Decimal('0.03'), 'USD')),
+        ("0,3 USD", (Decimal('0.30'), 'USD')),
+        ("USD 0.30", (Decimal('0.30'), 'USD')),
+        ("123,31EUR", (Decimal('123.31'), 'EUR')),
+        ("123,31", (Decimal('123.31'), no_currency_value)),
+    ]
+
+    mp = ComplexMoneyParser()
+
+    for test_input, expected_output in test_cases:
+        result = mp.parse(test_input)
+        assert result == expected_output, f"Failed on '{test_input}'"
+
+
+def test_money_parser():
+    test_cases = [
+        ("kr000", (Decimal('0.00'), 'SEK')),
+        ("000kr", (Decimal('0.00'), 'SEK')),
+        ("$1,250.50", (Decimal('1250.50'), 'USD')),
+        ("1,250.50$", (Decimal('1250.50'), 'USD')),
+        ("€ 1 250,50", (Decimal('1250.50'), 'EUR')),
+        ("USD 1000", (Decimal('1000'), 'USD')),
+        ("50.55 kr", (Decimal('50.55'), 'SEK')),
+        ("kr.55", (Decimal('0.55'), 'SEK')),
+        ("0", (Decimal('0.00'), no_currency_value)),
+        (".5", (Decimal('0.50'), no_currency_value)),
+    ]
+
+    mp = ComplexMoneyParser()
+
+    for test_input, expected_output in test_cases:
+        result = mp.parse(test_input)
+        assert result == expected_output, f"Failed on '{test_input}'"
+
+
+def test_locale_formats():
+    test_cases = [
+        ("1.234,56 €", (Decimal('1234.56'), 'EUR')),
+        ("CHF 1'234.50", (Decimal('1234.50'), 'CHF')),
+        ("Fr. 1’234.50", (Decimal('1234.50'), 'CHF')),
+        ("1\xa0234,56\xa0€", (Decimal('1234.56'), 'EUR')),
+        ("1 234 567,5 EUR", (Decimal('1234567.5'), 'EUR')),
+        ("1,234,567", (Decimal('1234567'), no_currency_value)),
+        ("₹1,00,000", (Decimal('100000'), 'INR')),
+        ("１２３，４５６．７８ JPY", (Decimal('123456.78'), 'JPY')),
+        ("٣٬٤٥٦٫٧٨ USD", (Decimal('3456.78'), 'USD')),
+        ("kr. 100", (Decimal('100'), 'DKK')),
+        ("US$ 10", (Decimal('10'), 'USD')),
+        ("12.34 usd", (Decimal('12.34'), 'USD')),
+    ]
+
+    mp = ComplexMoneyParser()
+
+    for test_input, expected_output in test_cases:
+        result = mp.parse(test_input)
+        assert result == expected_output, f"Failed on '{test_input}'"
+
+
+def test_negatives():
+    test_cases = [
+        ("(1,234.56)", (Decimal('-1234.56'), no_currency_value)),
+        ("($1,234.56)", (Decimal('-1234.56'), 'USD')),
+        ("(1.234,56) EUR", (Decimal('-1234.56'), 'EUR')),
+        ("EUR (5)", (Decimal('-5'), 'EUR')),
+        ("-1.234,56 €", (Decimal('-1234.56'), 'EUR')),
+        ("€-5", (Decimal('-5'), 'EUR')),
+        ("−5 USD", (Decimal('-5'), 'USD')),
+        ("5- USD", (Decimal('-5'), 'USD')),
+        ("+5 USD", (Decimal('5'), 'USD')),
+    ]
+
+    mp = ComplexMoneyParser()
+
+    for test_input, expected_output in test_cases:
+        result = mp.parse(test_input)
+        assert result == expected_output, f"Failed on '{test_input}'"
+
+
+def test_decimal_separator():
+    mp = ComplexMoneyParser(decimal_separator=",")
+    assert mp.parse("1.250 €") == (Decimal('1250'), 'EUR')
+    assert mp.parse("1,250 €") == (Decimal('1.250'), 'EUR')
+    assert mp.parse("1.234.567,8") == (Decimal('1234567.8'), no_currency_value)
+    with pytest.raises(ValueError):
+        mp.parse("1,234.56")
+
+    assert ComplexMoneyParser().parse("1,250") == (Decimal('1250'), no_currency_value)
+    assert ComplexMoneyParser(decimal_separator=".").parse("1,250") == (Decimal('1250'), no_currency_value)
+    with pytest.raises(ValueError):
+        ComplexMoneyParser(decimal_separator=";")
+
+
+def test_invalid():
+    mp = ComplexMoneyParser(allow_ambiguous=False)
+
+    for test_input in ["", "USD", "abc", "1,23,4", "1,2,345", "1.234.5", "1,234'567", "(5", "5)", "-(5)",
+                       "--5", "USD 5 EUR", "5 XYZ", "1.2.3,4", "$5", "100 U S D", "U SD 100", "5 EUR EUR"]:
+        with pytest.raises(ValueError):
+            mp.parse(test_input)
+
+
+def test_with_money():
+    Money.parser.set(ComplexMoneyParser())
+    try:
+        assert Money("1.234,56 €") == Money("1234.56", "EUR")
+        assert Money("(12.50) USD") == Money("-12.50", "USD")
+    finally:
+        Money.parser.reset()
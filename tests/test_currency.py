@@ -1,15 +1,24 @@
 import pytest
 from unittest.mock import patch
 
+import datetime
+import json
+import multiprocessing
 import threading
 
 from simple_money_lib.currency import Currency
-from simple_money_lib.exceptions import CurrencyExistsError, CurrencyCodeInvalid
+from simple_money_lib.exceptions import (CurrencyExistsError, CurrencyCodeInvalid, CurrencyNotFoundError,
+                                         CurrencyNumericExistsError, CurrencyRegistryFrozenError)
+from simple_money_lib.utils.currency_serialize import save_user_currencies
+from simple_money_lib.utils.alias_trie import AliasTrie, CurrencyAlias
 
 # Reset the class for each test to clean state
 @pytest.fixture(autouse=True)
 def reset_currency_registry():
     Currency._registry.clear()
+    Currency._snapshot = None
+    Currency.strict_mode = False
+    yield
     Currency.strict_mode = False
 
 @pytest.fixture(autouse=True)
@@ -115,3 +124,280 @@ def test_register_saves_user_currencies(mock_save):
     """Test that user-defined currencies are saved after registration."""
     Currency.register("BTC", numeric=1000, sub_unit=8, name="Bitcoin")
     mock_save.assert_called_once()
+
+@pytest.fixture
+def shared_user_file(tmp_path):
+    """Point the user currencies file to a temporary location, as if shared with other processes."""
+    user_file = tmp_path / "user_currencies.json"
+    with patch("simple_money_lib.utils.currency_serialize._USER_FILE", user_file), \
+            patch.object(Currency, "_user_file_signature", None), \
+            patch.object(Currency, "_user_file_checked_at", 0.0):
+        yield user_file
+
+def _write_user_file(path, codes):
+    """Simulate another process saving user-defined currencies."""
+    data = {code: {"numeric": None, "sub_unit": 2, "name": f"Currency {code}"} for code in codes}
+    path.write_text(json.dumps(data))
+
+def test_lookup_miss_picks_up_currency_saved_by_other_process(shared_user_file):
+    with pytest.raises(CurrencyNotFoundError):
+        Currency("SIB1")
+    _write_user_file(shared_user_file, ["SIB1"])
+    assert Currency("SIB1").name == "Currency SIB1"
+
+def test_reload_is_incremental(shared_user_file):
+    _write_user_file(shared_user_file, ["SIB1"])
+    sib1 = Currency("SIB1")
+    # Another process rewrites the file with new and changed records
+    shared_user_file.write_text(json.dumps({
+        "SIB1": {"numeric": None, "sub_unit": 4, "name": "Changed"},
+        "SIB2": {"numeric": None, "sub_unit": 2, "name": "Currency SIB2"},
+    }))
+    assert Currency("SIB2").code == "SIB2"
+    assert Currency("SIB1") is sib1
+    assert sib1.sub_unit == 2 and sib1.name == "Currency SIB1"
+
+def test_periodic_reload_respects_interval(shared_user_file):
+    with patch.object(Currency, "reload_interval", 3600):
+        Currency.all_currencies()  # Performs the first check
+        _write_user_file(shared_user_file, ["SIB1"])
+        assert "SIB1" not in Currency.all_currencies()
+    with patch.object(Currency, "reload_interval", 0):
+        assert "SIB1" in Currency.all_currencies()
+
+def test_register_detects_currency_registered_by_other_process(shared_user_file):
+    _write_user_file(shared_user_file, ["SIB1"])
+    Currency.strict_mode = True
+    with pytest.raises(CurrencyExistsError):
+        Currency.register("SIB1", numeric=None, sub_unit=2, name="Mine")
+
+def _save_in_process(code):
+    save_user_currencies({code: {"numeric": None, "sub_unit": 2, "name": code}})
+
+def test_save_merges_with_other_processes(shared_user_file):
+    _write_user_file(shared_user_file, ["SIB1"])
+    save_user_currencies({"SIB2": {"numeric": None, "sub_unit": 2, "name": "SIB2"}})
+    assert set(json.loads(shared_user_file.read_text())) == {"SIB1", "SIB2"}
+
+    codes = [f"PROC{i}" for i in range(8)]
+    with multiprocessing.get_context("fork").Pool(4) as pool:
+        pool.map(_save_in_process, codes)
+    assert set(json.loads(shared_user_file.read_text())) == {"SIB1", "SIB2", *codes}
+
+@pytest.fixture(autouse=True)
+def reset_secondary_indexes():
+    Currency._numeric_index = None
+    Currency._name_index = None
+
+def test_by_numeric():
+    assert Currency.by_numeric(978) is Currency("EUR")
+    assert Currency.by_numeric("752") is Currency("SEK")
+    assert Currency.by_numeric("008") is Currency("ALL")
+    assert Currency.by_numeric(123456) is None
+    assert Currency.by_numeric("abc") is None
+    assert Currency.by_numeric(None) is None
+
+def test_by_name():
+    assert Currency.by_name("Euro") is Currency("EUR")
+    assert Currency.by_name("  united states   DOLLAR ") is Currency("USD")
+    assert Currency.by_name("Unknown money") is None
+    assert Currency.by_name(None) is None
+
+def test_secondary_indexes_updated_on_register():
+    assert Currency.by_numeric(1000) is None  # Builds the indexes before registration
+    btc = Currency.register("BTC", numeric=1000, sub_unit=8, name="Bitcoin")
+    assert Currency.by_numeric(1000) is btc
+    assert Currency.by_name("bitcoin") is btc
+
+def test_non_integer_numeric():
+    for numeric in ("", "N/A", "9.5x"):
+        with pytest.raises(ValueError, match="Invalid numeric code"):
+            Currency.register("ZZQ", numeric=numeric, sub_unit=2, name="Invalid numeric")
+
+    # Such numeric codes in user data are not indexed
+    Currency._user_metadata()["ZZQ"] = {"numeric": "", "sub_unit": 2, "name": "Empty numeric"}
+    Currency._user_metadata()["ZZR"] = {"numeric": "N/A", "sub_unit": 2, "name": "Unknown numeric"}
+    assert Currency.by_numeric(978) is Currency("EUR")
+    assert Currency.by_name("empty numeric") is Currency("ZZQ")
+    Currency.preload()
+    assert Currency("ZZR").name == "Unknown numeric"
+
+def test_numeric_duplicates():
+    # Non-strict: registration succeeds, predefined owner of the numeric code is kept
+    Currency.register("EUR2", numeric=978, sub_unit=2, name="Euro copy")
+    assert Currency.by_numeric(978) is Currency("EUR")
+    assert Currency.by_name("Euro copy") is Currency("EUR2")
+
+    Currency.strict_mode = True
+    with pytest.raises(CurrencyNumericExistsError, match="Numeric code '978' is already used by currency 'EUR'"):
+        Currency.register("EUR3", numeric=978, sub_unit=2, name="Euro copy 2")
+
+@pytest.fixture(autouse=True)
+def reset_aliases():
+    Currency._alias_trie = None
+    yield
+    Currency._alias_trie = None
+
+def test_from_alias():
+    assert Currency.from_alias("€") is Currency("EUR")
+    assert Currency.from_alias("us$") is Currency("USD")
+    assert Currency.from_alias(" RUR ") is Currency("RUB")
+    assert Currency.from_alias("$") is Currency("USD")
+    assert Currency.from_alias("$", allow_ambiguous=False) is None
+    assert Currency.from_alias("unknown") is None
+    assert Currency.from_alias(None) is None
+
+def test_currency_resolves_unambiguous_aliases():
+    assert Currency("€") is Currency("EUR")
+    assert Currency("rur") is Currency("RUB")
+    with pytest.raises(CurrencyCodeInvalid):
+        Currency("$")  # Ambiguous
+    with pytest.raises(CurrencyNotFoundError):
+        Currency("KR1")
+
+def test_register_alias():
+    btc = Currency.register("BTC", numeric=1000, sub_unit=8, name="Bitcoin")
+    Currency.register_alias("₿", btc)
+    assert Currency("₿") is btc
+    assert Currency.from_alias("€") is Currency("EUR")  # Predefined aliases are kept
+    with pytest.raises(CurrencyNotFoundError):
+        Currency.register_alias("¤", "NOPE")
+    with pytest.raises(ValueError):
+        Currency.register_alias(" ", "EUR")
+
+def test_alias_trie_longest_match():
+    trie = AliasTrie([CurrencyAlias("$", "USD", True), CurrencyAlias("US$", "USD"), CurrencyAlias("kr", "SEK"),
+                      CurrencyAlias("kr.", "DKK")])
+    assert trie.longest_prefix("US$100") == (CurrencyAlias("US$", "USD"), 3)
+    assert trie.longest_prefix("$100") == (CurrencyAlias("$", "USD", True), 1)
+    assert trie.longest_prefix("KR. 100") == (CurrencyAlias("kr.", "DKK"), 3)
+    assert trie.longest_prefix("100 kr") is None
+    assert trie.longest_suffix("100 kr") == (CurrencyAlias("kr", "SEK"), 4)
+    assert trie.longest_suffix("100US$") == (CurrencyAlias("US$", "USD"), 3)
+    assert trie.longest_suffix("100") is None
+    assert "Kr" in trie and len(trie) == 4
+
+def test_for_country():
+    assert Currency.for_country("SE") is Currency("SEK")
+    assert Currency.for_country("swe") is Currency("SEK")
+    assert Currency.for_country("CH") is Currency("CHF")  # Not the complementary CHE or CHW
+    assert Currency.for_country("NA") is Currency("NAD")
+    assert Currency.for_country("AQ") is None
+    assert Currency.for_country("ZZ") is None
+    assert Currency.for_country(None) is None
+
+def test_countries():
+    assert Currency("SEK").countries == ("SE",)
+    assert {"FI", "DE", "AX"} <= set(Currency("EUR").countries)
+    assert "SE" not in Currency("EUR").countries
+    assert Currency("XXX").countries == ()
+
+def test_as_of_withdrawn_currency():
+    dem = Currency.as_of("DEM", datetime.date(1995, 3, 1))
+    assert dem.code == "DEM" and dem.sub_unit == 2 and dem.name == "German mark"
+    assert dem.valid_from == datetime.date(1948, 6, 21) and dem.valid_to == datetime.date(2001, 12, 31)
+    assert Currency.as_of("dem", "2001-12-31") is dem
+    assert Currency.as_of("DEM", datetime.datetime(1999, 1, 1, 12, 30)) is dem
+    assert Currency.as_of("DEM", "2002-01-01") is None
+    assert Currency.as_of("ITL", "1990-01-01").sub_unit == 0
+    with pytest.raises(CurrencyNotFoundError):
+        Currency("DEM")  # Withdrawn currencies are not in the main registry
+
+def test_as_of_current_currency():
+    assert Currency.as_of("EUR", "2002-01-01") is Currency("EUR")
+    assert Currency.as_of("EUR", "1998-12-31") is None
+    assert Currency.as_of(Currency("USD"), "1900-01-01") is Currency("USD")  # Not restricted
+    assert Currency("EUR").valid_from == datetime.date(1999, 1, 1)
+    assert Currency("EUR").valid_to is None and Currency("USD").valid_from is None
+    with pytest.raises(CurrencyNotFoundError):
+        Currency.as_of("XYZ1", "2000-01-01")
+
+def test_as_of_successive_denominations():
+    assert Currency.as_of("VEF", "2010-01-01").name == "Venezuelan bolívar fuerte"
+    assert Currency.as_of("VEF", "2019-01-01") is None
+    assert Currency.as_of("VES", "2019-01-01") is Currency("VES")
+    assert Currency.as_of("ZWN", "2007-01-01").numeric == 942
+
+def test_as_of_cache():
+    as_of = Currency.as_of_cache()
+    with patch.object(Currency, "as_of", wraps=Currency.as_of) as lookup:
+        rows = [("DEM", "1999-05-01"), ("DEM", "1999-05-01"), ("EUR", "1999-05-01"), ("DEM", "1999-05-01")]
+        results = [as_of(code, day) for code, day in rows]
+    assert lookup.call_count == 2
+    assert results[0] is results[1] is results[3] is Currency.as_of("DEM", "1999-05-01")
+    assert results[2] is Currency("EUR")
+
+def test_new_registry_is_isolated():
+    tenant = Currency.new_registry()
+    assert tenant._lock is not Currency._lock
+    abc = tenant.register("ABC1", numeric=None, sub_unit=3, name="Tenant currency")
+    assert tenant("ABC1") is abc and isinstance(abc, tenant)
+    assert abc.id == tenant("abc1").id
+    with pytest.raises(CurrencyNotFoundError):
+        Currency("ABC1")
+    assert "ABC1" not in Currency.all_currencies()
+    assert Currency.new_registry().get("ABC1") is None
+
+def test_new_registry_shares_predefined_currencies():
+    tenant = Currency.new_registry()
+    assert tenant("USD") is Currency("USD")
+    assert tenant.by_numeric(978) is Currency("EUR")
+    assert Currency(tenant("SEK")) is Currency("SEK")
+
+def test_new_registry_in_memory_is_not_saved(mock_save_user_currencies):
+    tenant = Currency.new_registry()
+    tenant.register("ABC1", numeric=None, sub_unit=2, name="Tenant currency")
+    mock_save_user_currencies.assert_not_called()
+
+def test_new_registry_with_own_file(tmp_path, mock_save_user_currencies):
+    user_file = tmp_path / "tenant.json"
+    _write_user_file(user_file, ["ABC1"])
+    tenant = Currency.new_registry(user_file)
+    assert tenant("ABC1").name == "Currency ABC1"
+    tenant.register("ABC2", numeric=None, sub_unit=2, name="Another")
+    mock_save_user_currencies.assert_called_once()
+    assert mock_save_user_currencies.call_args.args[1] == user_file
+
+    # Strict mode and caches are independent of the default registry
+    tenant.strict_mode = True
+    assert Currency.strict_mode is False
+    assert tenant.by_name("Another") is tenant("ABC2")
+    assert Currency.by_name("Another") is None
+
+def test_freeze_registry():
+    tenant = Currency.new_registry()
+    abc = tenant.register("ABC1", numeric=None, sub_unit=3, name="Tenant currency")
+    tenant.freeze()
+    assert tenant.is_frozen() and not Currency.is_frozen()
+    assert tenant._numeric_index is not None and tenant._alias_trie is not None
+
+    # Reads work without the lock
+    with tenant._lock:
+        assert tenant("abc1") is abc and tenant.get("ABC1") is abc
+        assert tenant("USD") is Currency("USD") and tenant.from_alias("€") is Currency("EUR")
+        assert tenant.by_numeric(978) is Currency("EUR")
+        currencies = tenant.all_currencies()
+    assert currencies is tenant.all_currencies() and "ABC1" in currencies and "USD" in currencies
+    with pytest.raises(TypeError):
+        currencies["ABC2"] = abc
+
+    with pytest.raises(CurrencyRegistryFrozenError):
+        tenant.register("ABC2", numeric=None, sub_unit=2, name="Another")
+    with pytest.raises(CurrencyRegistryFrozenError):
+        tenant.register_alias("A$C", "ABC1")
+    with pytest.raises(CurrencyNotFoundError):
+        tenant("ABC2")
+
+
+def test_reads_do_not_lock(mock_save_user_currencies):
+    usd = Currency("USD")
+    currencies = Currency.all_currencies()
+    Currency.by_numeric(978)
+    with Currency._lock:
+        assert Currency("usd") is usd and Currency.get("USD") is usd
+        assert Currency.all_currencies() is currencies
+        assert Currency.by_name("Euro") is Currency("EUR")
+
+    # The snapshot is replaced when currencies are added
+    Currency.register("ABC1", numeric=None, sub_unit=2, name="Test currency")
+    assert "ABC1" not in currencies and "ABC1" in Currency.all_currencies()
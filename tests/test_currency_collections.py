@@ -1,9 +1,11 @@
 import pytest
 from unittest.mock import patch
+import json
 import re
 
 from simple_money_lib.currency import Currency
-from simple_money_lib.exceptions import CurrencyNotFoundError, CurrencyCodeInvalid
+from simple_money_lib.exceptions import (CurrencyNotFoundError, CurrencyCodeInvalid, CurrencyCollectionNotFoundError,
+                                         CurrencySerializationError)
 from simple_money_lib.currencies.currency_collections.currency_collections import CurrencyCollection
 from simple_money_lib.currencies.all import EUR, RUB
 
@@ -64,10 +66,11 @@ def test_dynamic_addition_to_collection():
         assert collection.name == "Crypto Collection"
         assert collection.description == "Top cryptocurrencies"
 
-        # Add a second custom currency dynamically
-        collection._currencies["ETH"] = eth  # Simulate dynamic addition
+        # Collections are immutable, a second custom currency is added by union
+        collection = collection | CurrencyCollection(eth)
         assert "ETH" in collection
         assert eth in collection
+        assert btc in collection
 
 
 def test_invalid_currency():
@@ -120,3 +123,91 @@ def test_invalid_currency_code_in_initialization():
     with pytest.raises(CurrencyCodeInvalid, match=re.escape("Invalid currency code: ''")):
         CurrencyCollection("USD", "EUR", "")  # Empty string is invalid
 
+
+
+def test_set_operations():
+    a = CurrencyCollection("USD", "EUR", "RUB")
+    b = CurrencyCollection("EUR", "JPY")
+    assert set((a | b)._currencies) == {"USD", "EUR", "RUB", "JPY"}
+    assert set((a & b)._currencies) == {"EUR"}
+    assert set((a - b)._currencies) == {"USD", "RUB"}
+    assert set((a ^ b)._currencies) == {"USD", "RUB", "JPY"}
+    assert EUR in a & b and RUB not in a & b
+    assert CurrencyCollection("EUR") <= a and a >= CurrencyCollection("EUR")
+    assert not b <= a
+    assert a == CurrencyCollection(RUB, "EUR", "USD") and a != b
+    assert len(a | b) == 4
+    with pytest.raises(TypeError):
+        a | {"USD"}
+
+
+def test_collection_is_immutable(sample_collection):
+    with pytest.raises(TypeError):
+        sample_collection._currencies["JPY"] = Currency("JPY")
+
+
+def test_currency_ids_are_stable():
+    usd = Currency("USD")
+    assert isinstance(usd.id, int) and usd.id >= 0
+    assert usd.id != Currency("EUR").id
+    assert Currency("USD").id == usd.id
+
+
+def test_where_and_filter():
+    no_decimals = CurrencyCollection.where(sub_unit=0, name="No decimals")
+    assert no_decimals.name == "No decimals"
+    assert "JPY" in no_decimals and "KRW" in no_decimals and "USD" not in no_decimals
+    assert all(currency.sub_unit == 0 for currency in no_decimals)
+    assert set(CurrencyCollection.where(numeric=978)._currencies) == {"EUR"}
+    assert len(CurrencyCollection.where(sub_unit=2, numeric=978)) == 1
+    assert len(CurrencyCollection.where(sub_unit=42)) == 0
+
+    collection = CurrencyCollection("USD", "JPY", "EUR", "KRW")
+    assert set(collection.filter(sub_unit=0)._currencies) == {"JPY", "KRW"}
+
+
+def test_where_includes_registered_currencies():
+    with patch("simple_money_lib.currency.save_user_currencies"):
+        CurrencyCollection.where(sub_unit=7)  # Builds the index
+        currency = Currency.register("SEVEN7", numeric=None, sub_unit=7, name="Seven decimals")
+        assert currency in CurrencyCollection.where(sub_unit=7)
+
+
+def test_load_predefined_collection():
+    major = CurrencyCollection.load("major")
+    assert major.name == "major"
+    assert major.description == "10 most used currencies globally"
+    assert "USD" in major and "RUB" not in major
+    assert CurrencyCollection.load("major") is major  # Cached
+
+
+def test_load_unknown_collection():
+    with pytest.raises(CurrencyCollectionNotFoundError, match="Currency collection 'nope' not found"):
+        CurrencyCollection.load("nope")
+
+
+def test_load_user_collection_file(tmp_path):
+    path = tmp_path / "my_collections.json"
+    path.write_text(json.dumps({
+        "nordic": {"currencies": ["SEK", "NOK", "DKK", "ISK", "XYZ1"], "description": "Nordic currencies"},
+    }))
+    nordic = CurrencyCollection.load("nordic", path=path)
+    assert set(nordic._currencies) == {"SEK", "NOK", "DKK", "ISK"}
+    assert nordic.description == "Nordic currencies"
+    assert CurrencyCollection.load("nordic", path=str(path)) is nordic
+    with pytest.raises(CurrencyCollectionNotFoundError):
+        CurrencyCollection.load("major", path=path)
+    with pytest.raises(CurrencySerializationError):
+        CurrencyCollection.load("nordic", path=tmp_path / "missing.json")
+
+
+def test_generated_modules_are_lazy_aliases():
+    from simple_money_lib.currencies import major, brics_currencies
+    from simple_money_lib.currencies.major import USD, major_currencies
+    assert major_currencies is CurrencyCollection.load("major")
+    assert brics_currencies is CurrencyCollection.load("brics")
+    assert USD is Currency("USD")
+    with pytest.raises(AttributeError):
+        major.RUB
+    with pytest.raises(ImportError):
+        from simple_money_lib.currencies import nope_currencies
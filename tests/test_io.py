@@ -0,0 +1,153 @@
+import decimal
+import multiprocessing
+import pytest
+
+from simple_money_lib import Currency, Money
+from simple_money_lib.io import read_csv_money, parse_file_parallel, BadRow
+from simple_money_lib.parsers import CachedParser, ComplexMoneyParser
+from simple_money_lib.utils.context import money_context
+
+
+@pytest.fixture
+def payments(tmp_path):
+    path = tmp_path / "payments.csv"
+    path.write_text("id,amount,fee,currency\n"
+                    "1,12.345,0.10,USD\n"
+                    "2,100,,EUR\n"
+                    "3,5.5 EUR,0.01,EUR\n"
+                    "4,abc,0,USD\n"
+                    "5,7,1,XYZQ\n"
+                    "6,-2.50,0.5,JPY\n", encoding="utf-8")
+    return path
+
+
+def test_currency_column(payments):
+    bad_rows = []
+    rows = list(read_csv_money(payments, ["amount", "fee"], currency="currency", bad_rows=bad_rows))
+    assert [(row.line, row.moneys) for row in rows] == [
+        (2, (Money("12.34", "USD"), Money("0.10", "USD"))),
+        (4, (Money("5.50", "EUR"), Money("0.01", "EUR"))),
+        (7, (Money("-2", "JPY"), Money("0", "JPY"))),
+    ]
+    assert rows[0].row == ["1", "12.345", "0.10", "USD"]
+    assert [(bad_row.line, bad_row.column) for bad_row in bad_rows] == [(3, "fee"), (5, "amount"), (6, "currency")]
+    assert isinstance(bad_rows[0], BadRow)
+
+
+def test_currency_in_cells(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_text("12.34 USD;1.234,56 €\nEUR 5;(7.50)\n", encoding="utf-8")
+    with money_context(parser=ComplexMoneyParser(), default_currency="GBP"):
+        rows = list(read_csv_money(path, [0, 1], delimiter=";"))
+    assert [row.moneys for row in rows] == [(Money("12.34", "USD"), Money("1234.56", "EUR")),
+                                            (Money("5", "EUR"), Money("-7.50", "GBP"))]
+
+
+def test_fixed_currency_and_errors(payments):
+    with pytest.raises(ValueError, match="Line 5"):
+        list(read_csv_money(payments, ["amount"], currency=Currency("EUR")))
+    with pytest.raises(ValueError, match="not found in the header"):
+        read_csv_money(payments, ["total"])  # When called, not when iterated
+    with pytest.raises(FileNotFoundError):
+        read_csv_money(payments.with_name("missing.csv"), ["amount"])
+    with pytest.raises(ValueError):
+        read_csv_money(payments, [])
+
+    bad_rows = []
+    rows = list(read_csv_money(payments, [1], currency=Currency("EUR"), header=True, bad_rows=bad_rows))
+    assert [row.moneys[0] for row in rows] == [Money("12.34", "EUR"), Money("100", "EUR"), Money("5.50", "EUR"),
+                                              Money("7", "EUR"), Money("-2.50", "EUR")]
+    assert [bad_row.line for bad_row in bad_rows] == [5]
+
+
+def test_settings_of_the_call(payments):
+    tenant = Currency.new_registry()
+    tenant.register("XYZQ", None, 2, "Test currency")
+    with money_context(rounding=decimal.ROUND_HALF_UP, registry=tenant):
+        rows = read_csv_money(payments, ["amount"], currency="currency", bad_rows=[])
+    moneys = {row.line: row.moneys[0] for row in rows}  # Iterated with the settings of the call
+    assert moneys[2] == Money("12.35", "USD")
+    assert moneys[6].currency is tenant("XYZQ")
+
+
+def test_columnar(payments):
+    bad_rows = []
+    with money_context(rounding=decimal.ROUND_HALF_UP):
+        columns = read_csv_money(payments, ["amount", "fee"], currency="currency", columnar=True, bad_rows=bad_rows)
+    assert columns.currencies == (Currency("USD"), Currency("EUR"), Currency("JPY"))
+    assert list(columns.units["amount"]) == [1235, 550, -3]
+    assert list(columns.units["fee"]) == [10, 1, 1]
+    assert list(columns.currency_indexes["amount"]) == [0, 1, 2]
+    assert list(columns.lines) == [2, 4, 7]
+    assert len(bad_rows) == 3
+    assert Money.from_minor_units(columns.units["amount"][0], columns.currencies[0]) == Money("12.35", "USD")
+
+
+@pytest.fixture
+def settlements(tmp_path):
+    path = tmp_path / "settlements.txt"
+    lines = [f"{i}.{i % 1000:03d} {('USD', 'EUR', 'JPY')[i % 3]}" for i in range(2000)]
+    lines[10], lines[500] = "n/a", ""
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def comparable(results):
+    """Results with errors without their exception, which is another object when sent back by a worker"""
+    return [result._replace(errors=[error._replace(exception=str(error.exception)) for error in result.errors])
+            for result in results]
+
+
+def test_parse_file_parallel(settlements):
+    with money_context(rounding=decimal.ROUND_HALF_UP):
+        single = list(parse_file_parallel(settlements, workers=1, chunk_size=1000, arrays=True))
+        parallel = list(parse_file_parallel(settlements, workers=2, chunk_size=1000, arrays=True))
+    assert len(single) > 10
+    assert comparable(parallel) == comparable(single)
+    assert sum(result.lines for result in single) == 2000
+    assert [(result.offset, result.errors[0].position, result.errors[0].text) for result in single
+            if result.errors] == [(0, 10, "n/a")]
+
+    totals = {}
+    for result in single:
+        for currency, units in result.totals.items():
+            totals[currency] = totals.get(currency, 0) + units
+    with money_context(rounding=decimal.ROUND_HALF_UP):  # As when parsed
+        expected = {}
+        for i in range(2000):
+            if i not in (10, 500):
+                money = Money(f"{i}.{i % 1000:03d}", ("USD", "EUR", "JPY")[i % 3])
+                expected[money.currency] = expected.get(money.currency, 0) + money.minor_units
+    assert totals == expected
+
+    unordered = list(parse_file_parallel(settlements, workers=2, chunk_size=1000, ordered=False))
+    assert sorted(result.offset for result in unordered) == [result.offset for result in single]
+
+
+def test_parse_file_parallel_spawn(settlements):
+    with money_context(parser=CachedParser(ComplexMoneyParser()), rounding=decimal.ROUND_HALF_UP):
+        single = list(parse_file_parallel(settlements, workers=1, chunk_size=20_000))
+        spawned = list(parse_file_parallel(settlements, workers=2, chunk_size=20_000,
+                                           mp_context=multiprocessing.get_context("spawn")))
+    assert comparable(spawned) == comparable(single)
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_parse_file_parallel_isolated_registry(tmp_path, start_method):
+    if start_method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{start_method} is not available")
+    tenant = Currency.new_registry()
+    tenant.register("XTN", None, 2, "Tenant token")
+    path = tmp_path / "tokens.txt"
+    path.write_text("".join(f"{i}.50 {('XTN', 'USD')[i % 2]}\n" for i in range(1000)), encoding="utf-8")
+    mp_context = multiprocessing.get_context(start_method)
+    with money_context(registry=tenant):
+        single = list(parse_file_parallel(path, workers=1, chunk_size=1000))
+        if start_method != "fork":  # The registry class cannot be pickled for spawned workers
+            with pytest.raises(ValueError, match="isolated registry"):
+                parse_file_parallel(path, workers=2, chunk_size=1000, mp_context=mp_context)
+            return
+        parallel = list(parse_file_parallel(path, workers=2, chunk_size=1000, mp_context=mp_context))
+    assert parallel == single
+    assert parallel[0].currencies == (tenant("XTN"), tenant("USD")) and parallel[0].currencies[0] is tenant("XTN")
+    assert sum(result.totals[tenant("XTN")] for result in parallel) == sum(i * 100 + 50 for i in range(0, 1000, 2))
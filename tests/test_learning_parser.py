@@ -0,0 +1,67 @@
+import pytest
+
+from decimal import Decimal
+
+from simple_money_lib import Money
+from simple_money_lib.parsers import ComplexMoneyParser, LearningParser, SimpleParserWithAliases
+from simple_money_lib.parsers.learning_parser import MoneyFormat
+
+
+def test_learns_format():
+    parser = LearningParser(sample_size=3)
+    for test_input, expected_output in [("1.234,56 €", (Decimal("1234.56"), "EUR")),
+                                        ("12,00 €", (Decimal("12.00"), "EUR")),
+                                        ("-7,50 €", (Decimal("-7.50"), "EUR"))]:
+        assert parser.format is None
+        assert parser.parse(test_input) == expected_output
+    assert parser.format == MoneyFormat("", " €", ".", ",", 2, "EUR")
+
+    test_cases = [
+        ("999.999,99 €", (Decimal("999999.99"), "EUR")),
+        ("1234,50 €", (Decimal("1234.50"), "EUR")),
+        ("-0,01 €", (Decimal("-0.01"), "EUR")),
+        ("(5,00) €", (Decimal("-5.00"), "EUR")),  # Not matching: parsed by the general parser
+        ("1,5 €", (Decimal("1.5"), "EUR")),
+    ]
+    for test_input, expected_output in test_cases:
+        result = parser.parse(test_input)
+        assert result == expected_output, f"Failed on '{test_input}'"
+    assert (parser.matched, parser.fallbacks) == (3, 2)
+
+    for test_input in ["--5,00 €", "12.34,56 €"]:
+        with pytest.raises(ValueError):
+            parser.parse(test_input)
+
+def test_learns_format_with_prefix():
+    parser = LearningParser(SimpleParserWithAliases(), sample_size=2)
+    Money.parser.set(parser)
+    try:
+        assert [Money(s) for s in ["USD 12.50", "USD 0.99", "USD 1000.00"]] == \
+               [Money("12.50", "USD"), Money("0.99", "USD"), Money("1000", "USD")]
+    finally:
+        Money.parser.reset()
+    assert parser.format == MoneyFormat("USD ", "", None, ".", 2, "USD")
+    assert parser.matched == 1
+
+def test_mixed_formats():
+    parser = LearningParser(sample_size=2)
+    parser.parse("1.234,56 €")
+    parser.parse("$12.00")
+    assert parser.format is None
+    assert parser.parse("EUR 5") == (Decimal("5"), "EUR")
+    assert (parser.matched, parser.fallbacks) == (0, 1)
+    parser.reset()
+    parser.parse("$12.00")
+    parser.parse("$1,000.00")
+    assert parser.format == MoneyFormat("$", "", ",", ".", 2, "USD")
+
+def test_leading_zero_falls_back():
+    parser = LearningParser(sample_size=2)
+    parser.parse("1.234 €")
+    parser.parse("5.678 €")
+    assert parser.format == MoneyFormat("", " €", ".", None, 0, "EUR")
+    general = ComplexMoneyParser()
+    for test_input in ["0.500 €", "012.345 €", "9.999 €", "012 €"]:
+        assert parser.parse(test_input) == general.parse(test_input), f"Failed on '{test_input}'"
+    assert parser.parse("0.500 €") == (Decimal("0.500"), "EUR")
+    assert (parser.matched, parser.fallbacks) == (2, 3)
@@ -4,7 +4,9 @@ import pytest
 from unittest.mock import patch
 import re
 
+import asyncio
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from decimal import Decimal
 from simple_money_lib.money import Money
@@ -13,6 +15,7 @@ from simple_money_lib.currencies.all import XXX, EUR
 from simple_money_lib.exceptions import CurrencyMismatch, MoneyDivisionIllegal, MoneyInvalidOperation
 import simple_money_lib.parsers as parsers
 from simple_money_lib.utils.default_currency import DefaultCurrency
+from simple_money_lib.utils.context import money_context, get_context, bind_context, ContextThreadPoolExecutor
 
 
 @pytest.fixture(autouse=True)
@@ -865,3 +868,88 @@ class TestMoneyDefaultCurrency:
         # Check final state
         final_currency = Money.default_currency.get()
         assert final_currency.code in ("USD", "EUR")  # Either thread's update is valid
+
+@pytest.mark.usefixtures("mock_save_user_currencies")
+class TestMoneyRegistry:
+    @pytest.fixture(autouse=True)
+    def reset_registry(self):
+        yield
+        Money.registry.reset()
+        Money.registry.set_default(Currency)
+
+    def test_default_registry(self):
+        assert Money.registry.get() is Currency
+
+    def test_thread_local_registry(self):
+        tenant = Currency.new_registry()
+        tenant.register("TNT1", numeric=None, sub_unit=4, name="Tenant token")
+        with pytest.raises(ValueError):
+            Money(1, "TNT1")
+
+        Money.registry.set(tenant)
+        assert Money(1, "TNT1").currency is tenant("TNT1")
+        assert str(Money("TNT1 2.5")) == "2.5000 TNT1"
+        assert Money(1, "USD").currency is Currency("USD")
+
+        results = []
+        thread = threading.Thread(target=lambda: results.append(Money.registry.get()))
+        thread.start()
+        thread.join()
+        assert results == [Currency]
+
+    def test_parser_bound_to_registry(self):
+        tenant = Currency.new_registry()
+        tenant.register("TNT1", numeric=None, sub_unit=4, name="Tenant token")
+        assert parsers.BaseParser(registry=tenant).parse("5 TNT1") == (Decimal("5"), "TNT1")
+        with pytest.raises(ValueError):
+            parsers.BaseParser().parse("5 TNT1")
+
+
+def test_minor_units():
+    assert Money("12.34 USD").minor_units == 1234
+    assert Money("-0.05 EUR").minor_units == -5
+    assert Money("1000 JPY").minor_units == 1000
+    assert Money.from_minor_units(1234, "USD") == Money("12.34 USD")
+    assert Money.from_minor_units(-5, Currency("EUR")) == Money("-0.05 EUR")
+
+
+class TestMoneyContext:
+    def setup_method(self):
+        DefaultCurrency.set(XXX)
+        Money.parser.set_default(parsers.BaseParser())
+
+    def test_money_context_overrides_within_block(self):
+        with money_context(rounding=decimal.ROUND_HALF_UP, default_currency="EUR") as context:
+            assert context.rounding == decimal.ROUND_HALF_UP and context.default_currency.code == "EUR"
+            assert str(Money("1.005")) == "1.01 EUR"
+            assert Money.rounding.get() == decimal.ROUND_HALF_UP and DefaultCurrency.get().code == "EUR"
+            with money_context(default_currency="USD"):
+                # Other settings are inherited from the enclosing block
+                assert str(Money("1.005")) == "1.01 USD"
+        assert str(Money("1.005")) == "1.00 XXX"
+        assert get_context().default_currency.code == "XXX"
+
+    def test_money_context_follows_global_defaults(self):
+        with money_context(default_currency="EUR"):
+            Money.rounding.set_default(decimal.ROUND_CEILING)
+            assert str(Money("1.001")) == "1.01 EUR"
+
+    def test_asyncio_tasks_are_isolated(self):
+        async def convert(rounding):
+            with money_context(rounding=rounding):
+                await asyncio.sleep(0)  # Let the other task run within its block
+                return str(Money("1.005", "USD"))
+
+        async def main():
+            return await asyncio.gather(convert(decimal.ROUND_UP), convert(decimal.ROUND_DOWN))
+
+        assert asyncio.run(main()) == ["1.01 USD", "1.00 USD"]
+
+    def test_context_propagated_to_executor(self):
+        with money_context(default_currency="EUR"):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                assert executor.submit(DefaultCurrency.get).result().code == "XXX"
+                assert executor.submit(bind_context(DefaultCurrency.get)).result().code == "EUR"
+            with ContextThreadPoolExecutor(max_workers=2) as executor:
+                assert list(executor.map(lambda amount: str(Money(amount)), [1, 2])) == ["1.00 EUR", "2.00 EUR"]
+
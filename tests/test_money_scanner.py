@@ -0,0 +1,61 @@
+import io
+
+from decimal import Decimal
+
+from simple_money_lib import Currency
+from simple_money_lib.parsers import ComplexMoneyParser, MoneyScanner, find_money, iter_money
+
+
+def test_find_money():
+    text = "Invoice total: USD 1,250.00, paid €500 on 12.03., fee 12,50 kr; refund -5 GBP and 1.234,56 € (ref 4711)"
+    found = [(match.text, match.amount, match.currency.code) for match in find_money(text)]
+    assert found == [
+        ("USD 1,250.00", Decimal("1250.00"), "USD"),
+        ("€500", Decimal("500"), "EUR"),
+        ("12,50 kr", Decimal("12.50"), "SEK"),
+        ("-5 GBP", Decimal("-5"), "GBP"),
+        ("1.234,56 €", Decimal("1234.56"), "EUR"),
+    ]
+    for match in find_money(text):
+        assert text[match.start:match.end] == match.text
+
+
+def test_find_money_ignores_partial_words_and_numbers():
+    assert find_money("ALLOW 5 items, USDT 5, 5 EURO, version 1.2.3 USD") == []
+    assert find_money("") == []
+    # Invalid groups of thousands are skipped, a shorter mention inside them is found
+    assert [match.text for match in find_money("1,23,4 USD and 1,250.001.234USD 7")] == ["USD 7"]
+
+
+def test_find_money_like_complex_parser():
+    parser = ComplexMoneyParser()
+    for text, mention in [("Paid USD ١٢٣ today", "USD ١٢٣"), ("Paid 1,00,000 INR today", "1,00,000 INR"),
+                          ("fee ٤٥.٥٠ EUR", "٤٥.٥٠ EUR"), ("₹12,34,567.50 due", "₹12,34,567.50")]:
+        [match] = find_money(text)
+        assert match.text == mention
+        assert (match.amount, match.currency.code) == parser.parse(mention)
+
+
+def test_ambiguous_aliases():
+    assert [match.currency.code for match in find_money("$5 and 5 kr")] == ["USD", "SEK"]
+    assert [match.currency.code for match in MoneyScanner(allow_ambiguous=False).find("$5 and 5 kr and 5 €")] == ["EUR"]
+
+
+def test_registry_changes():
+    registry = Currency.new_registry()
+    scanner = MoneyScanner(registry=registry)
+    assert scanner.find("paid 5 GLD") == []
+    registry.register_alias("GLD", "XAU")
+    assert [(match.amount, match.currency.code) for match in scanner.find("paid 5 GLD")] == [(Decimal("5"), "XAU")]
+
+
+def test_iter_money_chunks():
+    text = "".join(f"line {i}: USD {i},250.50 and {i}.5 € and ALLOW {i}\n" for i in range(1, 500))
+    expected = find_money(text)
+    assert len(expected) == 998
+    for chunk_size in (1, 7, 100, 1 << 20):
+        assert list(iter_money(io.StringIO(text), chunk_size)) == expected
+
+    scanner = MoneyScanner()
+    scanner.margin = 30
+    assert list(scanner.iter_stream(io.StringIO(text), 64)) == expected
@@ -0,0 +1,52 @@
+import pytest
+
+from decimal import Decimal
+
+from simple_money_lib import Money
+from simple_money_lib.parsers import BaseParser, CachedParser, ComplexMoneyParser, ParserPipeline
+
+
+def test_fallback():
+    parser = ParserPipeline(BaseParser(), ComplexMoneyParser())
+    test_cases = [
+        ("12.34 USD", (Decimal("12.34"), "USD")),
+        ("1.234,56 €", (Decimal("1234.56"), "EUR")),
+        ("EUR 5", (Decimal("5"), "EUR")),
+        ("(1,234.56) USD", (Decimal("-1234.56"), "USD")),
+    ]
+    for test_input, expected_output in test_cases:
+        assert parser.parse(test_input) == expected_output, f"Failed on '{test_input}'"
+
+    with pytest.raises(ValueError, match="Unknown currency"):  # The error of the last stage
+        parser.parse("5 XYZ")
+    with pytest.raises(ValueError):
+        ParserPipeline()
+
+
+def test_stats():
+    parser = ParserPipeline(BaseParser(), ComplexMoneyParser())
+    for money_string in ["12.34 USD", "1.234,56 €", "EUR 5", "n/a"]:
+        try:
+            parser.parse(money_string)
+        except ValueError:
+            pass
+    assert [stats[:4] for stats in parser.stats()] == [("BaseParser", 4, 2, 2), ("ComplexMoneyParser", 2, 1, 1)]
+    assert [stats.seconds for stats in parser.stats()] == [None, None]
+
+    parser.reset_stats()
+    parser.timed = True
+    parser.parse("1.234,56 €")
+    stats = parser.stats()
+    assert [stage.calls for stage in stats] == [1, 1]
+    assert all(stage.seconds > 0 for stage in stats)
+
+
+def test_with_money():
+    parser = CachedParser(ParserPipeline(BaseParser(), ComplexMoneyParser()))
+    Money.parser.set(parser)
+    try:
+        assert Money("12.34 USD") == Money("12.34", "USD")
+        assert Money("1.234,56 €") == Money("1234.56", "EUR")
+    finally:
+        Money.parser.reset()
+    assert ParserPipeline(BaseParser(), ComplexMoneyParser()).parse_minor_units("1.234,56 €")[0] == 123456
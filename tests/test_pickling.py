@@ -0,0 +1,80 @@
+import pytest
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+
+from simple_money_lib import Money, Currency
+from simple_money_lib.utils.money_batch import MoneyBatch
+
+
+def _roundtrip(obj):
+    return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+def test_currency_is_reinterned():
+    usd = Currency("USD")
+    assert _roundtrip(usd) is usd
+    assert b"__dict__" not in pickle.dumps(usd) and b"United States" not in pickle.dumps(usd)
+
+def test_withdrawn_currency_is_reinterned():
+    dem = Currency.as_of("DEM", "1995-01-01")
+    assert _roundtrip(dem) is dem
+
+def test_withdrawn_currency_without_start_date():
+    ats = Currency.as_of("ATS", "1990-01-01")
+    assert ats._validity.valid_from is None
+    assert _roundtrip(ats) is ats
+    money = _roundtrip(Money(Decimal("12.34"), ats))
+    assert money.currency is ats and money.amount == Decimal("12.34")
+    assert list(_roundtrip(MoneyBatch([Money(1, ats)]))) == [Money(1, ats)]
+
+def test_registry_currency_uses_active_registry():
+    tenant = Currency.new_registry()
+    points = tenant.register("PTS1", numeric=None, sub_unit=0, name="Points")
+    Money.registry.set(tenant)
+    try:
+        assert _roundtrip(points) is points
+        assert _roundtrip(tenant("EUR")) is Currency("EUR")
+    finally:
+        Money.registry.reset()
+
+def test_money_roundtrip():
+    for money in (Money("12.34 USD"), Money("-0.05 EUR"), Money("1000 JPY"), Money("0 BHD")):
+        restored = _roundtrip(money)
+        assert restored == money and restored.currency is money.currency
+        assert str(restored) == str(money)
+    assert len(pickle.dumps([Money("12.34 USD")] * 2)) < len(pickle.dumps(Money("12.34 USD"))) + 20
+
+def test_money_batch():
+    moneys = [Money("12.34 USD"), Money("-0.05 EUR"), Money("1000 JPY"), Money("1 USD"),
+              Money(Decimal("123456789012345678901.25"), "USD")]
+    batch = MoneyBatch(moneys)
+    assert len(batch) == 5 and batch.currencies == (Currency("USD"), Currency("EUR"), Currency("JPY"))
+    assert list(batch) == moneys and batch[-1] == moneys[-1] and batch[1] == moneys[1]
+    assert list(batch[1:3]) == moneys[1:3]
+    restored = _roundtrip(batch)
+    assert list(restored) == moneys and restored[2].currency is Currency("JPY")
+    assert list(_roundtrip(MoneyBatch())) == []
+    with pytest.raises(IndexError):
+        batch[5]
+
+def _total(batch):
+    return sum(batch)
+
+def test_money_batch_in_process_pool():
+    batch = MoneyBatch(Money.from_minor_units(units, "EUR") for units in range(1000))
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(_total, batch).result() == Money("4995 EUR")
+
+def test_parsers_roundtrip():
+    from simple_money_lib.parsers import (BaseParser, SimpleParserWithSubstitutions, ComplexMoneyParser,
+                                          LearningParser, CachedParser, ParserPipeline)
+    parsers = [
+        (BaseParser(), "12.34 USD"),
+        (SimpleParserWithSubstitutions({"€": "EUR", ",": ""}), "1,250.50€"),
+        (LearningParser(sample_size=1), "1.234,56 €"),
+        (CachedParser(ParserPipeline(BaseParser(), ComplexMoneyParser())), "1.234,56 €"),
+    ]
+    for parser, money_string in parsers:
+        expected = parser.parse(money_string)  # Tables are built and not pickled
+        assert _roundtrip(parser).parse(money_string) == expected
@@ -0,0 +1,55 @@
+import pytest
+
+import os
+
+import simple_money_lib
+from simple_money_lib import Currency, Money
+from simple_money_lib.parsers import CachedParser, LearningParser, SimpleParserWithAliases
+
+
+def test_preload_builds_indexes_and_parser_tables():
+    tenant = Currency.new_registry()
+    parser = SimpleParserWithAliases(registry=tenant)
+    Money.parser.set(parser)
+    try:
+        simple_money_lib.preload(registry=tenant)
+    finally:
+        Money.parser.reset()
+    assert not tenant.is_frozen()
+    assert tenant._numeric_index is not None and tenant._alias_trie is not None
+    assert "USD" in tenant._registry and "JPY" in tenant._registry
+    assert parser._matcher_table[0] is tenant
+    assert parser.parse("€1.5") == parser.parse("EUR 1.5")
+
+def test_preload_freeze():
+    tenant = Currency.new_registry()
+    simple_money_lib.preload(freeze=True, registry=tenant)
+    assert tenant.is_frozen() and not Currency.is_frozen()
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_locks_reinitialized_after_fork():
+    # A lock held in the parent at the time of the fork must not block the child
+    with Currency._lock:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                status = 0 if Currency("usd").code == "USD" and Money("1 EUR").currency.code == "EUR" else 1
+            except BaseException:
+                status = 1
+            os._exit(status)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_parser_locks_reinitialized_after_fork():
+    cached, learning = CachedParser(SimpleParserWithAliases()), LearningParser(sample_size=1)
+    with cached._lock, learning._lock:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                status = 0 if cached.parse("€5")[1] == "EUR" and learning.parse("5 EUR")[1] == "EUR" else 1
+            except BaseException:
+                status = 1
+            os._exit(status)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
@@ -0,0 +1,71 @@
+import pytest
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from simple_money_lib import Money, Currency
+from simple_money_lib.exceptions import CurrencyMismatch
+from simple_money_lib.utils.money_batch import MoneyBatch
+from simple_money_lib.utils.shared_column import SharedMoneyColumn
+
+
+def test_create_and_read():
+    moneys = [Money("12.34 USD"), Money("-0.05 EUR"), Money("1000 JPY"), Money("1 USD")]
+    with SharedMoneyColumn.create(moneys) as column:
+        assert len(column) == 4 and list(column) == moneys
+        assert column[2].currency is Currency("JPY") and column[-1] == Money("1 USD")
+        assert column.currencies == (Currency("USD"), Currency("EUR"), Currency("JPY"))
+        assert list(column.minor_units) == [1234, -5, 1000, 100]
+        assert column.totals() == {Currency("USD"): Money("13.34 USD"), Currency("EUR"): Money("-0.05 EUR"),
+                                   Currency("JPY"): Money("1000 JPY")}
+        assert column.total(1, 2) == Money("-0.05 EUR") and column.total(4) == 0
+        with pytest.raises(CurrencyMismatch):
+            column.total()
+
+        attached = SharedMoneyColumn.attach(column.name)
+        with attached:
+            assert attached[0] == Money("12.34 USD")
+            column.minor_units[0] = 1  # Writes are visible to all processes
+            assert attached[0] == Money("0.01 USD")
+
+def test_create_from_batch_and_empty():
+    with SharedMoneyColumn.create(MoneyBatch([Money("1 EUR")] * 3)) as column:
+        assert column.total() == Money("3 EUR")
+    with SharedMoneyColumn.create([]) as column:
+        assert len(column) == 0 and column.totals() == {}
+    with pytest.raises(ValueError):
+        SharedMoneyColumn.create([Money("123456789012345678901 USD")])
+
+def test_withdrawn_currencies():
+    dem, ats = Currency.as_of("DEM", "1995-01-01"), Currency.as_of("ATS", "1990-01-01")  # ATS has no start date
+    moneys = [Money(10, dem), Money(5, ats), Money(1, "EUR")]
+    with SharedMoneyColumn.create(moneys) as column:
+        with SharedMoneyColumn.attach(column.name) as attached:
+            assert attached.currencies == (dem, ats, Currency("EUR"))
+            assert list(attached) == moneys
+
+def test_memory_released():
+    column = SharedMoneyColumn.create([Money("1 EUR")])
+    name = column.name
+    with column:
+        pass
+    column.close()  # Idempotent
+    with pytest.raises(FileNotFoundError):
+        SharedMoneyColumn.attach(name)
+
+def _partial_total(column, start, stop):
+    with column:
+        return column.total(start, stop)
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_workers_attach(start_method):
+    if start_method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{start_method} is not available")
+    moneys = [Money.from_minor_units(units, "EUR") for units in range(10_000)]
+    with SharedMoneyColumn.create(moneys) as column:
+        context = multiprocessing.get_context(start_method)
+        with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+            starts = range(0, len(column), 2500)
+            totals = list(executor.map(_partial_total, [column] * 4, starts, [start + 2500 for start in starts]))
+    assert all(total.currency is Currency("EUR") for total in totals)
+    assert sum(totals) == Money.from_minor_units(sum(range(10_000)), "EUR")
@@ -1,9 +1,13 @@
 import pytest
 from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
 
 from decimal import Decimal
-from simple_money_lib import Currency
-from simple_money_lib.parsers import BaseParser, SimpleParserWithSubstitutions
+import decimal
+from simple_money_lib import Currency, Money
+from simple_money_lib.parsers import (BaseParser, SimpleParserWithSubstitutions, SimpleParserWithAliases, CachedParser,
+                                      ComplexMoneyParser)
+from simple_money_lib.utils.context import money_context
 
 
 # Fixture to initialize the MoneyParserBase instance
@@ -191,4 +195,194 @@ def test_substitution_ending_with_digit():
 
     for test_input, expected_output in test_cases:
         result = parser.parse(test_input)
-        assert result == expected_output, f"Failed on '{test_input}'"
\ No newline at end of file
+        assert result == expected_output, f"Failed on '{test_input}'"
+
+def test_aliases():
+    parser = SimpleParserWithAliases()
+
+    test_cases = [
+        ("€567.89", (Decimal("567.89"), "EUR")),
+        ("567.89 €", (Decimal("567.89"), "EUR")),
+        ("US$ 10", (Decimal("10"), "USD")),
+        ("$10", (Decimal("10"), "USD")),  # Ambiguous, resolved to the default currency
+        ("1250 KR", (Decimal("1250"), "SEK")),
+        ("100 rur", (Decimal("100"), "RUB")),
+        ("21.34 USD", (Decimal("21.34"), "USD")),  # Codes still work
+        ("123.45", (Decimal("123.45"), None)),
+    ]
+
+    for test_input, expected_output in test_cases:
+        result = parser.parse(test_input)
+        assert result == expected_output, f"Failed on '{test_input}'"
+
+def test_aliases_invalid():
+    parser = SimpleParserWithAliases(allow_ambiguous=False)
+
+    with pytest.raises(ValueError, match="Ambiguous currency alias: '\\$'"):
+        parser.parse("$10")
+    with pytest.raises(ValueError):
+        parser.parse("€1,250.50")
+    with pytest.raises(ValueError):
+        parser.parse("€")
+    assert parser.parse("10 €") == (Decimal("10"), "EUR")
+
+def test_match_currency_returns_currency(parser):
+    assert parser.match_currency("12.34 usd") is Currency("USD")
+    assert parser.match_currency(" EUR 1") is Currency("EUR")
+    assert parser.match_currency("12.34") is None
+
+def test_matcher_rebuilt_on_registration():
+    tenant = Currency.new_registry()
+    parser = BaseParser(registry=tenant)
+    with pytest.raises(ValueError):
+        parser.parse("5 QQQ_2")
+    matcher = parser._matcher()
+    assert parser._matcher() is matcher  # Reused while the registry is unchanged
+    tenant.register(code="QQQ_2", numeric=None, sub_unit=2, name="Test currency")
+    assert parser.match_currency("5 QQQ_2") is tenant("QQQ_2")
+    assert parser.parse("5 QQQ_2") == (Decimal("5"), "QQQ_2")
+    assert parser.parse("QQQ_2 5") == (Decimal("5"), "QQQ_2")
+    with pytest.raises(ValueError):
+        parser.parse("QQQ_25")
+
+def test_money_with_parser_bound_to_registry():
+    tenant = Currency.new_registry()
+    tenant.register(code="QQQ_3", numeric=None, sub_unit=2, name="Test currency")
+    Money.parser.set(BaseParser(registry=tenant))
+    try:
+        money = Money("5 QQQ_3")  # Money.registry is still the global one
+    finally:
+        Money.parser.reset()
+    assert money.currency is tenant("QQQ_3")
+    assert money.amount == Decimal("5.00")
+
+def test_subclass_without_base_init():
+    class LegacyParser(BaseParser):
+        def __init__(self, prefix):
+            self.prefix = prefix
+
+        def parse(self, money_string):
+            return super().parse(money_string.removeprefix(self.prefix))
+
+    parser = LegacyParser("amount: ")
+    assert parser.parse("amount: 12.34 USD") == (Decimal("12.34"), "USD")
+    assert parser.match_currency("EUR 5") is Currency("EUR")
+
+def test_cached_parser():
+    parser = CachedParser(SimpleParserWithSubstitutions({"€": "EUR"}), maxsize=2)
+    assert parser.parse("9.99 USD") == (Decimal("9.99"), "USD")
+    assert parser.parse("9.99 USD") == (Decimal("9.99"), "USD")
+    assert parser.parse("€5") == (Decimal("5"), "EUR")
+    assert parser.cache_info() == (1, 2, 2, 2)
+    parser.parse("1 GBP")  # Drops the least recently used "9.99 USD"
+    parser.parse("9.99 USD")
+    assert parser.cache_info().misses == 4
+    with pytest.raises(ValueError):
+        parser.parse("1,5 EUR")
+    # A configuration change invalidates results
+    parser.parser.substitutions = {"€": "GBP"}
+    assert parser.parse("€5") == (Decimal("5"), "GBP")
+    parser.cache_clear()
+    assert parser.cache_info() == (0, 0, 2, 0)
+    assert parser.match_currency("1 EUR") is Currency("EUR")
+
+def test_cached_parser_invalidated_on_registration():
+    tenant = Currency.new_registry()
+    parser = CachedParser(BaseParser(registry=tenant))
+    with pytest.raises(ValueError):
+        parser.parse("5 QQR")
+    assert parser.parse("5 EUR") == parser.parse("5 EUR")
+    tenant.register(code="QQR", numeric=None, sub_unit=2, name="Test currency")
+    assert parser.parse("5 QQR") == (Decimal("5"), "QQR")
+    assert parser.parse("5 EUR") == (Decimal("5"), "EUR")
+    assert parser.cache_info().hits == 1
+
+def test_cached_parser_bulk_methods():
+    parser = CachedParser(ComplexMoneyParser())
+    assert parser.parse_minor_units("1.234,56 €") == (123456, Currency("EUR"))
+    assert parser.parse_minor_units("1.234,56 €") == (123456, Currency("EUR"))
+    assert parser.is_valid("1.234,56 €") and not parser.is_valid("n/a")
+    assert [result.amount for result in parser.parse_many(["1.234,56 €", "n/a"])] == [Decimal("1234.56"), None]
+    assert parser.cache_info().hits == 3
+
+def test_cached_parser_threads():
+    parser = CachedParser(BaseParser(), maxsize=8)
+    strings = [f"{i % 10}.99 USD" for i in range(2000)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(parser.parse, strings))
+    assert results == [(Decimal(s[:4]), "USD") for s in strings]
+    info = parser.cache_info()
+    assert info.hits + info.misses == 2000 and info.currsize == 8
+
+def test_substitutions_single_pass():
+    # New values are not substituted again, and longer old values take precedence
+    parser = SimpleParserWithSubstitutions({"€": "EUR", "E": "X", "kr": "SEK", "kr.": "SEK", " ": ""})
+    assert parser.parse("€1 000") == (Decimal("1000"), "EUR")
+    assert parser.parse("kr.1 000") == (Decimal("1000"), "SEK")
+    # Single-character substitutions only
+    parser = SimpleParserWithSubstitutions({"€": "EUR", ",": ".", "'": ""})
+    assert parser.parse("1'234,5€") == (Decimal("1234.5"), "EUR")
+    # Compiled again when assigned
+    parser.substitutions = {"$": "USD"}
+    assert parser.parse("$5") == (Decimal("5"), "USD")
+    with pytest.raises(ValueError):
+        parser.parse("5€")
+
+@pytest.mark.parametrize("rounding", [decimal.ROUND_DOWN, decimal.ROUND_UP, decimal.ROUND_CEILING, decimal.ROUND_FLOOR,
+                                      decimal.ROUND_HALF_UP, decimal.ROUND_HALF_DOWN, decimal.ROUND_HALF_EVEN,
+                                      decimal.ROUND_05UP])
+def test_parse_minor_units_rounding(rounding):
+    parser = BaseParser()
+    complex_parser = ComplexMoneyParser(decimal_separator=".")  # "12.345" is not read as thousands
+    strings = ["12.34 USD", "JPY 1000", "12.345 USD", "-12.345 USD", "12.3450001 USD", "12.355 USD", "-12.355 USD",
+               "12.305 EUR", "-0.001 EUR", "1.5 JPY", "2.5 JPY", "-2.5001 JPY", "0.0000 BHD", "1.23456 BHD", "7.999"]
+    with money_context(rounding=rounding):
+        for money_string in strings:
+            money = Money(money_string)
+            assert parser.parse_minor_units(money_string) == (money.minor_units, money.currency), money_string
+            assert complex_parser.parse_minor_units(money_string) == (money.minor_units, money.currency)
+
+@pytest.mark.parametrize("rounding", [decimal.ROUND_HALF_UP, decimal.ROUND_HALF_EVEN, decimal.ROUND_UP])
+def test_parse_minor_units_non_ascii_digits(rounding):
+    parser = BaseParser()
+    with money_context(rounding=rounding):
+        for money_string in ["1.23٠١ USD", "١٢.٣٥٥ USD", "-١.٢٣٥ EUR", "EUR ١٢٣", "1.5٠٠ JPY"]:
+            money = Money(money_string)
+            assert parser.parse_minor_units(money_string) == (money.minor_units, money.currency), money_string
+    assert parser.parse_minor_units("1.23٠ USD", strict=True) == (Money("1.23٠ USD").minor_units, Currency("USD"))
+    with pytest.raises(ValueError, match="more decimals than USD allows"):
+        parser.parse_minor_units("1.23٥ USD", strict=True)
+
+def test_parse_minor_units_strict():
+    parser = BaseParser()
+    assert parser.parse_minor_units("12.340000 USD", strict=True) == (1234, Currency("USD"))
+    assert parser.parse_minor_units("-5 JPY", strict=True) == (-5, Currency("JPY"))
+    with pytest.raises(ValueError, match="more decimals than USD allows"):
+        parser.parse_minor_units("12.345 USD", strict=True)
+    with pytest.raises(ValueError, match="more decimals than JPY allows"):
+        ComplexMoneyParser().parse_minor_units("1.234,5 JPY", strict=True)
+    with pytest.raises(ValueError):
+        parser.parse_minor_units("12,34 USD")
+
+def test_parse_many():
+    strings = ["12.34 USD", "EUR 5", "7", "", "12,34 USD", "5 XYZ", "1.2.3", None, "BTC_8100"]
+    results = list(BaseParser().parse_many(strings))
+    assert [result.position for result in results] == list(range(len(strings)))
+    assert [result.ok for result in results] == [True, True, True] + [False] * 6
+    assert results[0][2:4] == (Decimal("12.34"), Currency("USD"))
+    assert results[2].currency is Money.default_currency.get()
+    assert [result.error for result in results[3:]] == ["empty", "invalid_amount", "unknown_currency",
+                                                        "invalid_amount", "not_a_string", "invalid_amount"]
+    assert results[0].message is None
+    assert results[4].message == "Invalid monetary amount: '12,34 USD'"
+
+    # Parsers with their own format report the exception of parse()
+    results = list(ComplexMoneyParser().parse_many(["12,34 USD", "5 XYZ"]))
+    assert results[0].ok and results[0].amount == Decimal("12.34") and results[0].currency is Currency("USD")
+    assert results[1].error == "invalid" and "XYZ" in results[1].message
+
+def test_is_valid():
+    parser = BaseParser()
+    assert parser.is_valid("12.34 USD") and parser.is_valid(" 5 ") and parser.is_valid("EUR -1")
+    assert not any(parser.is_valid(s) for s in ["", "12,34 USD", "5 XYZ", "USD", None])
+    assert ComplexMoneyParser().is_valid("1.234,56 €") and not ComplexMoneyParser().is_valid("1,23,4")